@@ -0,0 +1 @@
+"""Benchmarks for the FORCI operators on synthetic scenes, see benchmarks/run.py."""
@@ -0,0 +1,854 @@
+"""Minimal in-memory stand-in for the parts of bpy the FORCI operators use.
+
+It is only meant for benchmarking the pure-Python cost of the operators without a
+Blender build: datablocks, node trees, links, user counts and the handful of bpy.data,
+bpy.path and bpy.app entry points the add-ons touch. Nothing is drawn or evaluated.
+
+   from benchmarks import fake_bpy
+   fake_bpy.install()
+   import bpy   # the fake module
+"""
+
+import itertools
+import os
+import sys
+import types
+
+from forci_stuff import forci_lazy
+
+# Only needed by meshes, keeps the add-on startup measurements free of NumPy
+np = forci_lazy.lazy_import("numpy")
+
+# --- Properties ---------------------------------------------------------------
+
+class _Property:
+   """bpy.props.* result: a default value, also usable as a class attribute descriptor"""
+
+   def __init__(self, kind, default=None, type=None, **options):
+      self.kind = kind
+      self.default = default
+      self.type = type
+      self.options = options
+
+   def make_default(self):
+      if self.kind == 'POINTER':
+         # A pointer to a datablock starts empty, a PropertyGroup is created with its owner
+         if self.type is None or issubclass(self.type, ID):
+            return None
+         return self.type()
+      if self.default is not None:
+         return self.default
+      if self.kind == 'ENUM':
+         items = self.options.get('items')
+         return items[0][0] if isinstance(items, list) and items else ''
+      return {'STRING': '', 'BOOL': False, 'INT': 0, 'FLOAT': 0.0}.get(self.kind)
+
+   def __get__(self, instance, owner):
+      if instance is None:
+         return self
+      values = instance.__dict__.setdefault('_property_values', {})
+      if id(self) not in values:
+         values[id(self)] = self.make_default()
+      return values[id(self)]
+
+   def __set__(self, instance, value):
+      instance.__dict__.setdefault('_property_values', {})[id(self)] = value
+
+def _property(kind):
+   def factory(*args, **options):
+      return _Property(kind, **options)
+   return factory
+
+props = types.ModuleType("bpy.props")
+props.StringProperty = _property('STRING')
+props.BoolProperty = _property('BOOL')
+props.IntProperty = _property('INT')
+props.FloatProperty = _property('FLOAT')
+props.EnumProperty = _property('ENUM')
+props.PointerProperty = _property('POINTER')
+props.CollectionProperty = _property('COLLECTION')
+props.FloatVectorProperty = _property('FLOAT')
+
+class _Struct:
+   """Base of the fake bpy.types classes: annotated properties get their defaults"""
+
+   def __init__(self, **values):
+      for cls in reversed(type(self).__mro__):
+         for name, annotation in getattr(cls, '__annotations__', {}).items():
+            if isinstance(annotation, _Property) and name not in self.__dict__:
+               self.__dict__[name] = annotation.make_default()
+      for name, value in values.items():
+         setattr(self, name, value)
+
+class _OperatorProperties:
+   """operator.properties, only knows which properties the caller passed"""
+
+   def __init__(self, names):
+      self.names = set(names)
+
+   def is_property_set(self, name):
+      return name in self.names
+
+class Operator(_Struct):
+   bl_options = set()
+
+   def __init__(self, **values):
+      self.messages = []
+      self.properties = _OperatorProperties(values)
+      super().__init__(**values)
+
+   def report(self, level, message):
+      self.messages.append((next(iter(level)), message))
+
+class Panel(_Struct):
+   pass
+
+class PropertyGroup(_Struct):
+   pass
+
+class AddonPreferences(_Struct):
+   pass
+
+# --- Datablocks ---------------------------------------------------------------
+
+class ID(_Struct):
+   _session_uids = itertools.count(1)
+
+   def __init__(self, name, collection=None):
+      super().__init__()
+      self.session_uid = next(ID._session_uids)
+      self._name = name
+      self._collection = collection
+      self.users = 0
+      self.use_fake_user = False
+      self.library = None
+
+   @property
+   def name(self):
+      return self._name
+
+   @name.setter
+   def name(self, value):
+      if self._collection is not None:
+         self._collection._rename(self, value)
+      else:
+         self._name = value
+
+   @property
+   def original(self):
+      return self
+
+   def as_pointer(self):
+      return id(self)
+
+   def user_remap(self, new_id):
+      data.remap(self, new_id)
+
+   def __repr__(self):
+      return f"<{type(self).__name__} '{self._name}'>"
+
+def _add_user(datablock, amount=1):
+   if datablock is not None:
+      datablock.users += amount
+
+class Image(ID):
+   def __init__(self, name, collection=None):
+      super().__init__(name, collection)
+      self.filepath = ""
+      self.source = 'FILE'
+      self.has_data = False
+      self.size = (0, 0)
+      self.channels = 4
+      self.is_float = False
+      self.alpha_mode = 'STRAIGHT'
+
+class Socket:
+   def __init__(self, node, name, is_output):
+      self.node = node
+      self.name = name
+      self.identifier = name
+      self.is_output = is_output
+      self.links = []
+      self.type = 'VALUE'
+      self.default_value = 0.0
+      self.enabled = True
+
+   @property
+   def is_linked(self):
+      return bool(self.links)
+
+class Sockets(list):
+   def __init__(self, node, names, is_output):
+      super().__init__(Socket(node, name, is_output) for name in names)
+      self.node = node
+      self.is_output = is_output
+
+   def __getitem__(self, key):
+      if isinstance(key, str):
+         for socket in self:
+            if socket.name == key:
+               return socket
+         raise KeyError(key)
+      return super().__getitem__(key)
+
+   def get(self, key, default=None):
+      try:
+         return self[key]
+      except KeyError:
+         return default
+
+   def __contains__(self, key):
+      if isinstance(key, str):
+         return self.get(key) is not None
+      return super().__contains__(key)
+
+   def new(self, socket_type, name):
+      socket = Socket(self.node, name, self.is_output)
+      self.append(socket)
+      return socket
+
+PRINCIPLED_INPUTS = ("Base Color", "Metallic", "Roughness", "IOR", "Alpha", "Normal", "Specular IOR Level",
+                     "Coat Weight", "Sheen Weight", "Emission Color", "Emission Strength")
+
+# node bl_idname -> (type, default name, inputs, outputs)
+NODE_TYPES = {
+   'ShaderNodeBsdfPrincipled': ('BSDF_PRINCIPLED', "Principled BSDF", PRINCIPLED_INPUTS, ("BSDF",)),
+   'ShaderNodeOutputMaterial': ('OUTPUT_MATERIAL', "Material Output", ("Surface", "Volume", "Displacement"), ()),
+   'ShaderNodeTexImage': ('TEX_IMAGE', "Image Texture", ("Vector",), ("Color", "Alpha")),
+   'ShaderNodeGroup': ('GROUP', "Group", (), ()),
+   'ShaderNodeMix': ('MIX', "Mix", ("Factor", "A", "B"), ("Result",)),
+}
+
+class Node:
+   def __init__(self, tree, bl_idname, name):
+      node_type, default_name, inputs, outputs = NODE_TYPES[bl_idname]
+      self.tree = tree
+      self.bl_idname = bl_idname
+      self.type = node_type
+      self._name = name
+      self.label = ""
+      self.location = (0.0, 0.0)
+      self.inputs = Sockets(self, inputs, False)
+      self.outputs = Sockets(self, outputs, True)
+      self._image = None
+      self._node_tree = None
+
+   @property
+   def name(self):
+      return self._name
+
+   @name.setter
+   def name(self, value):
+      by_name = self.tree.nodes.by_name
+      if by_name.get(self._name) is self:
+         del by_name[self._name]
+      self._name = _unique_name(value, by_name)
+      by_name[self._name] = self
+
+   @property
+   def image(self):
+      return self._image
+
+   @image.setter
+   def image(self, value):
+      _add_user(self._image, -1)
+      _add_user(value)
+      self._image = value
+
+   @property
+   def node_tree(self):
+      return self._node_tree
+
+   @node_tree.setter
+   def node_tree(self, group):
+      _add_user(self._node_tree, -1)
+      _add_user(group)
+      self._node_tree = group
+      # A group node exposes the inputs and outputs of its tree
+      self.inputs = Sockets(self, [socket.name for socket in group.inputs] if group else (), False)
+      self.outputs = Sockets(self, [socket.name for socket in group.outputs] if group else (), True)
+
+class Nodes:
+   def __init__(self, tree):
+      self.tree = tree
+      self.by_name = {}
+
+   def __iter__(self):
+      return iter(list(self.by_name.values()))
+
+   def __len__(self):
+      return len(self.by_name)
+
+   def __contains__(self, name):
+      return name in self.by_name
+
+   def __getitem__(self, key):
+      if isinstance(key, int):
+         return list(self.by_name.values())[key]
+      return self.by_name[key]
+
+   def get(self, name, default=None):
+      return self.by_name.get(name, default)
+
+   def new(self, type):
+      name = _unique_name(NODE_TYPES[type][1], self.by_name)
+      node = self.by_name[name] = Node(self.tree, type, name)
+      return node
+
+   def remove(self, node):
+      for socket in list(node.inputs) + list(node.outputs):
+         for link in list(socket.links):
+            self.tree.links.remove(link)
+      node.image = None
+      if node.node_tree is not None:
+         _add_user(node.node_tree, -1)
+      del self.by_name[node.name]
+
+class Link:
+   def __init__(self, from_socket, to_socket):
+      self.from_socket = from_socket
+      self.to_socket = to_socket
+      self.from_node = from_socket.node
+      self.to_node = to_socket.node
+      self.is_valid = True
+
+class Links(list):
+   def __init__(self, tree):
+      super().__init__()
+      self.tree = tree
+
+   def new(self, output, input):
+      for link in list(input.links):
+         self.remove(link)
+      link = Link(output, input)
+      output.links.append(link)
+      input.links.append(link)
+      self.append(link)
+      return link
+
+   def remove(self, link):
+      link.from_socket.links.remove(link)
+      link.to_socket.links.remove(link)
+      super().remove(link)
+
+class NodeTree(ID):
+   def __init__(self, name, collection=None):
+      super().__init__(name, collection)
+      self.nodes = Nodes(self)
+      self.links = Links(self)
+      self.inputs = Sockets(self, (), False)
+      self.outputs = Sockets(self, (), True)
+
+class Material(ID):
+   def __init__(self, name, collection=None):
+      super().__init__(name, collection)
+      self.node_tree = None
+      self.blend_method = 'OPAQUE'
+      self.shadow_method = 'OPAQUE'
+
+   @property
+   def use_nodes(self):
+      return self.node_tree is not None
+
+   @use_nodes.setter
+   def use_nodes(self, value):
+      if value and self.node_tree is None:
+         # Same default setup as Blender: Principled BSDF into the Material Output
+         self.node_tree = NodeTree("Shader Nodetree")
+         principled = self.node_tree.nodes.new('ShaderNodeBsdfPrincipled')
+         output = self.node_tree.nodes.new('ShaderNodeOutputMaterial')
+         self.node_tree.links.new(principled.outputs["BSDF"], output.inputs["Surface"])
+
+class MeshMaterials(list):
+   def __init__(self, mesh):
+      super().__init__()
+      self.mesh = mesh
+
+   def append(self, material):
+      _add_user(material)
+      super().append(material)
+
+   def __setitem__(self, index, material):
+      _add_user(self[index], -1)
+      _add_user(material)
+      super().__setitem__(index, material)
+
+   def clear(self):
+      for material in self:
+         _add_user(material, -1)
+      super().clear()
+
+class Polygons:
+   def __init__(self):
+      self.material_index = np.zeros(0, dtype=np.int32)
+
+   def __len__(self):
+      return len(self.material_index)
+
+   def foreach_get(self, attribute, array):
+      array[:] = getattr(self, attribute)
+
+   def foreach_set(self, attribute, array):
+      getattr(self, attribute)[:] = array
+
+class Mesh(ID):
+   def __init__(self, name, collection=None):
+      super().__init__(name, collection)
+      self.materials = MeshMaterials(self)
+      self.polygons = Polygons()
+      self.vertices = ()
+      self.edges = ()
+      self.loops = ()
+
+   def from_pydata(self, vertices, edges, faces):
+      self.vertices = list(vertices)
+      self.edges = list(edges)
+      self.loops = [index for face in faces for index in face]
+      self.polygons.material_index = np.zeros(len(faces), dtype=np.int32)
+
+   def update(self):
+      pass
+
+class MaterialSlot:
+   def __init__(self, obj, index):
+      self.obj = obj
+      self.index = index
+      self.link = 'DATA'
+
+   @property
+   def material(self):
+      return self.obj.data.materials[self.index]
+
+   @material.setter
+   def material(self, value):
+      self.obj.data.materials[self.index] = value
+
+class Object(ID):
+   def __init__(self, name, collection=None, object_data=None):
+      super().__init__(name, collection)
+      self._data = None
+      self.data = object_data
+      self.type = 'MESH' if isinstance(object_data, Mesh) else 'EMPTY'
+      self.mode = 'OBJECT'
+      self.parent = None
+      self.animation_data = None
+      self.selected = False
+      self.users_collection = []
+
+   @property
+   def data(self):
+      return self._data
+
+   @data.setter
+   def data(self, value):
+      _add_user(self._data, -1)
+      _add_user(value)
+      self._data = value
+
+   @property
+   def material_slots(self):
+      if self.type != 'MESH':
+         return []
+      return [MaterialSlot(self, index) for index in range(len(self._data.materials))]
+
+   def select_set(self, state):
+      self.selected = state
+
+   def select_get(self):
+      return self.selected
+
+   def update_from_editmode(self):
+      pass
+
+class Collection(ID):
+   def __init__(self, name, collection=None):
+      super().__init__(name, collection)
+      self.objects = CollectionObjects(self)
+      self.children = []
+
+class CollectionObjects(list):
+   def __init__(self, owner):
+      super().__init__()
+      self.owner = owner
+
+   def link(self, obj):
+      _add_user(obj)
+      obj.users_collection.append(self.owner)
+      self.append(obj)
+      scene.objects._add(obj)
+
+   def unlink(self, obj):
+      _add_user(obj, -1)
+      obj.users_collection.remove(self.owner)
+      self.remove(obj)
+      if not obj.users_collection:
+         scene.objects._discard(obj)
+
+class Text(ID):
+   def __init__(self, name, collection=None):
+      super().__init__(name, collection)
+      self.body = ""
+
+   def from_string(self, text):
+      self.body = text
+
+class Action(ID):
+   pass
+
+class Armature(ID):
+   pass
+
+def _unique_name(name, taken):
+   if name not in taken:
+      return name
+   number = 1
+   while f"{name}.{number:03d}" in taken:
+      number += 1
+   return f"{name}.{number:03d}"
+
+class BlendDataCollection:
+   """bpy.data.<collection>: ordered by insertion, unique names"""
+
+   def __init__(self, id_type):
+      self.id_type = id_type
+      self.by_name = {}
+
+   def __iter__(self):
+      return iter(list(self.by_name.values()))
+
+   def __len__(self):
+      return len(self.by_name)
+
+   def __contains__(self, key):
+      if isinstance(key, str):
+         return key in self.by_name
+      return self.by_name.get(key.name) is key
+
+   def __getitem__(self, key):
+      if isinstance(key, int):
+         return list(self.by_name.values())[key]
+      return self.by_name[key]
+
+   def get(self, name, default=None):
+      return self.by_name.get(name, default)
+
+   def keys(self):
+      return list(self.by_name)
+
+   def values(self):
+      return list(self.by_name.values())
+
+   def _rename(self, datablock, name):
+      if self.by_name.get(datablock._name) is datablock:
+         del self.by_name[datablock._name]
+      datablock._name = _unique_name(name, self.by_name)
+      self.by_name[datablock._name] = datablock
+
+   def _insert(self, datablock):
+      self._rename(datablock, datablock._name)
+      datablock._collection = self
+      return datablock
+
+   def new(self, name, *args):
+      if self.id_type is Object:
+         return self._insert(Object(name, object_data=args[0] if args else None))
+      return self._insert(self.id_type(name))
+
+   def remove(self, datablock, do_unlink=True):
+      data.batch_remove([datablock])
+
+class ImageCollection(BlendDataCollection):
+   def load(self, filepath, check_existing=False):
+      if check_existing:
+         for image in self.by_name.values():
+            if image.filepath == filepath:
+               return image
+      if not os.path.isfile(filepath):
+         raise RuntimeError(f"Error: Cannot read image file \"{filepath}\"")
+      image = self._insert(Image(os.path.basename(filepath)))
+      image.filepath = filepath
+      return image
+
+class BlendData:
+   def __init__(self):
+      self.filepath = ""
+      self.objects = BlendDataCollection(Object)
+      self.meshes = BlendDataCollection(Mesh)
+      self.materials = BlendDataCollection(Material)
+      self.images = ImageCollection(Image)
+      self.node_groups = BlendDataCollection(NodeTree)
+      self.collections = BlendDataCollection(Collection)
+      self.texts = BlendDataCollection(Text)
+      self.actions = BlendDataCollection(Action)
+      self.armatures = BlendDataCollection(Armature)
+
+   def all_collections(self):
+      return (self.objects, self.meshes, self.materials, self.images, self.node_groups,
+              self.collections, self.texts, self.actions, self.armatures)
+
+   def _trees(self):
+      for material in self.materials:
+         if material.node_tree is not None:
+            yield material.node_tree
+      yield from self.node_groups
+
+   def remap(self, old, new):
+      """ID.user_remap: point every user of old to new"""
+      if isinstance(old, Material):
+         for mesh in self.meshes:
+            for index, material in enumerate(mesh.materials):
+               if material is old:
+                  mesh.materials[index] = new
+      elif isinstance(old, Image):
+         for tree in self._trees():
+            for node in tree.nodes:
+               if node.image is old:
+                  node.image = new
+      elif isinstance(old, Mesh):
+         for obj in self.objects:
+            if obj.data is old:
+               obj.data = new
+      elif isinstance(old, NodeTree):
+         for tree in self._trees():
+            for node in tree.nodes:
+               if node.node_tree is old:
+                  node.node_tree = new
+
+   def batch_remove(self, ids):
+      for datablock in list(ids):
+         collection = datablock._collection
+         if collection is None or collection.by_name.get(datablock.name) is not datablock:
+            continue
+         del collection.by_name[datablock.name]
+         datablock._collection = None
+         # Release what the removed datablock was using
+         if isinstance(datablock, Object):
+            for owner in list(datablock.users_collection):
+               owner.objects.unlink(datablock)
+            scene.objects._discard(datablock)
+            datablock.data = None
+         elif isinstance(datablock, Mesh):
+            datablock.materials.clear()
+         elif isinstance(datablock, Material) and datablock.node_tree is not None:
+            for node in datablock.node_tree.nodes:
+               node.image = None
+               if node.node_tree is not None:
+                  node.node_tree = None
+         # Users of the removed datablock now point to nothing
+         if isinstance(datablock, (Material, Image, Mesh, NodeTree)) and datablock.users:
+            self.remap(datablock, None)
+
+data = BlendData()
+
+# --- Scene and context --------------------------------------------------------
+
+class SceneObjects:
+   def __init__(self):
+      self.by_name = {}
+      self.active = None
+
+   def __iter__(self):
+      return iter(list(self.by_name.values()))
+
+   def __len__(self):
+      return len(self.by_name)
+
+   def __contains__(self, obj):
+      return self.by_name.get(obj.name) is obj
+
+   def get(self, name, default=None):
+      obj = self.by_name.get(name)
+      # Stale entry if the object was renamed
+      return obj if obj is not None and obj.name == name else default
+
+   def _add(self, obj):
+      self.by_name[obj.name] = obj
+
+   def _discard(self, obj):
+      if self.by_name.get(obj.name) is obj:
+         del self.by_name[obj.name]
+      else:
+         for name, value in list(self.by_name.items()):
+            if value is obj:
+               del self.by_name[name]
+      if self.active is obj:
+         self.active = None
+
+class Scene(_Struct):
+   def __init__(self):
+      super().__init__()
+      self.name = "Scene"
+      self.objects = SceneObjects()
+      self.collection = Collection("Scene Collection")
+      self.frame_start = 1
+      self.frame_end = 250
+      self.frame_current = 1
+
+class ViewLayer(_Struct):
+   def __init__(self, scene):
+      super().__init__()
+      self.objects = scene.objects
+
+   def update(self):
+      pass
+
+class WindowManager(_Struct):
+   def progress_begin(self, minimum, maximum):
+      pass
+
+   def progress_update(self, value):
+      pass
+
+   def progress_end(self):
+      pass
+
+class Preferences(_Struct):
+   def __init__(self):
+      super().__init__()
+      self.addons = {}
+
+class Context:
+   def __init__(self):
+      self.scene = scene
+      self.view_layer = view_layer
+      self.window_manager = window_manager
+      self.preferences = Preferences()
+      self.mode = 'OBJECT'
+
+   @property
+   def selected_objects(self):
+      return [obj for obj in scene.objects if obj.selected]
+
+   @property
+   def active_object(self):
+      return view_layer.objects.active
+
+   @property
+   def object(self):
+      return view_layer.objects.active
+
+scene = Scene()
+view_layer = ViewLayer(scene)
+window_manager = WindowManager()
+context = Context()
+
+def reset():
+   """Empty bpy.data and the scene, as a fresh empty file would"""
+   global data
+   data = BlendData()
+   module.data = data
+   scene.objects = SceneObjects()
+   scene.collection = Collection("Scene Collection")
+   view_layer.objects = scene.objects
+   for callback in list(app.handlers.load_post):
+      callback(None)
+
+# --- bpy.app, bpy.path, bpy.utils ---------------------------------------------
+
+app = types.ModuleType("bpy.app")
+app.version = (4, 0, 0)
+app.version_string = "4.0.0 (fake-bpy)"
+app.binary_path = ""
+app.background = True
+
+handlers = types.ModuleType("bpy.app.handlers")
+for _name in ("depsgraph_update_post", "depsgraph_update_pre", "load_post", "load_pre", "save_pre",
+              "save_post", "undo_post", "redo_post", "frame_change_post"):
+   setattr(handlers, _name, [])
+handlers.persistent = lambda function: function
+app.handlers = handlers
+
+timers = types.ModuleType("bpy.app.timers")
+_timers = []
+timers.register = lambda function, first_interval=0, persistent=False: _timers.append(function)
+timers.unregister = lambda function: _timers.remove(function) if function in _timers else None
+timers.is_registered = lambda function: function in _timers
+app.timers = timers
+
+def run_timers():
+   """Call the registered timers until they all return None (finished)"""
+   while _timers:
+      for function in list(_timers):
+         if function() is None and function in _timers:
+            _timers.remove(function)
+
+path = types.ModuleType("bpy.path")
+
+def _abspath(filepath, start=None, library=None):
+   if filepath.startswith("//"):
+      base = start or os.path.dirname(data.filepath)
+      return os.path.join(base, filepath[2:])
+   return filepath
+
+path.abspath = _abspath
+path.basename = lambda filepath: os.path.basename(filepath[2:] if filepath.startswith("//") else filepath)
+path.ensure_ext = lambda filepath, ext, case_sensitive=False: filepath if filepath.lower().endswith(ext.lower()) else filepath + ext
+path.clean_name = lambda name, replace="_": "".join(c if c.isalnum() or c in "-." else replace for c in name)
+
+utils = types.ModuleType("bpy.utils")
+utils.register_class = lambda cls: None
+utils.unregister_class = lambda cls: None
+
+bpy_types = types.ModuleType("bpy.types")
+for _cls in (Operator, Panel, PropertyGroup, AddonPreferences, ID, Image, Material, Mesh, NodeTree, Object,
+             Collection, Text, Action, Armature, Scene, ViewLayer, WindowManager):
+   setattr(bpy_types, _cls.__name__, _cls)
+bpy_types.ShaderNodeTree = NodeTree
+bpy_types.Node = Node
+bpy_types.NodeSocket = Socket
+bpy_types.Context = Context
+
+class _Ops:
+   """bpy.ops stub: operators are called directly by the benchmarks, not through bpy.ops"""
+
+   def __getattr__(self, name):
+      return _OpsCategory(name)
+
+class _OpsCategory:
+   def __init__(self, category):
+      self.category = category
+
+   def __getattr__(self, name):
+      def call(*args, **kwargs):
+         if (self.category, name) == ('object', 'select_all'):
+            for obj in scene.objects:
+               obj.selected = kwargs.get('action') == 'SELECT'
+         return {'FINISHED'}
+      return call
+
+class Vector(tuple):
+   def __new__(cls, values=(0.0, 0.0, 0.0)):
+      return super().__new__(cls, values)
+
+   def __add__(self, other):
+      return Vector(a + b for a, b in zip(self, other))
+
+   def __sub__(self, other):
+      return Vector(a - b for a, b in zip(self, other))
+
+mathutils = types.ModuleType("mathutils")
+mathutils.Vector = Vector
+
+module = types.ModuleType("bpy")
+module.__doc__ = __doc__
+module.props = props
+module.types = bpy_types
+module.app = app
+module.path = path
+module.utils = utils
+module.ops = _Ops()
+module.data = data
+module.context = context
+
+def install():
+   """Register the fake as the bpy module (and its submodules) for the following imports"""
+   sys.modules["bpy"] = module
+   sys.modules["bpy.props"] = props
+   sys.modules["bpy.types"] = bpy_types
+   sys.modules["bpy.app"] = app
+   sys.modules["bpy.app.handlers"] = handlers
+   sys.modules["bpy.app.timers"] = timers
+   sys.modules["bpy.path"] = path
+   sys.modules["bpy.utils"] = utils
+   sys.modules.setdefault("mathutils", mathutils)
+   return module
@@ -0,0 +1,130 @@
+"""Run the FORCI operator benchmarks and write or compare a baseline.
+
+In Blender (every benchmark):
+   blender -b --factory-startup --python benchmarks/run.py -- --sizes small,medium --output results.json
+
+Pure-Python cost on the fake bpy shim (no Blender needed, create_rigged_armature is skipped):
+   python benchmarks/run.py --fake-bpy --compare benchmarks/baseline_fake_bpy.json
+
+Each benchmark runs --repeat times on a freshly generated scene; only the operator call is
+timed. --compare exits with code 1 when a median is more than --tolerance slower than the baseline.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPOSITORY not in sys.path:
+   sys.path.insert(0, REPOSITORY)
+
+def parse_arguments(argv):
+   if "--" in argv:
+      argv = argv[argv.index("--") + 1:]
+   elif argv and argv[0].endswith(".py"):
+      argv = argv[1:]
+   parser = argparse.ArgumentParser(prog="benchmarks/run.py", description="Benchmark the FORCI operators")
+   parser.add_argument("--fake-bpy", action="store_true", help="Run on the in-memory bpy shim instead of Blender")
+   parser.add_argument("--benchmarks", default="", help="Comma separated benchmark names (default: all)")
+   parser.add_argument("--sizes", default="small,medium", help="Comma separated scene sizes: small, medium, large")
+   parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark and size")
+   parser.add_argument("--shared-ratio", type=float, default=0.25, help="Share of materials that are .001 duplicates")
+   parser.add_argument("--output", default="", help="Write the results here (JSON)")
+   parser.add_argument("--compare", default="", help="Baseline JSON to compare the results with")
+   parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed slowdown before --compare fails (0.5 = 50%%, the copies make timings noisy)")
+   return parser.parse_args(argv)
+
+def run_benchmarks(arguments):
+   if arguments.fake_bpy:
+      from benchmarks import fake_bpy
+      fake_bpy.install()
+   import bpy
+   from benchmarks import scene_generator, suite
+
+   selected = [name for name in arguments.benchmarks.split(",") if name]
+   benchmarks = [benchmark for benchmark in suite.BENCHMARKS if not selected or benchmark.name in selected]
+   runner = suite.OperatorRunner(bpy, arguments.fake_bpy)
+   results = {}
+   for benchmark in benchmarks:
+      if benchmark.blender_only and arguments.fake_bpy:
+         print(f"{benchmark.name}: skipped, needs Blender")
+         continue
+      runner.load(benchmark)
+      results[benchmark.name] = {}
+      for size in arguments.sizes.split(","):
+         timings = []
+         for repeat in range(arguments.repeat):
+            scene_generator.clear_data(bpy)
+            info = scene_generator.generate_scene(bpy, shared_ratio=arguments.shared_ratio, **suite.SIZES[size])
+            try:
+               properties = benchmark.prepare(bpy, bpy.context, info)
+               # Garbage left by the previous scenes must not be collected while timing
+               gc.collect()
+               # The operators print per texture, keep that out of the console
+               with contextlib.redirect_stdout(io.StringIO()):
+                  started = time.perf_counter()
+                  runner.run(benchmark, properties)
+                  timings.append(time.perf_counter() - started)
+            finally:
+               scene_generator.remove_scene_files(info)
+         results[benchmark.name][size] = {
+            "median": statistics.median(timings),
+            "min": min(timings),
+            "runs": timings,
+         }
+         print(f"{benchmark.name} [{size}]: median {statistics.median(timings) * 1000:.1f} ms, min {min(timings) * 1000:.1f} ms")
+   runner.unregister()
+   scene_generator.clear_data(bpy)
+
+   return {
+      "backend": "fake-bpy" if arguments.fake_bpy else "blender",
+      "blender": bpy.app.version_string,
+      "python": platform.python_version(),
+      "machine": platform.machine(),
+      "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+      "sizes": {size: suite.SIZES[size] for size in arguments.sizes.split(",")},
+      "shared_ratio": arguments.shared_ratio,
+      "repeat": arguments.repeat,
+      "results": results,
+   }
+
+def compare(report, baseline, tolerance):
+   """Print the ratio to the baseline per benchmark and size, return the regressions"""
+   if baseline.get("backend") != report["backend"]:
+      print(f"warning: comparing a {report['backend']} run with a {baseline.get('backend')} baseline")
+   regressions = []
+   for name, sizes in report["results"].items():
+      for size, timing in sizes.items():
+         reference = baseline.get("results", {}).get(name, {}).get(size)
+         if not reference:
+            print(f"{name} [{size}]: not in the baseline")
+            continue
+         ratio = timing["median"] / reference["median"] if reference["median"] else float("inf")
+         status = "REGRESSION" if ratio > 1.0 + tolerance else "ok"
+         print(f"{name} [{size}]: {ratio:.2f}x baseline {status}")
+         if status != "ok":
+            regressions.append((name, size, ratio))
+   return regressions
+
+def main(argv):
+   arguments = parse_arguments(argv)
+   report = run_benchmarks(arguments)
+   if arguments.output:
+      with open(arguments.output, "w", encoding="utf-8") as stream:
+         json.dump(report, stream, indent=2)
+   if arguments.compare:
+      with open(arguments.compare, "r", encoding="utf-8") as stream:
+         baseline = json.load(stream)
+      if compare(report, baseline, arguments.tolerance):
+         return 1
+   return 0
+
+if __name__ == "__main__":
+   sys.exit(main(sys.argv))
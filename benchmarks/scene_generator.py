@@ -0,0 +1,147 @@
+"""Synthetic scenes for the benchmarks, built through the bpy API (real or fake).
+
+A scene has N mesh objects, M materials and K images written to a temporary texture
+folder. A share of the materials are ".001" duplicates of another material (same
+texture), a share use a "Neo Yakuza Shader" group instead of the Principled BSDF, and
+a few objects have no material at all.
+"""
+
+import os
+import shutil
+import tempfile
+from collections import namedtuple
+
+import numpy as np
+
+from forci_stuff import forci_dds
+
+SceneInfo = namedtuple("SceneInfo", "root source_folder destination_folder used_folder material_names image_names")
+
+YAKUZA_GROUP_NAME = "Neo Yakuza Shader"
+
+def clear_data(bpy):
+   """Remove every datablock the generator creates, so each run starts from the same state"""
+   for collection_name in ("objects", "meshes", "materials", "images", "node_groups", "actions", "armatures"):
+      collection = getattr(bpy.data, collection_name)
+      bpy.data.batch_remove(list(collection))
+   # The shared caches are dropped on load_post in Blender, do it by hand here
+   from forci_stuff import forci_scene_index, forci_name_query, forci_image_pool
+   forci_scene_index.get_index().invalidate()
+   forci_name_query.get_query_engine().invalidate()
+   forci_image_pool.get_pool().invalidate()
+
+def write_textures(folder, names):
+   """Write one small PNG per name, each with different pixels so content hashes differ"""
+   os.makedirs(folder, exist_ok=True)
+   for number, name in enumerate(names):
+      pixels = np.empty((4, 4, 4), dtype=np.uint8)
+      pixels[..., 0] = number & 0xFF
+      pixels[..., 1] = (number >> 8) & 0xFF
+      pixels[..., 2] = (number >> 16) & 0xFF
+      pixels[..., 3] = 255
+      forci_dds.write_png(os.path.join(folder, name), pixels)
+
+def yakuza_group(bpy):
+   group = bpy.data.node_groups.get(YAKUZA_GROUP_NAME)
+   if group is None:
+      group = bpy.data.node_groups.new(YAKUZA_GROUP_NAME, 'ShaderNodeTree')
+      if hasattr(group, "interface"):
+         # Blender 4.0+
+         group.interface.new_socket(name="texture_diffuse", in_out='INPUT', socket_type='NodeSocketColor')
+         group.interface.new_socket(name="BSDF", in_out='OUTPUT', socket_type='NodeSocketShader')
+      else:
+         group.inputs.new('NodeSocketColor', "texture_diffuse")
+         group.outputs.new('NodeSocketShader', "BSDF")
+   return group
+
+def build_material(bpy, name, image, yakuza):
+   material = bpy.data.materials.new(name)
+   material.use_nodes = True
+   nodes = material.node_tree.nodes
+   links = material.node_tree.links
+   texture_node = nodes.new('ShaderNodeTexImage')
+   texture_node.image = image
+   if yakuza:
+      group_node = nodes.new('ShaderNodeGroup')
+      group_node.node_tree = yakuza_group(bpy)
+      group_node.name = YAKUZA_GROUP_NAME
+      links.new(texture_node.outputs["Color"], group_node.inputs["texture_diffuse"])
+   else:
+      principled = next(node for node in nodes if node.type == 'BSDF_PRINCIPLED')
+      links.new(texture_node.outputs["Color"], principled.inputs["Base Color"])
+   return material
+
+def build_mesh(bpy, name, material):
+   mesh = bpy.data.meshes.new(name)
+   vertices = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (2, 0, 0), (2, 1, 0)]
+   mesh.from_pydata(vertices, [], [(0, 1, 2, 3), (1, 4, 5, 2)])
+   if material is not None:
+      mesh.materials.append(material)
+   mesh.update()
+   return mesh
+
+def generate_scene(bpy, objects=200, materials=50, images=40, shared_ratio=0.25, yakuza_ratio=0.25,
+                   empty_ratio=0.05, root=None):
+   """Build the scene in bpy.data and the current scene, return a SceneInfo"""
+   root = root or tempfile.mkdtemp(prefix="forci_bench_")
+   source_folder = os.path.join(root, "source")
+   scene = bpy.context.scene
+
+   # Images: the first yakuza_ratio of them are Yakuza diffuse textures (<name>_d.png)
+   yakuza_images = max(1, int(images * yakuza_ratio)) if yakuza_ratio else 0
+   image_names = [f"tex_{number:05d}_d.png" if number < yakuza_images else f"tex_{number:05d}.png" for number in range(images)]
+   write_textures(source_folder, image_names)
+   image_blocks = [bpy.data.images.load(os.path.join(source_folder, name)) for name in image_names]
+   principled_images = image_blocks[yakuza_images:] or image_blocks
+   yakuza_blocks = image_blocks[:yakuza_images] or image_blocks
+
+   # Materials: unique ones first, then ".001", ".002"... duplicates sharing their texture
+   unique_count = max(1, round(materials * (1.0 - shared_ratio)))
+   yakuza_count = int(unique_count * yakuza_ratio)
+   material_blocks = []
+   for number in range(unique_count):
+      yakuza = number < yakuza_count
+      pool = yakuza_blocks if yakuza else principled_images
+      material_blocks.append(build_material(bpy, f"mat_{number:05d}", pool[number % len(pool)], yakuza))
+   for number in range(unique_count, materials):
+      original_number = number % unique_count
+      original = material_blocks[original_number]
+      yakuza = original_number < yakuza_count
+      texture_node = next(node for node in original.node_tree.nodes if node.type == 'TEX_IMAGE')
+      material_blocks.append(build_material(bpy, f"mat_{original_number:05d}.{number // unique_count:03d}", texture_node.image, yakuza))
+
+   # Objects: one mesh each, materials assigned round robin, a few without material
+   without_material = int(objects * empty_ratio)
+   for number in range(objects):
+      material = None if number < without_material else material_blocks[number % len(material_blocks)]
+      mesh = build_mesh(bpy, f"mesh_{number:05d}", material)
+      obj = bpy.data.objects.new(f"obj_{number:05d}", mesh)
+      scene.collection.objects.link(obj)
+      if number == objects - 1:
+         bpy.context.view_layer.objects.active = obj
+
+   return SceneInfo(
+      root=root,
+      source_folder=source_folder,
+      destination_folder=os.path.join(root, "renamed"),
+      used_folder=os.path.join(root, "used"),
+      material_names=[material.name for material in material_blocks],
+      image_names=image_names,
+   )
+
+def generate_empties(bpy, count=50, frames=100):
+   """Animated empty hierarchy for create_rigged_armature (needs a real Blender)"""
+   scene = bpy.context.scene
+   scene.frame_start, scene.frame_end = 1, frames
+   parent = None
+   for number in range(count):
+      empty = bpy.data.objects.new(f"empty_{number:04d}", None)
+      scene.collection.objects.link(empty)
+      empty.parent = parent if number % 5 else None
+      for frame in range(1, frames + 1, 10):
+         empty.location = (number * 0.1, frame * 0.01, 0.0)
+         empty.keyframe_insert("location", frame=frame)
+      parent = empty
+
+def remove_scene_files(info):
+   shutil.rmtree(info.root, ignore_errors=True)
@@ -0,0 +1,117 @@
+"""Measure what enabling the FORCI STUFF package costs at startup.
+
+In Blender: wall time of `blender -b --factory-startup` enabling the package, minus the
+same start without it, with the helpers loaded lazily (default) and eagerly:
+   python benchmarks/startup.py --blender /path/to/blender
+
+Without Blender, on the fake bpy shim: time to import and register the package in a
+fresh interpreter, and which heavy modules were left for the first invoke:
+   python benchmarks/startup.py
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPOSITORY not in sys.path:
+   sys.path.insert(0, REPOSITORY)
+
+# Modules the operators load on first use: the tools themselves and their heavy helpers
+DEFERRED_MODULES = ("numpy",) + tuple("forci_stuff." + name for name in (
+   "texture_renamer_forci", "yakuza_rename_texture_forci_v_4", "yakuza_rename_texture_forci", "material_changing_forci",
+   "change_texture_name_forci", "select_object_texture_forci", "remove_unused_meshed_forci", "alpha_applying_forci",
+   "specular_zero_forci", "replace_collection_name", "convert_axis_to_bones",
+   "forci_dds", "forci_copy_engine", "forci_texture_hash", "forci_name_allocator", "forci_change_plan",
+   "forci_texture_lookup", "forci_manifest", "forci_alpha",
+))
+
+BLENDER_ENABLE = (
+   "import sys; sys.path.insert(0, {repository!r}); import addon_utils; "
+   "addon_utils.enable('forci_stuff', default_set=False)"
+)
+
+def parse_arguments(argv):
+   parser = argparse.ArgumentParser(prog="benchmarks/startup.py", description="Measure the FORCI STUFF startup cost")
+   parser.add_argument("--blender", default="", help="Blender executable, measure in Blender instead of on the fake bpy")
+   parser.add_argument("--repeat", type=int, default=5, help="Fresh processes per measurement")
+   parser.add_argument("--output", default="", help="Write the results here (JSON)")
+   parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+   return parser.parse_args(argv[1:])
+
+def child():
+   """Runs in a fresh interpreter: import and register the package on the fake bpy"""
+   from benchmarks import fake_bpy
+   fake_bpy.install()
+   from forci_stuff import forci_lazy
+
+   started = time.perf_counter()
+   import forci_stuff
+   forci_stuff.register()
+   seconds = time.perf_counter() - started
+   print(json.dumps({
+      "seconds": seconds,
+      "modules": dict(forci_stuff.startup_timings),
+      "deferred": [name for name in DEFERRED_MODULES if not forci_lazy.is_loaded(name)],
+   }))
+
+def run_fake(repeat, eager):
+   environment = dict(os.environ, FORCI_EAGER_IMPORTS="1" if eager else "")
+   runs = []
+   for _ in range(repeat):
+      process = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"], env=environment,
+                               stdout=subprocess.PIPE, check=True, universal_newlines=True)
+      runs.append(json.loads(process.stdout.strip().splitlines()[-1]))
+   return {
+      "median": statistics.median(run["seconds"] for run in runs),
+      "deferred": runs[-1]["deferred"],
+      "modules": runs[-1]["modules"],
+   }
+
+def time_blender(blender, repeat, expression=None, eager=False):
+   environment = dict(os.environ, FORCI_EAGER_IMPORTS="1" if eager else "")
+   command = [blender, "-b", "--factory-startup"]
+   if expression:
+      command += ["--python-expr", expression]
+   timings = []
+   for _ in range(repeat):
+      started = time.perf_counter()
+      subprocess.run(command, env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+      timings.append(time.perf_counter() - started)
+   return statistics.median(timings)
+
+def run_blender(blender, repeat):
+   enable = BLENDER_ENABLE.format(repository=REPOSITORY)
+   bare = time_blender(blender, repeat)
+   lazy = time_blender(blender, repeat, enable)
+   eager = time_blender(blender, repeat, enable, eager=True)
+   return {"bare": bare, "lazy": lazy - bare, "eager": eager - bare}
+
+def main(argv):
+   arguments = parse_arguments(argv)
+   if arguments.child:
+      child()
+      return 0
+
+   if arguments.blender:
+      report = {"backend": "blender", **run_blender(arguments.blender, arguments.repeat)}
+      print(f"Blender start {report['bare'] * 1000:.0f} ms, FORCI STUFF adds {report['lazy'] * 1000:.0f} ms "
+            f"({report['eager'] * 1000:.0f} ms with eager imports)")
+   else:
+      lazy = run_fake(arguments.repeat, eager=False)
+      eager = run_fake(arguments.repeat, eager=True)
+      report = {"backend": "fake-bpy", "lazy": lazy, "eager": eager}
+      print(f"register(): {lazy['median'] * 1000:.1f} ms lazy, {eager['median'] * 1000:.1f} ms eager")
+      print(f"deferred to the first invoke: {', '.join(lazy['deferred']) or 'nothing'}")
+
+   if arguments.output:
+      with open(arguments.output, "w", encoding="utf-8") as stream:
+         json.dump(report, stream, indent=2)
+   return 0
+
+if __name__ == "__main__":
+   sys.exit(main(sys.argv))
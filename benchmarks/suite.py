@@ -0,0 +1,94 @@
+"""The benchmark definitions: which operator and how to prepare the scene."""
+
+import importlib
+from collections import namedtuple
+
+from benchmarks import scene_generator
+
+# The add-on registering every benchmarked operator
+ADDON_PACKAGE = "forci_stuff"
+
+# name, operator id, prepare(bpy, context, info) -> operator properties, needs a real Blender
+Benchmark = namedtuple("Benchmark", "name operator prepare blender_only")
+
+SIZES = {
+   "small": dict(objects=200, materials=50, images=40),
+   "medium": dict(objects=2000, materials=500, images=300),
+   "large": dict(objects=20000, materials=5000, images=2000),
+}
+
+def prepare_texture_renamer(bpy, context, info):
+   props = context.scene.forcica_texture_renamer_props
+   props.source_folder = info.source_folder
+   props.destination_folder = info.destination_folder
+   return {}
+
+def prepare_yakuza_handler(bpy, context, info):
+   props = context.scene.forci_yakuza_texture_props
+   props.source_folder = info.source_folder
+   props.destination_folder = info.destination_folder
+   props.used_textures_folder = info.used_folder
+   return {}
+
+def prepare_material_merger(bpy, context, info):
+   return {}
+
+def prepare_remove_mesh(bpy, context, info):
+   # About one material in ten: mat_00000 ... mat_00009 and their duplicates
+   return {"texture_name": "mat_0000*", "match_mode": 'GLOB', "purge_orphans": True}
+
+def prepare_select_by_texture(bpy, context, info):
+   context.window_manager.texture_name = "tex_000*"
+   context.window_manager.texture_match_mode = 'GLOB'
+   return {}
+
+def prepare_rigged_armature(bpy, context, info):
+   scene_generator.generate_empties(bpy)
+   return {}
+
+BENCHMARKS = [
+   Benchmark("texture_renamer", "forcica.texture_renamer", prepare_texture_renamer, False),
+   Benchmark("yakuza_handler", "object.forci_yakuza_texture_handler", prepare_yakuza_handler, False),
+   Benchmark("material_merger", "forcica.material_merger", prepare_material_merger, False),
+   Benchmark("remove_mesh", "forcica.remove_mesh", prepare_remove_mesh, False),
+   Benchmark("select_by_texture", "object.select_by_texture_name", prepare_select_by_texture, False),
+   Benchmark("create_rigged_armature", "object.create_rigged_armature_operator", prepare_rigged_armature, True),
+]
+
+def find_operator_class(module, operator_id):
+   for value in vars(module).values():
+      if isinstance(value, type) and getattr(value, "bl_idname", None) == operator_id:
+         return value
+   raise LookupError(f"{operator_id} is not defined in {module.__name__}")
+
+class OperatorRunner:
+   """Calls the benchmarked operators: through bpy.ops in Blender, directly on the fake"""
+
+   def __init__(self, bpy, fake):
+      self.bpy = bpy
+      self.fake = fake
+      self.registered = False
+
+   def load(self, benchmark):
+      package = importlib.import_module(ADDON_PACKAGE)
+      if not self.registered:
+         package.register()
+         self.registered = True
+      return package
+
+   def run(self, benchmark, properties):
+      package = self.load(benchmark)
+      if not self.fake:
+         category, name = benchmark.operator.split(".", 1)
+         return getattr(getattr(self.bpy.ops, category), name)(**properties)
+      operator_class = find_operator_class(package.operators, benchmark.operator)
+      context = self.bpy.context
+      poll = getattr(operator_class, "poll", None)
+      if poll is not None and not poll(context):
+         raise RuntimeError(f"{benchmark.operator}.poll() failed")
+      return operator_class(**properties).execute(context)
+
+   def unregister(self):
+      if self.registered:
+         importlib.import_module(ADDON_PACKAGE).unregister()
+         self.registered = False
@@ -0,0 +1,264 @@
+"""Apply a chain of FORCI operators to many .blend files, headless.
+
+Usage:
+   blender -b --python forci_batch_runner.py -- --operators forcica.texture_renamer,forcica.material_merger,forcica.specular_zero --workers 8 path/to/library
+
+Each .blend file is opened in its own background Blender worker (at most --workers at a
+time), the operators run in order, the file is saved (in place, or to --output-dir) and a
+JSON summary with timings, touched datablocks and errors is written next to it.
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# The add-on providing every FORCI operator, enabled in the workers
+ADDON_PACKAGE = "forci_stuff"
+
+# Datablock collections compared before and after the chain
+TRACKED_COLLECTIONS = ("objects", "meshes", "materials", "images", "node_groups", "collections", "actions", "armatures")
+
+SUMMARY_SUFFIX = ".forci.json"
+
+def parse_arguments(argv):
+   if "--" in argv:
+      argv = argv[argv.index("--") + 1:]
+   else:
+      argv = []
+   parser = argparse.ArgumentParser(prog="forci_batch_runner", description="Apply FORCI operators to .blend files headless")
+   parser.add_argument("paths", nargs="*", help=".blend files or folders to search recursively")
+   parser.add_argument("--operators", required=True, help="Comma separated operator ids, run in order")
+   parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of Blender processes running at once")
+   parser.add_argument("--output-dir", default="", help="Save results here instead of overwriting the input files")
+   parser.add_argument("--scene-prop", action="append", default=[], metavar="PATH=VALUE",
+                       help="Scene property to set before running, e.g. forcica_texture_renamer_props.destination_folder=//textures/")
+   parser.add_argument("--addon-pref", action="append", default=[], metavar="KEY=VALUE",
+                       help="Add-on preference to set before running, e.g. forcica_texture_directory=/textures/png/")
+   parser.add_argument("--blender", default="", help="Blender executable for the workers (defaults to the running one)")
+   parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+   parser.add_argument("--summary", default="", help=argparse.SUPPRESS)
+   parser.add_argument("--save-as", default="", help=argparse.SUPPRESS)
+   return parser.parse_args(argv)
+
+def output_path(blend_path, root, output_dir):
+   if not output_dir:
+      return blend_path
+   # Relative to the folder it was found under, library/a/x.blend and library/b/x.blend stay apart
+   return os.path.join(output_dir, os.path.relpath(blend_path, root))
+
+def collect_blend_files(paths):
+   """(path, root) for every .blend file of paths, root being the folder given on the command line"""
+   files = {}
+   for path in paths:
+      if os.path.isdir(path):
+         found = [(file, path) for file in sorted(glob.glob(os.path.join(path, "**", "*.blend"), recursive=True))]
+      elif path.endswith(".blend"):
+         found = [(path, os.path.dirname(path))]
+      else:
+         found = []
+      for file, root in found:
+         files.setdefault(os.path.abspath(file), os.path.abspath(root))
+   return list(files.items())
+
+def output_clashes(files, output_dir):
+   """{output path: input paths} for the outputs more than one input file would be saved to"""
+   outputs = {}
+   for path, root in files:
+      outputs.setdefault(os.path.normcase(output_path(path, root, output_dir)), []).append(path)
+   return {output: paths for output, paths in outputs.items() if len(paths) > 1}
+
+def write_summary(path, summary):
+   with open(path, "w", encoding="utf-8") as stream:
+      json.dump(summary, stream, indent=2)
+
+# --- Worker: runs inside a background Blender with the .blend loaded ------------
+
+def snapshot_datablocks(bpy):
+   return {name: {datablock.as_pointer(): datablock.name for datablock in getattr(bpy.data, name)} for name in TRACKED_COLLECTIONS}
+
+def diff_datablocks(before, after):
+   touched = {"added": {}, "removed": {}, "renamed": {}}
+   for name in TRACKED_COLLECTIONS:
+      old, new = before[name], after[name]
+      added = [new[pointer] for pointer in new.keys() - old.keys()]
+      removed = [old[pointer] for pointer in old.keys() - new.keys()]
+      renamed = {old[pointer]: new[pointer] for pointer in old.keys() & new.keys() if old[pointer] != new[pointer]}
+      if added:
+         touched["added"][name] = sorted(added)
+      if removed:
+         touched["removed"][name] = sorted(removed)
+      if renamed:
+         touched["renamed"][name] = renamed
+   return touched
+
+def resolve_operator(bpy, operator_id):
+   category, name = operator_id.split(".", 1)
+   return getattr(getattr(bpy.ops, category), name)
+
+def enable_addon():
+   import addon_utils
+   # default_set adds the package to preferences.addons, where the operators read their preferences
+   if addon_utils.enable(ADDON_PACKAGE, default_set=True) is None:
+      raise RuntimeError(f"Could not enable the {ADDON_PACKAGE} add-on")
+
+def apply_props(root, assignments):
+   """Set the PATH=VALUE assignments, paths relative to root (the scene, the add-on preferences)"""
+   for assignment in assignments:
+      path, value = assignment.split("=", 1)
+      owner_path, _, attribute = path.rpartition(".")
+      owner = root.path_resolve(owner_path) if owner_path else root
+      current = getattr(owner, attribute)
+      if isinstance(current, bool):
+         value = value.lower() in ("1", "true", "yes", "on")
+      elif isinstance(current, (int, float)):
+         value = type(current)(value)
+      setattr(owner, attribute, value)
+
+def run_worker(arguments):
+   import bpy
+
+   operator_ids = [operator_id.strip() for operator_id in arguments.operators.split(",") if operator_id.strip()]
+   summary = {
+      "file": bpy.data.filepath,
+      "saved_to": None,
+      "operators": [],
+      "touched": {},
+      "updated": [],
+      "errors": [],
+   }
+   updated = set()
+
+   def on_depsgraph_update(scene, depsgraph=None):
+      if depsgraph is not None:
+         for update in depsgraph.updates:
+            updated.add(f"{type(update.id).__name__}:{update.id.name}")
+
+   started = time.perf_counter()
+   bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+   try:
+      enable_addon()
+      apply_props(bpy.context.preferences.addons[ADDON_PACKAGE].preferences, arguments.addon_pref)
+      apply_props(bpy.context.scene, arguments.scene_prop)
+      before = snapshot_datablocks(bpy)
+
+      for operator_id in operator_ids:
+         entry = {"id": operator_id, "result": None, "seconds": 0.0, "error": None}
+         summary["operators"].append(entry)
+         operator_started = time.perf_counter()
+         try:
+            entry["result"] = sorted(resolve_operator(bpy, operator_id)())
+            # Evaluate now so the depsgraph reports what this operator touched
+            bpy.context.view_layer.update()
+         except Exception as error:
+            entry["error"] = f"{type(error).__name__}: {error}"
+            summary["errors"].append(f"{operator_id}: {entry['error']}")
+         entry["seconds"] = time.perf_counter() - operator_started
+         if entry["error"]:
+            break
+
+      summary["touched"] = diff_datablocks(before, snapshot_datablocks(bpy))
+
+      if not summary["errors"]:
+         destination = arguments.save_as or bpy.data.filepath
+         if destination == bpy.data.filepath:
+            bpy.ops.wm.save_mainfile()
+         else:
+            bpy.ops.wm.save_as_mainfile(filepath=destination, copy=True)
+         summary["saved_to"] = destination
+   except Exception:
+      summary["errors"].append(traceback.format_exc())
+   finally:
+      bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+
+   summary["updated"] = sorted(updated)
+   summary["seconds"] = time.perf_counter() - started
+   write_summary(arguments.summary, summary)
+   return 0 if not summary["errors"] else 1
+
+# --- Coordinator: fans the files out over worker Blender processes --------------
+
+def default_blender():
+   try:
+      import bpy
+      return bpy.app.binary_path
+   except ImportError:
+      return "blender"
+
+def run_file(blender, script, blend_path, root, arguments):
+   destination = output_path(blend_path, root, arguments.output_dir)
+   summary_path = destination + SUMMARY_SUFFIX
+   command = [blender, "-b", "--factory-startup", blend_path, "--python", script, "--", "--worker",
+              "--operators", arguments.operators, "--summary", summary_path]
+   if destination != blend_path:
+      os.makedirs(os.path.dirname(destination), exist_ok=True)
+      command += ["--save-as", destination]
+   for assignment in arguments.scene_prop:
+      command += ["--scene-prop", assignment]
+   for assignment in arguments.addon_pref:
+      command += ["--addon-pref", assignment]
+
+   started = time.perf_counter()
+   if os.path.isfile(summary_path):
+      os.remove(summary_path)
+   try:
+      process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+      errors = [f"Worker exited with code {process.returncode}", process.stdout[-4000:]]
+   except OSError as error:
+      errors = [f"Could not start {blender}: {error}"]
+   if not os.path.isfile(summary_path):
+      # The worker died before writing anything, record why
+      write_summary(summary_path, {
+         "file": blend_path,
+         "saved_to": None,
+         "operators": [],
+         "touched": {},
+         "updated": [],
+         "errors": errors,
+         "seconds": time.perf_counter() - started,
+      })
+   with open(summary_path, "r", encoding="utf-8") as stream:
+      return json.load(stream)
+
+def run_coordinator(arguments):
+   files = collect_blend_files(arguments.paths)
+   if not files:
+      print("forci_batch_runner: no .blend files found")
+      return 1
+   if arguments.output_dir:
+      clashes = output_clashes(files, arguments.output_dir)
+      if clashes:
+         for output, paths in sorted(clashes.items()):
+            print(f"forci_batch_runner: {', '.join(paths)} would all be saved to {output}")
+         return 1
+      os.makedirs(arguments.output_dir, exist_ok=True)
+
+   blender = arguments.blender or default_blender()
+   script = os.path.abspath(__file__)
+   failed = 0
+   started = time.perf_counter()
+   with ThreadPoolExecutor(max_workers=max(1, arguments.workers)) as pool:
+      futures = {pool.submit(run_file, blender, script, path, root, arguments): path for path, root in files}
+      for done, future in enumerate(as_completed(futures), 1):
+         path = futures[future]
+         summary = future.result()
+         status = "FAILED" if summary["errors"] else "ok"
+         failed += bool(summary["errors"])
+         print(f"[{done}/{len(files)}] {status} {path} ({summary.get('seconds', 0.0):.1f}s)")
+
+   print(f"forci_batch_runner: {len(files) - failed} ok, {failed} failed in {time.perf_counter() - started:.1f}s")
+   return 1 if failed else 0
+
+def main(argv):
+   arguments = parse_arguments(argv)
+   if arguments.worker:
+      return run_worker(arguments)
+   return run_coordinator(arguments)
+
+if __name__ == "__main__":
+   sys.exit(main(sys.argv))
@@ -0,0 +1,56 @@
+bl_info = {
+   "name": "FORCI STUFF",
+   "author": "Forcica",
+   "version": (1, 0),
+   "blender": (2, 80, 0),
+   "location": "View3D > N Panel > FORCI STUFF",
+   "description": "Texture, material, collection and rigging tools in the N panel",
+   "category": "FORCI STUFF",
+}
+
+# The tool modules and the helpers they share live in this package, every import
+# between them is relative so the folder can be installed under any name. Only the
+# settings, panels and operator declarations are registered here: an operator imports
+# its tool module on its first run, and the tool module loads what it needs (NumPy,
+# the copy, hash and DDS engines) through forci_lazy. Nothing here imports bpy at the
+# top, the DDS conversion processes import helpers of the package without Blender.
+
+import importlib
+import time
+
+# Shared state: depsgraph handlers, caches and the profiler panel, registered once for every tool
+SHARED_MODULES = (
+   ".forci_scene_index",
+   ".forci_name_query",
+   ".forci_profiler",
+   ".forci_image_pool",
+)
+
+# Settings first, the operators and panels use them
+PACKAGE_MODULES = (
+   ".preferences",
+   ".properties",
+   ".operators",
+   ".panels",
+)
+
+# (module name, seconds to import and register) of the last register()
+startup_timings = []
+_registered = []
+
+def register():
+   startup_timings.clear()
+   for name in SHARED_MODULES + PACKAGE_MODULES:
+      started = time.perf_counter()
+      module = importlib.import_module(name, __name__)
+      module.register()
+      _registered.append(module)
+      startup_timings.append((module.__name__, time.perf_counter() - started))
+
+def unregister():
+   for module in reversed(_registered):
+      module.unregister()
+   _registered.clear()
+
+if __name__ == "__main__":
+   register()
@@ -0,0 +1,147 @@
+import bpy
+from . import forci_scene_index
+from . import forci_profiler
+from . import forci_lazy
+
+# numpy and the analysis only load when the operator runs
+forci_alpha = forci_lazy.lazy_import(".forci_alpha", __package__)
+
+def scope_materials(context, scope, collection_name=""):
+   """The materials in scope, each once however many objects share it"""
+   if scope == 'FILE':
+      return [material for material in bpy.data.materials if material.library is None]
+   if scope == 'ACTIVE':
+      objects = [context.active_object] if context.active_object else []
+   elif scope == 'SELECTED':
+      objects = context.selected_objects
+   else:
+      collection = bpy.data.collections.get(collection_name) if collection_name else context.collection
+      objects = collection.all_objects if collection else []
+   materials = {}
+   for obj in objects:
+      if obj.type == 'MESH':
+         forci_profiler.count("objects")
+         for slot in obj.material_slots:
+            # Les matériaux liés depuis une bibliothèque ne sont pas modifiables
+            if slot.material and slot.material.library is None:
+               materials[slot.material] = None
+   return list(materials)
+
+def operator_scope(operator, context):
+   """(scope, collection name) of the operator, the panel's settings when the caller left them unset"""
+   if operator.properties.is_property_set("scope"):
+      return operator.scope, operator.collection_name
+   # Bouton du panneau, script ou forci_batch_runner avec --scene-prop forci_alpha_settings.scope=FILE
+   settings = context.scene.forci_alpha_settings
+   return settings.scope, settings.collection.name if settings.collection else ""
+
+def base_color_image_node(bsdf_node):
+   """The Image Texture node plugged into the Base Color, from the socket's own links"""
+   socket = bsdf_node.inputs.get('Base Color')
+   if socket is None or not socket.is_linked:
+      return None
+   node = socket.links[0].from_node
+   return node if node.type == 'TEX_IMAGE' else None
+
+def principled_targets(materials):
+   """(material, Principled BSDF, Base Color image node) for each material that has them"""
+   targets = []
+   for material in materials:
+      if material.use_nodes and material.node_tree:
+         # Trouver le nœud BSDF Principled et le nœud d'image connecté à son Base Color
+         for node in material.node_tree.nodes:
+            if node.type == 'BSDF_PRINCIPLED':
+               image_node = base_color_image_node(node)
+               if image_node:
+                  targets.append((material, node, image_node))
+                  break
+   return targets
+
+class ForciAlphaApplyingOperator(forci_lazy.OperatorImplementation):
+   """Apply Alpha Texture to Principled BSDF Material. In EEVEE Next (Blender 4.2+) Alpha Clip textures render Dithered, not as a hard cutout"""
+
+   def steps(self, context):
+      materials = scope_materials(context, *operator_scope(self, context))
+      forci_profiler.count("materials", len(materials))
+      # Entre deux pauses l'utilisateur peut annuler ou supprimer : seuls les noms passent les yields
+      material_names = [material.name for material in materials]
+      kinds = {}   # image name -> kind, each image analyzed once however many materials use it
+      if self.analyze_pixels:
+         analyzer = forci_alpha.get_analyzer()
+         analyzed, cached = analyzer.analyzed, analyzer.cached
+         image_names = list(dict.fromkeys(image_node.image.name for material, bsdf_node, image_node in principled_targets(materials)
+                                          if image_node.image))
+         yield "Analyzing textures"
+         for done, image_name in enumerate(image_names, 1):
+            image = bpy.data.images.get(image_name)
+            if image is not None:
+               kinds[image_name] = analyzer.classify(image, self.analysis_size ** 2, self.translucent_fraction)
+            yield done, len(image_names)
+
+      # Modifier la scène en une seule fois, une annulation pendant l'analyse ne change rien.
+      # Matériaux et nœuds sont relus ici, après la dernière pause.
+      materials = [bpy.data.materials.get(name) for name in material_names]
+      targets = principled_targets(material for material in materials if material is not None and material.library is None)
+      index = forci_scene_index.get_index()
+      counts = dict.fromkeys((forci_alpha.OPAQUE, forci_alpha.BINARY, forci_alpha.TRANSLUCENT, None), 0)
+      for material, bsdf_node, image_node in targets:
+         if self.analyze_pixels:
+            kind = kinds.get(image_node.image.name) if image_node.image else None
+         else:
+            kind = forci_alpha.TRANSLUCENT
+         counts[kind] += 1
+         if kind is not None and apply_alpha(material, bsdf_node, image_node, kind, self.analyze_pixels):
+            index.mark_dirty(material)
+      if self.analyze_pixels:
+         self.report({'INFO'}, f"Alpha: {counts[forci_alpha.OPAQUE]} opaque, {counts[forci_alpha.BINARY]} clip, "
+                     f"{counts[forci_alpha.TRANSLUCENT]} blend, {counts[None]} unreadable "
+                     f"({analyzer.analyzed - analyzed} textures analyzed, {analyzer.cached - cached} from cache)")
+      else:
+         self.report({'INFO'}, f"Alpha texture applied to {len(targets)} Principled BSDF materials")
+      return {'FINISHED'}
+
+def apply_alpha(material, bsdf_node, image_node, kind, set_blend_method=True):
+   """Link or unlink the texture's Alpha and set the blend mode for kind, return True if something changed"""
+   alpha_output = image_node.outputs.get('Alpha')
+   alpha_input = bsdf_node.inputs.get('Alpha')
+   if not alpha_output or not alpha_input:
+      return False
+   links = material.node_tree.links
+   changed = False
+   if kind == forci_alpha.OPAQUE:
+      # Un alpha toujours à 1 ne sert qu'à ralentir le rendu
+      for link in list(alpha_input.links):
+         if link.from_socket == alpha_output:
+            links.remove(link)
+            changed = True
+   elif not any(link.from_socket == alpha_output for link in alpha_input.links):
+      # Connecter le canal Alpha de la texture image au canal Alpha de Principled BSDF
+      links.new(alpha_output, alpha_input)
+      changed = True
+   if set_blend_method:
+      blend_method = forci_alpha.BLEND_METHODS[kind]
+      if material.blend_method != blend_method:
+         material.blend_method = blend_method
+         changed = True
+      if hasattr(material, "shadow_method"):
+         material.shadow_method = forci_alpha.SHADOW_METHODS[kind]
+      if hasattr(material, "surface_render_method"):
+         # EEVEE Next (4.2+) only knows dithered and blended: a clip texture shows dithered edges, not a hard cutout
+         material.surface_render_method = 'BLENDED' if kind == forci_alpha.TRANSLUCENT else 'DITHERED'
+   return changed
+
+class ForciAlphaBlendOperator(forci_lazy.OperatorImplementation):
+   """Toggle Alpha Blend Mode for Material"""
+
+   @forci_profiler.profiled
+   def execute(self, context):
+      changed = 0
+      for material in scope_materials(context, *operator_scope(self, context)):
+         forci_profiler.count("materials")
+         if material.use_nodes and material.node_tree and material.blend_method != 'BLEND':
+            if any(node.type == 'BSDF_PRINCIPLED' for node in material.node_tree.nodes):
+               # Changer le mode de fusion en Alpha Blend
+               material.blend_method = 'BLEND'
+               changed += 1
+      self.report({'INFO'}, f"Alpha Blend mode set for {changed} materials")
+      return {'FINISHED'}
@@ -0,0 +1,42 @@
+import re
+from . import forci_scene_index
+from . import forci_profiler
+from . import forci_lazy
+
+# Only loaded when the operator runs, not when the add-on is enabled
+forci_change_plan = forci_lazy.lazy_import(".forci_change_plan", __package__)
+
+class ForciChangeNameTextureOperator(forci_lazy.OperatorImplementation):
+   """Change material name for all objects in the scene based on texture name used in shader nodes, 
+      removing .png extension and numeric suffixes, including custom 'Neo Yakuza Shader' nodes"""
+
+   @forci_profiler.profiled
+   def execute(self, context):
+      # Expression régulière pour détecter .png suivi ou non d'un suffixe numérique comme .001
+      regex = re.compile(r"\.png(\.\d+)?$", re.IGNORECASE)
+   
+      index = forci_scene_index.get_index()
+      plan = forci_change_plan.ChangePlan("Change Material Name")
+
+      # Chaque matériau utilisé n'est traité qu'une fois, même s'il est partagé par plusieurs objets
+      for material in index.used_materials():
+         forci_profiler.count("materials")
+         if material.use_nodes:
+               forci_profiler.count("nodes", len(material.node_tree.nodes))
+               for node in material.node_tree.nodes:
+                  # Vérifie si le nœud est un BSDF_PRINCIPLED ou un 'Neo Yakuza Shader'
+                  if node.type == 'BSDF_PRINCIPLED' or (node.bl_idname == 'ShaderNodeGroup' and node.node_tree and "Yakuza Shader" in node.node_tree.name):
+                     if node.type == 'BSDF_PRINCIPLED':
+                        linked_node = index.upstream_node(material, node, 'Base Color')
+                     else:
+                        linked_node = index.upstream_node(material, node, 'texture_diffuse')  # Nom d'entrée supposé pour le nœud custom
+
+                     if linked_node and linked_node.type == 'TEX_IMAGE' and linked_node.image:
+                        texture_name = linked_node.image.name
+                        # Retire l'extension .png et tout suffixe numérique
+                        texture_name = regex.sub('', texture_name)
+                        plan.rename(material, texture_name)
+                        break  # Nous avons trouvé un nœud de texture valide, pas besoin de continuer
+
+      # Les renommages sont appliqués ensemble, avec une seule mise à jour à la fin
+      return forci_change_plan.run_plan(self, context, plan, self.dry_run)
@@ -0,0 +1,301 @@
+import bpy
+from mathutils import Vector # type: ignore
+from . import forci_profiler
+from . import forci_lazy
+
+# Only loaded when the operator runs, not when the add-on is enabled
+np = forci_lazy.lazy_import("numpy")
+
+# Le mappage des noms des objets Empty aux noms des bones
+empty_to_bone_mapping = {
+   "ball_l": "ValveBiped.Bip01_L_Toe0",
+   "ball_r": "ValveBiped.Bip01_R_Toe0",
+   "ik_foot_r": "ValveBiped.Bip01_R_Foot",
+   "ik_foot_l": "ValveBiped.Bip01_L_Foot",
+   "calf_r": "ValveBiped.Bip01_R_Calf",
+   "calf_l": "ValveBiped.Bip01_L_Calf",
+   "thigh_l": "ValveBiped.Bip01_L_Thigh",
+   "thigh_r": "ValveBiped.Bip01_R_Thigh",
+   "pelvis": "ValveBiped.Bip01_Pelvis",
+   "spine_01": "ValveBiped.Bip01_Spine",
+   "spine_02": "ValveBiped.Bip01_Spine1",
+   "spine_03": "ValveBiped.Bip01_Spine2",
+   "neck_01": "ValveBiped.Bip01_Neck1",
+   "head": "ValveBiped.Bip01_Head1",
+   "clavicle_r": "ValveBiped.Bip01_R_Clavicle",
+   "upperarm_r": "ValveBiped.Bip01_R_UpperArm",
+   "lowerarm_r": "ValveBiped.Bip01_R_Forearm",
+   "ik_hand_r": "ValveBiped.Bip01_R_Hand",
+   "thumb_01_r": "ValveBiped.Bip01_R_Finger0",
+   "thumb_02_r": "ValveBiped.Bip01_R_Finger01",
+   "thumb_03_r": "ValveBiped.Bip01_R_Finger02",
+   "index_01_r": "ValveBiped.Bip01_R_Finger1",
+   "index_02_r": "ValveBiped.Bip01_R_Finger11",
+   "index_03_r": "ValveBiped.Bip01_R_Finger12",
+   "middle_01_r": "ValveBiped.Bip01_R_Finger2",
+   "middle_02_r": "ValveBiped.Bip01_R_Finger21",
+   "middle_03_r": "ValveBiped.Bip01_R_Finger22",
+   "ring_01_r": "ValveBiped.Bip01_R_Finger3",
+   "ring_02_r": "ValveBiped.Bip01_R_Finger31",
+   "ring_03_r": "ValveBiped.Bip01_R_Finger32",
+   "pinky_01_r": "ValveBiped.Bip01_R_Finger4",
+   "pinky_02_r": "ValveBiped.Bip01_R_Finger41",
+   "pinky_03_r": "ValveBiped.Bip01_R_Finger42",
+   "clavicle_l": "ValveBiped.Bip01_L_Clavicle",
+   "upperarm_l": "ValveBiped.Bip01_L_UpperArm",
+   "lowerarm_l": "ValveBiped.Bip01_L_Forearm",
+   "ik_hand_l": "ValveBiped.Bip01_L_Hand",
+   "thumb_01_l": "ValveBiped.Bip01_L_Finger0",
+   "thumb_02_l": "ValveBiped.Bip01_L_Finger01",
+   "thumb_03_l": "ValveBiped.Bip01_L_Finger02",
+   "index_01_l": "ValveBiped.Bip01_L_Finger1",
+   "index_02_l": "ValveBiped.Bip01_L_Finger11",
+   "index_03_l": "ValveBiped.Bip01_L_Finger12",
+   "middle_01_l": "ValveBiped.Bip01_L_Finger2",
+   "middle_02_l": "ValveBiped.Bip01_L_Finger21",
+   "middle_03_l": "ValveBiped.Bip01_L_Finger22",
+   "ring_01_l": "ValveBiped.Bip01_L_Finger3",
+   "ring_02_l": "ValveBiped.Bip01_L_Finger31",
+   "ring_03_l": "ValveBiped.Bip01_L_Finger32",
+   "pinky_01_l": "ValveBiped.Bip01_L_Finger4",
+   "pinky_02_l": "ValveBiped.Bip01_L_Finger41",
+   "pinky_03_l": "ValveBiped.Bip01_L_Finger42",
+}
+
+
+def copy_animation_to_bones(armature_obj, bone_name, action):
+   pose_bone = armature_obj.pose.bones.get(bone_name)
+   if pose_bone is None:
+      print(f"Warning: Bone {bone_name} not found in the armature. Skipping animation.")
+      return
+
+   # Ensure the armature has an action to store the keyframes
+   if not armature_obj.animation_data:
+      armature_obj.animation_data_create()
+   if not armature_obj.animation_data.action:
+      armature_obj.animation_data.action = bpy.data.actions.new(name=f"{armature_obj.name}_Action")
+
+   for fcurve in action.fcurves:
+      path_split = fcurve.data_path.rsplit('.', 1)
+      if len(path_split) != 2:
+         # If the fcurve data path does not split into two parts, it's not valid for bone animation
+         continue
+
+      property = path_split[1]
+      bone_data_path = f'pose.bones["{bone_name}"].{property}'
+      bone_fcurve = armature_obj.animation_data.action.fcurves.find(bone_data_path, index=fcurve.array_index)
+
+      if bone_fcurve is None:
+         bone_fcurve = armature_obj.animation_data.action.fcurves.new(bone_data_path, index=fcurve.array_index)
+
+      copy_keyframes(fcurve, bone_fcurve)
+
+def copy_keyframes(source_fcurve, target_fcurve):
+   """Replace the keys of target_fcurve with those of source_fcurve using bulk foreach access"""
+   source_points = source_fcurve.keyframe_points
+   target_points = target_fcurve.keyframe_points
+   count = len(source_points)
+
+   target_points.clear()
+   if count:
+      target_points.add(count)
+
+      # Enum properties go through the same raw access as numbers, fall back per key if this build refuses it
+      for attribute in ("interpolation", "handle_left_type", "handle_right_type"):
+         buffer = np.empty(count, dtype=np.int32)
+         try:
+            source_points.foreach_get(attribute, buffer)
+            target_points.foreach_set(attribute, buffer)
+         except (TypeError, RuntimeError):
+            for source_point, target_point in zip(source_points, target_points):
+               setattr(target_point, attribute, getattr(source_point, attribute))
+
+      for attribute in ("co", "handle_left", "handle_right"):
+         buffer = np.empty(count * 2, dtype=np.float32)
+         source_points.foreach_get(attribute, buffer)
+         target_points.foreach_set(attribute, buffer)
+
+   target_fcurve.update()
+
+def write_keyframes(fcurve, frames, values):
+   """Key every (frame, value) pair on fcurve in one foreach_set"""
+   count = len(frames)
+   points = fcurve.keyframe_points
+   points.clear()
+   points.add(count)
+   co = np.empty((count, 2), dtype=np.float32)
+   co[:, 0] = frames
+   co[:, 1] = values
+   points.foreach_set("co", co.ravel())
+   fcurve.update()
+
+def sample_world_matrices(scene, objects, frames):
+   """Return the (frames, objects, 4, 4) world matrices of objects over frames, in one frame_set sweep"""
+   positions = {obj: position for position, obj in enumerate(bpy.data.objects)}
+   rows = np.array([positions[obj] for obj in objects], dtype=np.intp)
+   buffer = np.empty(len(bpy.data.objects) * 16, dtype=np.float32)
+   samples = np.empty((len(frames), len(objects), 4, 4), dtype=np.float64)
+
+   current_frame = scene.frame_current
+   for frame_index, frame in enumerate(frames):
+      scene.frame_set(int(frame))
+      # One call for every object; RNA matrices are column major
+      bpy.data.objects.foreach_get("matrix_world", buffer)
+      samples[frame_index] = buffer.reshape(-1, 4, 4)[rows].transpose(0, 2, 1)
+   scene.frame_set(current_frame)
+   return samples
+
+def matrices_to_quaternions(rotations):
+   """Convert (..., 3, 3) rotation matrices to (..., 4) w, x, y, z quaternions"""
+   m = rotations
+   trace = m[..., 0, 0] + m[..., 1, 1] + m[..., 2, 2]
+   quaternions = np.empty(m.shape[:-2] + (4,), dtype=np.float64)
+
+   # Shepperd's method: pick the largest of w, x, y, z to divide by
+   cases = np.argmax(np.stack([trace, m[..., 0, 0], m[..., 1, 1], m[..., 2, 2]], axis=-1), axis=-1)
+
+   c = cases == 0
+   s = np.sqrt(np.maximum(trace[c] + 1.0, 1e-12)) * 2.0
+   quaternions[c] = np.stack([0.25 * s, (m[c][:, 2, 1] - m[c][:, 1, 2]) / s, (m[c][:, 0, 2] - m[c][:, 2, 0]) / s, (m[c][:, 1, 0] - m[c][:, 0, 1]) / s], axis=-1)
+   c = cases == 1
+   s = np.sqrt(np.maximum(1.0 + m[c][:, 0, 0] - m[c][:, 1, 1] - m[c][:, 2, 2], 1e-12)) * 2.0
+   quaternions[c] = np.stack([(m[c][:, 2, 1] - m[c][:, 1, 2]) / s, 0.25 * s, (m[c][:, 0, 1] + m[c][:, 1, 0]) / s, (m[c][:, 0, 2] + m[c][:, 2, 0]) / s], axis=-1)
+   c = cases == 2
+   s = np.sqrt(np.maximum(1.0 + m[c][:, 1, 1] - m[c][:, 0, 0] - m[c][:, 2, 2], 1e-12)) * 2.0
+   quaternions[c] = np.stack([(m[c][:, 0, 2] - m[c][:, 2, 0]) / s, (m[c][:, 0, 1] + m[c][:, 1, 0]) / s, 0.25 * s, (m[c][:, 1, 2] + m[c][:, 2, 1]) / s], axis=-1)
+   c = cases == 3
+   s = np.sqrt(np.maximum(1.0 + m[c][:, 2, 2] - m[c][:, 0, 0] - m[c][:, 1, 1], 1e-12)) * 2.0
+   quaternions[c] = np.stack([(m[c][:, 1, 0] - m[c][:, 0, 1]) / s, (m[c][:, 0, 2] + m[c][:, 2, 0]) / s, (m[c][:, 1, 2] + m[c][:, 2, 1]) / s, 0.25 * s], axis=-1)
+   return quaternions
+
+def bake_empties_to_bones(context, armature_obj, baked_bones):
+   """Bake the world-space motion of empties onto pose bones.
+
+   baked_bones is a list of (empty, bone name). Every empty is sampled over the animated
+   frame range, then the matrices are converted to each pose bone's local (basis) space
+   with batched matrix math and written as location / quaternion / scale keys.
+   """
+   ranges = [empty_obj.animation_data.action.frame_range for empty_obj, bone_name in baked_bones
+             if empty_obj.animation_data and empty_obj.animation_data.action]
+   if not ranges:
+      print("No animated empties to bake.")
+      return
+   start = int(np.floor(min(r[0] for r in ranges)))
+   end = int(np.ceil(max(r[1] for r in ranges)))
+   frames = np.arange(start, end + 1, dtype=np.float64)
+
+   empties = [empty_obj for empty_obj, bone_name in baked_bones]
+   bones = [armature_obj.data.bones[bone_name] for empty_obj, bone_name in baked_bones]
+   bone_positions = {bone.name: position for position, bone in enumerate(bones)}
+
+   # Each bone keeps the offset it had from its empty when it was built
+   armature_world = np.array(armature_obj.matrix_world, dtype=np.float64)
+   rest_empties = sample_world_matrices(context.scene, empties, [context.scene.frame_current])[0]
+   bone_rest = np.array([np.array(bone.matrix_local, dtype=np.float64) for bone in bones])
+   offsets = np.linalg.inv(rest_empties) @ armature_world @ bone_rest
+
+   # Target pose matrices in armature space, (frames, bones, 4, 4)
+   world = sample_world_matrices(context.scene, empties, frames)
+   targets = np.linalg.inv(armature_world) @ world @ offsets
+
+   # basis = (parent_rest^-1 @ bone_rest)^-1 @ parent_pose^-1 @ pose
+   parent_rest = np.tile(np.eye(4), (len(bones), 1, 1))
+   parent_pose = np.tile(np.eye(4), (len(frames), len(bones), 1, 1))
+   for position, bone in enumerate(bones):
+      if bone.parent:
+         parent_rest[position] = np.array(bone.parent.matrix_local, dtype=np.float64)
+         parent_position = bone_positions.get(bone.parent.name)
+         if parent_position is not None:
+            parent_pose[:, position] = targets[:, parent_position]
+         else:
+            parent_pose[:, position] = parent_rest[position]
+   rest_relative = np.linalg.inv(parent_rest) @ bone_rest
+   basis = np.linalg.inv(rest_relative) @ np.linalg.inv(parent_pose) @ targets
+
+   location = basis[..., :3, 3]
+   scale = np.linalg.norm(basis[..., :3, :3], axis=-2)
+   quaternions = matrices_to_quaternions(basis[..., :3, :3] / scale[..., None, :])
+   # Keep consecutive quaternions in the same hemisphere so the curves don't flip
+   dots = np.einsum('fbi,fbi->fb', quaternions[1:], quaternions[:-1])
+   signs = np.cumprod(np.concatenate([np.ones((1, len(bones))), np.where(dots < 0.0, -1.0, 1.0)]), axis=0)
+   quaternions *= signs[..., None]
+
+   action = armature_obj.animation_data.action
+   for position, bone in enumerate(bones):
+      pose_bone = armature_obj.pose.bones[bone.name]
+      pose_bone.rotation_mode = 'QUATERNION'
+      channels = (("location", location), ("rotation_quaternion", quaternions), ("scale", scale))
+      for attribute, values in channels:
+         data_path = f'pose.bones["{bone.name}"].{attribute}'
+         for array_index in range(values.shape[-1]):
+            fcurve = action.fcurves.find(data_path, index=array_index)
+            if fcurve is None:
+               fcurve = action.fcurves.new(data_path, index=array_index, action_group=bone.name)
+            write_keyframes(fcurve, frames, values[:, position, array_index])
+
+def create_rigged_armature(context, bake_world_space=False):
+   root_empty = context.active_object
+
+   if not root_empty or root_empty.type != 'EMPTY':
+      print("Please select the root empty object.")
+      return
+
+   # Create an armature and enter edit mode
+   bpy.ops.object.armature_add()
+   armature_obj = context.object
+   armature_obj.show_in_front = True
+   bpy.context.view_layer.objects.active = armature_obj
+   bpy.ops.object.mode_set(mode='EDIT')
+
+   edit_bones = armature_obj.data.edit_bones
+
+   # Create bones from empties listed in the mapping
+   bone_mapping = {}
+   forci_profiler.count("objects", len(context.scene.objects))
+   for empty_obj in context.scene.objects:
+      if empty_obj.type == 'EMPTY':
+            bone_name = empty_to_bone_mapping.get(empty_obj.name, empty_obj.name)
+            bone = edit_bones.new(bone_name)
+            bone.head = empty_obj.matrix_world.translation
+            bone.tail = bone.head + Vector((0, 0, 0.1)) # Small offset to create the bone tail
+            bone_mapping[empty_obj] = bone
+
+   # Parent bones based on the empties' hierarchy
+   for empty_obj, bone in bone_mapping.items():
+      parent_empty = empty_obj.parent
+      if parent_empty and parent_empty in bone_mapping:
+            bone.parent = bone_mapping[parent_empty]
+            bone.use_connect = False  # You can set True if you want connected bones
+
+   # Edit bones are invalid once we leave edit mode, keep their final names
+   baked_bones = [(empty_obj, bone.name) for empty_obj, bone in bone_mapping.items()]
+
+   # Leave edit mode to save the bones
+   bpy.ops.object.mode_set(mode='OBJECT')
+   if not armature_obj.animation_data:
+      armature_obj.animation_data_create()
+   armature_action = bpy.data.actions.new(name="ArmatureAction")
+   armature_obj.animation_data.action = armature_action
+
+   # Switch to pose mode to apply pose bone transformations
+   bpy.ops.object.mode_set(mode='POSE')
+
+   if bake_world_space:
+      # Sample the empties' world matrices so differing hierarchies and rest frames are handled
+      bake_empties_to_bones(context, armature_obj, baked_bones)
+   else:
+      # Copy animations from empties to the corresponding bones in the armature
+      for empty_name, bone_name in empty_to_bone_mapping.items():
+         if empty_name in context.scene.objects:
+            empty_obj = context.scene.objects[empty_name]
+            if empty_obj.animation_data and empty_obj.animation_data.action:
+                  copy_animation_to_bones(armature_obj, bone_name, empty_obj.animation_data.action)
+
+   # Switch back to object mode
+   bpy.ops.object.mode_set(mode='OBJECT')
+
+class OBJECT_OT_CreateRiggedArmature(forci_lazy.OperatorImplementation):
+   @forci_profiler.profiled
+   def execute(self, context):
+      create_rigged_armature(context, self.bake_world_space)
+      return {'FINISHED'}
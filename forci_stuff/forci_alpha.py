@@ -0,0 +1,127 @@
+"""Tells from the pixels whether a texture is opaque, a cutout or really translucent"""
+
+import hashlib
+import math
+from collections import namedtuple
+import bpy
+import numpy as np
+from . import forci_profiler
+from . import forci_texture_hash
+
+OPAQUE = 'OPAQUE'
+BINARY = 'BINARY'
+TRANSLUCENT = 'TRANSLUCENT'
+
+# blend_method (EEVEE Legacy) and shadow_method for each kind of alpha. EEVEE Next (4.2+)
+# has no Alpha Clip: BINARY materials get Dithered, which is not a hard cutout there
+BLEND_METHODS = {OPAQUE: 'OPAQUE', BINARY: 'CLIP', TRANSLUCENT: 'BLEND'}
+SHADOW_METHODS = {OPAQUE: 'OPAQUE', BINARY: 'CLIP', TRANSLUCENT: 'HASHED'}
+
+# Alpha this close to 0 or 1 counts as fully transparent or opaque (8 bit rounding)
+ALPHA_EPSILON = 2 / 255
+# Images with more pixels are analyzed from a downscaled copy
+MAX_PIXELS = 1024 * 1024
+# Share of partially transparent pixels a cutout may have on its antialiased edges
+TRANSLUCENT_FRACTION = 0.02
+
+# min_alpha: lowest alpha, partial: share of pixels strictly between 0 and 1,
+# scale: how much the analyzed copy was shrunk per side (1.0 = full resolution)
+AlphaStats = namedtuple("AlphaStats", "min_alpha partial scale")
+
+FULLY_OPAQUE = AlphaStats(1.0, 0.0, 1.0)
+
+def classify(stats, translucent_fraction=TRANSLUCENT_FRACTION):
+   """OPAQUE, BINARY or TRANSLUCENT for the stats of one image"""
+   if stats.min_alpha >= 1.0 - ALPHA_EPSILON:
+      return OPAQUE
+   # Downscaling blends the cutout edges: the edge pixels' share grows with the scale
+   if stats.partial <= min(0.5, translucent_fraction * stats.scale):
+      return BINARY
+   return TRANSLUCENT
+
+def alpha_stats(alpha, scale=1.0):
+   """AlphaStats of a flat array of alpha values"""
+   if not alpha.size:
+      return FULLY_OPAQUE
+   partial = np.count_nonzero((alpha > ALPHA_EPSILON) & (alpha < 1.0 - ALPHA_EPSILON))
+   return AlphaStats(float(alpha.min()), partial / alpha.size, scale)
+
+def read_alpha(image, max_pixels=MAX_PIXELS):
+   """(alpha values, scale) of image, from a downscaled copy when it is larger than max_pixels.
+
+   None when the image has no pixels (missing file)."""
+   width, height = image.size
+   if not width or not height:
+      return None
+   channels = image.channels
+   if channels < 4:
+      return np.ones(0, dtype=np.float32), 1.0
+   scale = 1.0
+   source = image
+   if width * height > max_pixels:
+      scale = math.sqrt(width * height / max_pixels)
+      source = image.copy()
+      source.scale(max(1, round(width / scale)), max(1, round(height / scale)))
+   try:
+      width, height = source.size
+      # foreach_get into a float32 buffer is a plain copy, image.pixels[:] builds a Python list
+      pixels = np.empty(width * height * channels, dtype=np.float32)
+      source.pixels.foreach_get(pixels)
+   finally:
+      if source is not image:
+         bpy.data.images.remove(source)
+   forci_profiler.count("images_analyzed")
+   return pixels[channels - 1::channels], scale
+
+class AlphaAnalyzer:
+   """AlphaStats per image, cached by content so each texture is read once per session.
+
+   File images are keyed by the hash of the file (rehashed only when its size or mtime
+   changes), packed images by the hash of the packed data, each with the max_pixels it
+   was analyzed at. Generated or painted images are analyzed every time.
+   """
+
+   def __init__(self):
+      self.results = {}   # (content hash, max_pixels) -> AlphaStats
+      self.hashes = forci_texture_hash.TextureHashCache(None)
+      self.analyzed = 0
+      self.cached = 0
+
+   def content_key(self, image):
+      if image.is_dirty:
+         return None
+      if image.packed_file:
+         return "packed:" + hashlib.blake2b(image.packed_file.data, digest_size=20).hexdigest()
+      if image.source == 'FILE' and image.filepath:
+         return self.hashes.digest(bpy.path.abspath(image.filepath))
+      return None
+
+   def stats(self, image, max_pixels=MAX_PIXELS):
+      """AlphaStats of image, None if it cannot be read"""
+      if image.alpha_mode == 'NONE':
+         return FULLY_OPAQUE
+      content = self.content_key(image)
+      # Le même fichier analysé à une autre taille donne d'autres stats
+      key = None if content is None else (content, max_pixels)
+      if key is not None and key in self.results:
+         self.cached += 1
+         return self.results[key]
+      read = read_alpha(image, max_pixels)
+      if read is None:
+         return None
+      self.analyzed += 1
+      stats = alpha_stats(*read)
+      if key is not None:
+         self.results[key] = stats
+      return stats
+
+   def classify(self, image, max_pixels=MAX_PIXELS, translucent_fraction=TRANSLUCENT_FRACTION):
+      """OPAQUE, BINARY or TRANSLUCENT, None if the image cannot be read"""
+      stats = self.stats(image, max_pixels)
+      return None if stats is None else classify(stats, translucent_fraction)
+
+
+_analyzer = AlphaAnalyzer()
+
+def get_analyzer():
+   return _analyzer
@@ -0,0 +1,135 @@
+"""Plan batch edits as plain data, preview them as a diff, then apply them in one pass"""
+
+import bpy
+from . import forci_scene_index
+from . import forci_image_pool
+
+DIFF_TEXT_NAME = "FORCI Plan"
+
+def _label(datablock):
+   return f"{type(datablock).__name__} '{datablock.name}'"
+
+class ChangePlan:
+   """The full change set of an operator, computed before anything is modified.
+
+   Operators fill the plan while walking the scene read-only, then either show it
+   (dry run) or hand it to apply(), which runs every change in one batched pass and
+   updates the view layer once at the end.
+   """
+
+   def __init__(self, title):
+      self.title = title
+      self.renames = []          # (datablock, new name)
+      self.property_sets = []    # (owner, attribute, value, label)
+      self.image_replacements = []  # (material, image node name, image path)
+      self.links = []            # (material, from node name, from socket, to node name, to socket)
+      self.removals = []         # datablocks
+
+   def __len__(self):
+      return len(self.renames) + len(self.property_sets) + len(self.image_replacements) + len(self.links) + len(self.removals)
+
+   def rename(self, datablock, new_name):
+      if datablock.name != new_name:
+         self.renames.append((datablock, new_name))
+
+   def set_property(self, owner, attribute, value, label=None):
+      if getattr(owner, attribute) != value:
+         self.property_sets.append((owner, attribute, value, label or f"{owner!r}.{attribute}"))
+
+   def replace_image(self, material, node_name, image_path):
+      """Point the existing Image Texture node at image_path, loaded once however many nodes use it"""
+      self.image_replacements.append((material, node_name, image_path))
+
+   def link(self, material, from_node_name, from_socket, to_node_name, to_socket):
+      self.links.append((material, from_node_name, from_socket, to_node_name, to_socket))
+
+   def remove(self, datablock):
+      self.removals.append(datablock)
+
+   # --- Dry run --------------------------------------------------------------
+
+   def diff_lines(self):
+      lines = [f"# {self.title}: {len(self)} changes"]
+      lines += [f"~ rename {_label(datablock)} -> '{new_name}'" for datablock, new_name in self.renames]
+      lines += [f"~ set {label} = {value!r}" for owner, attribute, value, label in self.property_sets]
+      lines += [f"~ {_label(material)}: image of {node_name} -> '{image_path}'" for material, node_name, image_path in self.image_replacements]
+      lines += [f"+ {_label(material)}: link {from_node}.{from_socket} -> {to_node}.{to_socket}" for material, from_node, from_socket, to_node, to_socket in self.links]
+      lines += [f"- remove {_label(datablock)}" for datablock in self.removals]
+      return lines
+
+   def show(self):
+      """Write the diff to the 'FORCI Plan' text datablock and the console"""
+      text = bpy.data.texts.get(DIFF_TEXT_NAME) or bpy.data.texts.new(DIFF_TEXT_NAME)
+      diff = "\n".join(self.diff_lines())
+      text.from_string(diff)
+      print(diff)
+
+   # --- Apply ----------------------------------------------------------------
+
+   def apply(self, context):
+      index = forci_scene_index.get_index()
+      for owner, attribute, value, label in self.property_sets:
+         setattr(owner, attribute, value)
+
+      for material, node_name, image_path in self.image_replacements:
+         node = material.node_tree.nodes.get(node_name)
+         if node is None:
+            continue
+         node.image = forci_image_pool.load(image_path)
+         index.mark_dirty(material)
+
+      for material, from_node_name, from_socket, to_node_name, to_socket in self.links:
+         nodes = material.node_tree.nodes
+         from_node, to_node = nodes.get(from_node_name), nodes.get(to_node_name)
+         if from_node and to_node:
+            material.node_tree.links.new(from_node.outputs[from_socket], to_node.inputs[to_socket])
+            index.mark_dirty(material)
+
+      self.apply_renames()
+
+      if self.removals:
+         bpy.data.batch_remove(self.removals)
+
+      # One update for the whole batch
+      context.view_layer.update()
+
+   def apply_renames(self):
+      # A target name still held by another renamed datablock would get a .001 suffix:
+      # move those out of the way first so swaps and chains end up with the planned names
+      renamed = {datablock for datablock, new_name in self.renames}
+      pending = []
+      for datablock, new_name in self.renames:
+         collection = _collection_of(datablock)
+         holder = collection.get(new_name) if collection is not None else None
+         if holder is not None and holder in renamed:
+            datablock.name = f"{new_name}__forci_tmp"
+            pending.append((datablock, new_name))
+         else:
+            datablock.name = new_name
+      for datablock, new_name in pending:
+         datablock.name = new_name
+
+_COLLECTIONS = (
+   (bpy.types.Material, "materials"),
+   (bpy.types.Collection, "collections"),
+   (bpy.types.Image, "images"),
+   (bpy.types.Object, "objects"),
+   (bpy.types.Mesh, "meshes"),
+   (bpy.types.NodeTree, "node_groups"),
+)
+
+def _collection_of(datablock):
+   for id_type, collection_name in _COLLECTIONS:
+      if isinstance(datablock, id_type):
+         return getattr(bpy.data, collection_name)
+   return None
+
+def run_plan(operator, context, plan, dry_run):
+   """Show or apply the plan and report the outcome through the operator"""
+   if dry_run:
+      plan.show()
+      operator.report({'INFO'}, f"{plan.title}: {len(plan)} planned changes, see the '{DIFF_TEXT_NAME}' text")
+   else:
+      plan.apply(context)
+      operator.report({'INFO'}, f"{plan.title}: applied {len(plan)} changes")
+   return {'FINISHED'}
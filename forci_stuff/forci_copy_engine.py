@@ -0,0 +1,69 @@
+"""Copies planned texture files on a thread pool with progress feedback"""
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from . import forci_profiler
+
+# File copies are I/O bound, a few more workers than cores keeps network shares busy
+MAX_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+
+# How long iter_copy waits for a copy to finish before handing control back
+POLL_SECONDS = 0.005
+
+def copy_files(pairs, window_manager=None, max_workers=MAX_WORKERS, copy_function=shutil.copy2):
+   """Copy the (source, destination) pairs on a bounded thread pool.
+
+   Only file I/O runs on the workers: the caller decides every destination up front
+   and relinks images on the main thread once this returns. Progress is reported
+   through window_manager when given. Returns the list of ((source, destination), error)
+   for the copies that failed.
+   """
+   pairs = list(pairs)
+   if window_manager and pairs:
+      window_manager.progress_begin(0, len(pairs))
+   steps = iter_copy(pairs, max_workers, copy_function)
+   try:
+      while True:
+         done, total = next(steps)
+         if window_manager:
+            window_manager.progress_update(done)
+   except StopIteration as stop:
+      return stop.value
+   finally:
+      if window_manager and pairs:
+         window_manager.progress_end()
+
+def iter_copy(pairs, max_workers=MAX_WORKERS, copy_function=shutil.copy2):
+   """copy_files as a generator for the sliced operators: yields (done, total) without
+   blocking for more than POLL_SECONDS and returns the failures.
+
+   Closing it early drops the copies not started yet and waits for the running ones,
+   so no half written file is left behind.
+   """
+   pairs = list(pairs)
+   failures = []
+   if not pairs:
+      return failures
+
+   pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs))))
+   futures = {pool.submit(copy_function, source, destination): (source, destination) for source, destination in pairs}
+   pending = set(futures)
+   done = 0
+   try:
+      while pending:
+         finished, pending = wait(pending, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+         for future in finished:
+            done += 1
+            error = future.exception()
+            if error is not None:
+               failures.append((futures[future], error))
+            else:
+               forci_profiler.count("files_copied")
+               forci_profiler.count("bytes_written", os.path.getsize(futures[future][1]))
+         yield done, len(pairs)
+   finally:
+      for future in pending:
+         future.cancel()
+      pool.shutdown(wait=True)
+   return failures
@@ -0,0 +1,351 @@
+"""NumPy DDS decoder and batch DDS to PNG conversion, no texconv needed"""
+
+import multiprocessing
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+# How long iter_convert waits for a conversion before handing control back
+POLL_SECONDS = 0.005
+
+class DDSError(ValueError):
+   pass
+
+DDPF_ALPHAPIXELS = 0x1
+DDPF_ALPHA = 0x2
+DDPF_FOURCC = 0x4
+DDPF_RGB = 0x40
+DDPF_LUMINANCE = 0x20000
+DDSD_PITCH = 0x8
+
+# FourCC / DXGI format -> block compression scheme
+FOURCC_FORMATS = {
+   b'DXT1': 'BC1',
+   b'DXT2': 'BC2',
+   b'DXT3': 'BC2',
+   b'DXT4': 'BC3',
+   b'DXT5': 'BC3',
+   b'ATI1': 'BC4',
+   b'BC4U': 'BC4',
+   b'ATI2': 'BC5',
+   b'BC5U': 'BC5',
+}
+DXGI_FORMATS = {
+   71: 'BC1', 72: 'BC1',
+   74: 'BC2', 75: 'BC2',
+   77: 'BC3', 78: 'BC3',
+   80: 'BC4',
+   83: 'BC5',
+   98: 'BC7', 99: 'BC7',
+}
+# Uncompressed DXGI formats as (bit count, R, G, B, A masks)
+DXGI_MASKS = {
+   28: (32, 0x000000ff, 0x0000ff00, 0x00ff0000, 0xff000000),   # R8G8B8A8_UNORM
+   29: (32, 0x000000ff, 0x0000ff00, 0x00ff0000, 0xff000000),   # R8G8B8A8_UNORM_SRGB
+   87: (32, 0x00ff0000, 0x0000ff00, 0x000000ff, 0xff000000),   # B8G8R8A8_UNORM
+   88: (32, 0x00ff0000, 0x0000ff00, 0x000000ff, 0),            # B8G8R8X8_UNORM
+   91: (32, 0x00ff0000, 0x0000ff00, 0x000000ff, 0xff000000),   # B8G8R8A8_UNORM_SRGB
+   61: (8, 0xff, 0, 0, 0),                                     # R8_UNORM
+}
+BLOCK_SIZES = {'BC1': 8, 'BC2': 16, 'BC3': 16, 'BC4': 8, 'BC5': 16, 'BC7': 16}
+
+# --- Block decoders -------------------------------------------------------------
+# Each decoder takes the (n, block size) uint8 array of blocks and returns (n, 16, 4) RGBA
+
+def _unpack_565(color):
+   r = (color >> 11) & 31
+   g = (color >> 5) & 63
+   b = color & 31
+   return np.stack([(r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)], axis=-1).astype(np.int32)
+
+def _decode_color(blocks, punchthrough):
+   """Decode the 8 byte BC1 color part, with 1 bit alpha when punchthrough is set"""
+   count = len(blocks)
+   c0 = blocks[:, 0].astype(np.int32) | (blocks[:, 1].astype(np.int32) << 8)
+   c1 = blocks[:, 2].astype(np.int32) | (blocks[:, 3].astype(np.int32) << 8)
+   rgb0 = _unpack_565(c0)
+   rgb1 = _unpack_565(c1)
+
+   four_colors = (c0 > c1) if punchthrough else np.ones(count, dtype=bool)
+   mode = four_colors[:, None]
+   palette = np.empty((count, 4, 4), dtype=np.int32)
+   palette[:, 0, :3] = rgb0
+   palette[:, 1, :3] = rgb1
+   palette[:, 2, :3] = np.where(mode, (2 * rgb0 + rgb1) // 3, (rgb0 + rgb1) // 2)
+   palette[:, 3, :3] = np.where(mode, (rgb0 + 2 * rgb1) // 3, 0)
+   palette[:, :, 3] = 255
+   palette[:, 3, 3] = np.where(four_colors, 255, 0)
+
+   bits = np.ascontiguousarray(blocks[:, 4:8]).view('<u4').reshape(count)
+   indices = (bits[:, None] >> (np.arange(16, dtype=np.uint32) * 2)) & 3
+   return palette[np.arange(count)[:, None], indices.astype(np.intp)]
+
+def _decode_interpolated(blocks):
+   """Decode a BC3 alpha / BC4 channel block, returns (n, 16) values"""
+   count = len(blocks)
+   a0 = blocks[:, 0].astype(np.int32)[:, None]
+   a1 = blocks[:, 1].astype(np.int32)[:, None]
+
+   steps = np.arange(1, 7, dtype=np.int32)
+   eight = ((7 - steps) * a0 + steps * a1) // 7
+   steps = np.arange(1, 5, dtype=np.int32)
+   six = np.concatenate([((5 - steps) * a0 + steps * a1) // 5, np.zeros((count, 1), np.int32), np.full((count, 1), 255, np.int32)], axis=1)
+   palette = np.concatenate([a0, a1, np.where(a0 > a1, eight, six)], axis=1)
+
+   bits = np.zeros(count, dtype=np.uint64)
+   for byte in range(6):
+      bits |= blocks[:, 2 + byte].astype(np.uint64) << np.uint64(8 * byte)
+   indices = (bits[:, None] >> (np.arange(16, dtype=np.uint64) * np.uint64(3))) & np.uint64(7)
+   return palette[np.arange(count)[:, None], indices.astype(np.intp)]
+
+def _decode_bc1(blocks):
+   return _decode_color(blocks, punchthrough=True)
+
+def _decode_bc2(blocks):
+   pixels = _decode_color(blocks[:, 8:16], punchthrough=False)
+   alpha = np.empty((len(blocks), 16), dtype=np.int32)
+   alpha[:, 0::2] = blocks[:, :8] & 15
+   alpha[:, 1::2] = blocks[:, :8] >> 4
+   pixels[:, :, 3] = alpha * 17
+   return pixels
+
+def _decode_bc3(blocks):
+   pixels = _decode_color(blocks[:, 8:16], punchthrough=False)
+   pixels[:, :, 3] = _decode_interpolated(blocks[:, :8])
+   return pixels
+
+def _decode_bc4(blocks):
+   value = _decode_interpolated(blocks)
+   pixels = np.empty((len(blocks), 16, 4), dtype=np.int32)
+   pixels[:, :, 0] = value
+   pixels[:, :, 1] = value
+   pixels[:, :, 2] = value
+   pixels[:, :, 3] = 255
+   return pixels
+
+def _decode_bc5(blocks):
+   # Two channel normal maps: rebuild Z so the result can be used directly as a normal map
+   x = _decode_interpolated(blocks[:, :8])
+   y = _decode_interpolated(blocks[:, 8:16])
+   nx = x / 127.5 - 1.0
+   ny = y / 127.5 - 1.0
+   nz = np.sqrt(np.clip(1.0 - nx * nx - ny * ny, 0.0, 1.0))
+   pixels = np.empty((len(blocks), 16, 4), dtype=np.int32)
+   pixels[:, :, 0] = x
+   pixels[:, :, 1] = y
+   pixels[:, :, 2] = np.rint((nz + 1.0) * 127.5)
+   pixels[:, :, 3] = 255
+   return pixels
+
+BLOCK_DECODERS = {
+   'BC1': _decode_bc1,
+   'BC2': _decode_bc2,
+   'BC3': _decode_bc3,
+   'BC4': _decode_bc4,
+   'BC5': _decode_bc5,
+}
+
+def _blocks_to_image(pixels, width, height):
+   blocks_x = (width + 3) // 4
+   blocks_y = (height + 3) // 4
+   image = pixels.reshape(blocks_y, blocks_x, 4, 4, 4).transpose(0, 2, 1, 3, 4).reshape(blocks_y * 4, blocks_x * 4, 4)
+   return image[:height, :width]
+
+def _mask_channel(values, mask, default):
+   if not mask:
+      return np.full(values.shape, default, dtype=np.int64)
+   shift = (mask & -mask).bit_length() - 1
+   maximum = mask >> shift
+   return ((values & mask) >> shift) * 255 // maximum
+
+def _decode_uncompressed(data, offset, width, height, pitch, bit_count, masks, luminance):
+   pixel_size = bit_count // 8
+   if pixel_size not in (1, 2, 3, 4):
+      raise DDSError(f"Unsupported bit count {bit_count}")
+   row_size = width * pixel_size
+   if pitch < row_size:
+      pitch = row_size
+   rows = np.frombuffer(data, dtype=np.uint8, count=pitch * height, offset=offset).reshape(height, pitch)[:, :row_size]
+   raw = rows.reshape(height, width, pixel_size).astype(np.int64)
+   values = np.zeros((height, width), dtype=np.int64)
+   for byte in range(pixel_size):
+      values |= raw[:, :, byte] << (8 * byte)
+
+   r_mask, g_mask, b_mask, a_mask = masks
+   image = np.empty((height, width, 4), dtype=np.int64)
+   image[:, :, 0] = _mask_channel(values, r_mask, 0)
+   # L8 et R8 n'ont qu'un canal : c'est du gris, pas du rouge
+   if luminance or not (g_mask or b_mask):
+      image[:, :, 1] = image[:, :, 0]
+      image[:, :, 2] = image[:, :, 0]
+   else:
+      image[:, :, 1] = _mask_channel(values, g_mask, 0)
+      image[:, :, 2] = _mask_channel(values, b_mask, 0)
+   image[:, :, 3] = _mask_channel(values, a_mask, 255)
+   return image
+
+def read_dds(path):
+   """Decode the top mip level of a DDS file into a (height, width, 4) uint8 RGBA array"""
+   with open(path, 'rb') as stream:
+      data = stream.read()
+   if len(data) < 128 or data[:4] != b'DDS ':
+      raise DDSError(f"{path} is not a DDS file")
+
+   size, flags, height, width, pitch = struct.unpack_from('<5I', data, 4)
+   pf_flags, fourcc, bit_count, r_mask, g_mask, b_mask, a_mask = struct.unpack_from('<I4s5I', data, 80)
+   offset = 128
+
+   block_format = None
+   masks = None
+   if pf_flags & DDPF_FOURCC:
+      if fourcc == b'DX10':
+         dxgi_format = struct.unpack_from('<I', data, 128)[0]
+         offset = 148
+         if dxgi_format in DXGI_MASKS:
+            bit_count, *masks = DXGI_MASKS[dxgi_format]
+         else:
+            block_format = DXGI_FORMATS.get(dxgi_format)
+            if block_format is None:
+               raise DDSError(f"Unsupported DXGI format {dxgi_format} in {path}")
+      else:
+         block_format = FOURCC_FORMATS.get(fourcc)
+         if block_format is None:
+            raise DDSError(f"Unsupported FourCC {fourcc!r} in {path}")
+   else:
+      masks = [r_mask, g_mask, b_mask, a_mask if pf_flags & (DDPF_ALPHAPIXELS | DDPF_ALPHA) else 0]
+
+   if block_format is None:
+      if not flags & DDSD_PITCH:
+         pitch = 0
+      image = _decode_uncompressed(data, offset, width, height, pitch, bit_count, masks, pf_flags & DDPF_LUMINANCE)
+      return image.astype(np.uint8)
+
+   decoder = BLOCK_DECODERS.get(block_format)
+   if decoder is None:
+      raise DDSError(f"{block_format} textures cannot be decoded by forci_dds ({path})")
+   block_count = ((width + 3) // 4) * ((height + 3) // 4)
+   block_size = BLOCK_SIZES[block_format]
+   if len(data) < offset + block_count * block_size:
+      raise DDSError(f"{path} is truncated")
+   blocks = np.frombuffer(data, dtype=np.uint8, count=block_count * block_size, offset=offset).reshape(block_count, block_size)
+   return _blocks_to_image(decoder(blocks), width, height).astype(np.uint8)
+
+def unsupported_format(path):
+   """Name of the compression of a DDS file read_dds cannot decode (e.g. 'BC7'), None otherwise.
+
+   Only reads the header, so the operators can sort these files out before converting.
+   """
+   try:
+      with open(path, 'rb') as stream:
+         header = stream.read(148)
+   except OSError:
+      return None
+   if len(header) < 128 or header[:4] != b'DDS ':
+      return None
+   pf_flags, fourcc = struct.unpack_from('<I4s', header, 80)
+   if not pf_flags & DDPF_FOURCC:
+      return None
+   if fourcc == b'DX10':
+      if len(header) < 148:
+         return None
+      dxgi_format = struct.unpack_from('<I', header, 128)[0]
+      if dxgi_format in DXGI_MASKS:
+         return None
+      block_format = DXGI_FORMATS.get(dxgi_format, f"DXGI format {dxgi_format}")
+   else:
+      block_format = FOURCC_FORMATS.get(fourcc, f"FourCC {fourcc.decode('latin-1')}")
+   return None if block_format in BLOCK_DECODERS else block_format
+
+# --- PNG output -----------------------------------------------------------------
+
+def _png_chunk(tag, payload):
+   return struct.pack('>I', len(payload)) + tag + payload + struct.pack('>I', zlib.crc32(tag + payload) & 0xffffffff)
+
+def write_png(path, image):
+   """Write a (height, width, 4) uint8 array as an RGBA PNG, atomically"""
+   height, width = image.shape[:2]
+   raw = np.zeros((height, 1 + width * 4), dtype=np.uint8)
+   raw[:, 1:] = image.reshape(height, width * 4)
+   payload = b''.join([
+      b'\x89PNG\r\n\x1a\n',
+      _png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)),
+      _png_chunk(b'IDAT', zlib.compress(raw.tobytes(), 6)),
+      _png_chunk(b'IEND', b''),
+   ])
+   temp_path = path + ".tmp"
+   with open(temp_path, 'wb') as stream:
+      stream.write(payload)
+   os.replace(temp_path, path)
+
+# --- Batch conversion -----------------------------------------------------------
+
+def is_converted(source, destination):
+   """Output cache: a PNG newer than its DDS source does not need converting again"""
+   try:
+      return os.path.getmtime(destination) >= os.path.getmtime(source)
+   except OSError:
+      return False
+
+def convert_to_png(source, destination):
+   write_png(destination, read_dds(source))
+   return destination
+
+def _convert_job(job):
+   source, destination = job
+   try:
+      convert_to_png(source, destination)
+      return None
+   except Exception as error:
+      return f"{type(error).__name__}: {error}"
+
+def iter_convert(jobs, max_workers=None, python_executable=None):
+   """Convert (dds path, png path) jobs on a process pool, skipping up to date outputs.
+
+   python_executable is needed on Blender builds where sys.executable is Blender itself.
+   Falls back to converting in process if the pool cannot be started.
+   A generator for the sliced operators: yields (done, total) and returns the list of
+   ((source, destination), error message) for the failed jobs. Closing it early waits
+   for the conversions in progress.
+   """
+   jobs = [job for job in jobs if not is_converted(*job)]
+   if not jobs:
+      return []
+
+   errors = {}
+   pool = None
+   if len(jobs) > 1:
+      context = multiprocessing.get_context('spawn')
+      if python_executable:
+         context.set_executable(python_executable)
+      try:
+         pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+         futures = {pool.submit(_convert_job, job): job for job in jobs}
+      except Exception as error:
+         print(f"DDS conversion pool unavailable ({error}), converting in process")
+         if pool is not None:
+            pool.shutdown(wait=False)
+         pool = None
+   if pool is None:
+      for done, job in enumerate(jobs, 1):
+         errors[job] = _convert_job(job)
+         yield done, len(jobs)
+   else:
+      pending = set(futures)
+      try:
+         while pending:
+            finished, pending = wait(pending, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+            for future in finished:
+               try:
+                  errors[futures[future]] = future.result()
+               except Exception:
+                  # The pool broke (a worker died or could not start), convert it here instead
+                  errors[futures[future]] = _convert_job(futures[future])
+            yield len(errors), len(jobs)
+      finally:
+         for future in pending:
+            future.cancel()
+         pool.shutdown(wait=True)
+   return [(job, errors[job]) for job in jobs if errors.get(job)]
@@ -0,0 +1,96 @@
+"""Loads each texture file at most once, shared by every FORCI texture operator"""
+
+import os
+import bpy
+from . import forci_profiler
+from . import forci_scene_index
+
+def normalize_path(filepath):
+   """Absolute, normalized path; case-folded where the filesystem ignores case"""
+   return os.path.normcase(os.path.normpath(bpy.path.abspath(filepath)))
+
+class ForciImagePool:
+   """Image datablocks by normalized absolute path and, when known, by content hash.
+
+   images.load(check_existing=True) compares the raw filepath strings, so "//tex.png",
+   "C:/Tex.png" and a copy with the same pixels each get their own datablock and pixel
+   buffer. The images already in the file are indexed on first use, then every load()
+   is a dict lookup; only misses reach bpy.data.images.load.
+   """
+
+   def __init__(self):
+      self.built = False
+      self.count = 0      # len(bpy.data.images) when last seen, fewer means some were removed
+      self.by_path = {}   # normalized path -> image
+      self.by_hash = {}   # content hash -> image
+      self.aliases = {}   # normalized path -> image holding the same pixels under another path
+
+   def invalidate(self):
+      self.__init__()
+
+   def build(self):
+      self.by_path.clear()
+      self.by_hash.clear()
+      self.aliases.clear()
+      for image in bpy.data.images:
+         if image.source == 'FILE' and image.filepath:
+            self.by_path.setdefault(normalize_path(image.filepath), image)
+      self.count = len(bpy.data.images)
+      self.built = True
+
+   def load(self, filepath, content_hash=None):
+      """Return the image for filepath, loading the file only if no image holds it yet"""
+      if not self.built or len(bpy.data.images) < self.count:
+         self.build()
+      key = normalize_path(filepath)
+      image = self._alive(self.by_path.get(key), key) or self._alive(self.aliases.get(key))
+      if image is None and content_hash:
+         image = self._alive(self.by_hash.get(content_hash))
+         if image is not None:
+            self.aliases[key] = image
+      if image is None:
+         forci_profiler.count("images_loaded")
+         image = self.by_path[key] = bpy.data.images.load(filepath, check_existing=True)
+      else:
+         forci_profiler.count("images_reused")
+      if content_hash:
+         self.by_hash[content_hash] = image
+      self.count = len(bpy.data.images)
+      return image
+
+   def _alive(self, image, key=None):
+      """The cached image, or None if it was removed or now points at another file"""
+      if image is None:
+         return None
+      try:
+         # Un pointeur vers une image supprimée lève ReferenceError, ou pointe ailleurs une fois réutilisé
+         if bpy.data.images.get(image.name) != image:
+            return None
+         if key is not None and normalize_path(image.filepath) != key:
+            return None
+      except ReferenceError:
+         return None
+      return image
+
+   def check_removed(self, depsgraph=None):
+      """Drop the pool once images were removed, their datablocks must not be handed out again"""
+      if self.built and len(bpy.data.images) < self.count:
+         self.invalidate()
+
+
+_pool = ForciImagePool()
+
+def get_pool():
+   """Return the shared pool, reset by the scene index's handlers on load, undo, redo and image removals"""
+   forci_scene_index.watch(_pool.invalidate, _pool.check_removed)
+   return _pool
+
+def load(filepath, content_hash=None):
+   return get_pool().load(filepath, content_hash)
+
+def register():
+   forci_scene_index.watch(_pool.invalidate, _pool.check_removed)
+
+def unregister():
+   forci_scene_index.unwatch(_pool.invalidate, _pool.check_removed)
+   _pool.invalidate()
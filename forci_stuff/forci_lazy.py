@@ -0,0 +1,98 @@
+"""Defers loading the operator implementations and their heavy helpers (NumPy, thread pools, hashing) until first use"""
+
+import importlib
+import importlib.util
+import os
+import sys
+
+# Set FORCI_EAGER_IMPORTS=1 to load everything up front, e.g. to compare both with benchmarks/startup.py
+EAGER = bool(os.environ.get("FORCI_EAGER_IMPORTS"))
+
+# Names lazy_import returned a module for that has not been executed yet
+_deferred = set()
+
+class _DeferredLoader:
+   """The module's own loader, noting when LazyLoader finally executes the module"""
+
+   def __init__(self, loader, name):
+      self.loader = loader
+      self.name = name
+
+   def __getattr__(self, name):
+      return getattr(self.loader, name)
+
+   def create_module(self, spec):
+      return self.loader.create_module(spec)
+
+   def exec_module(self, module):
+      _deferred.discard(self.name)
+      self.loader.exec_module(module)
+
+def lazy_import(name, package=None):
+   """Return the module, only executed on first attribute access.
+
+   Used for the helpers the operators need in execute() but the panels never touch,
+   so NumPy or the copy and hash engines are only imported by the operators using them.
+   A relative name (".forci_dds") is resolved against package, as in import_module.
+   """
+   name = importlib.util.resolve_name(name, package)
+   module = sys.modules.get(name)
+   if module is not None:
+      return module
+   if EAGER:
+      return importlib.import_module(name)
+   spec = importlib.util.find_spec(name)
+   if spec is None:
+      raise ImportError(f"No module named '{name}'", name=name)
+   loader = importlib.util.LazyLoader(_DeferredLoader(spec.loader, name))
+   spec.loader = loader
+   module = importlib.util.module_from_spec(spec)
+   sys.modules[name] = module
+   _deferred.add(name)
+   loader.exec_module(module)
+   return module
+
+def is_loaded(name):
+   """False while name is imported but still waiting for its first attribute access"""
+   return name in sys.modules and name not in _deferred
+
+class LazyOperator:
+   """Mixin for the operators registered by the FORCI STUFF package.
+
+   They only declare the bl_ attributes, the properties and poll(). implementation
+   names the OperatorImplementation doing the work ("module.Class", the module being
+   in the operator's package): its module is imported by the first execute() or
+   steps(), not when the add-on is enabled.
+   """
+   implementation = ""
+
+   def implement(self):
+      module_name, _, class_name = self.implementation.rpartition(".")
+      package = type(self).__module__.rpartition(".")[0]
+      return getattr(importlib.import_module("." + module_name, package), class_name)(self)
+
+   def execute(self, context):
+      return self.implement().execute(context)
+
+   def steps(self, context):
+      return self.implement().steps(context)
+
+class OperatorImplementation:
+   """Base of the classes doing a LazyOperator's work, created around the operator on each call.
+
+   Attributes it does not define are read from the operator (properties, report(),
+   bl_label...), and so are the assignments to the operator's properties; anything
+   else it sets only lives as long as the call.
+   """
+
+   def __init__(self, operator):
+      object.__setattr__(self, "operator", operator)
+
+   def __getattr__(self, name):
+      return getattr(self.operator, name)
+
+   def __setattr__(self, name, value):
+      if hasattr(self.operator, name):
+         setattr(self.operator, name, value)
+      else:
+         object.__setattr__(self, name, value)
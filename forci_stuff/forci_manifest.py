@@ -0,0 +1,162 @@
+"""Remembers which generic name each texture got, so repeated or interrupted runs resume instead of starting over"""
+
+import functools
+import os
+import sqlite3
+import time
+from . import forci_profiler
+from . import forci_texture_hash
+
+MANIFEST_FILENAME = "forci_manifest.sqlite"
+
+PLANNED = "planned"
+COPIED = "copied"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS textures (
+   source TEXT PRIMARY KEY,
+   content_hash TEXT,
+   generic_name TEXT NOT NULL,
+   status TEXT NOT NULL,
+   updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS textures_hash ON textures (content_hash);
+"""
+
+@functools.lru_cache(maxsize=None)
+def _source_key(path):
+   return os.path.normcase(os.path.abspath(path))
+
+class TextureManifest:
+   """Original path -> (content hash, generic name, copy status), in the destination's .forci folder.
+
+   A texture keeps its generic name from one run to the next as long as its content
+   is unchanged, and identical contents share one name. The assignments are committed
+   before the copies start: after a crash the rows still marked planned are copied
+   again, unless a complete copy is already there.
+   """
+
+   def __init__(self, folder):
+      self.folder = folder
+      self.path = forci_texture_hash.sidecar_path(folder, MANIFEST_FILENAME)
+      try:
+         self.connection = self._connect()
+      except sqlite3.DatabaseError as error:
+         # Not a manifest we can read: keep it aside and start a new one
+         print(f"Unreadable manifest {self.path} ({error}), starting a new one")
+         os.replace(self.path, self.path + ".corrupt")
+         self.connection = self._connect()
+      self.rows = {}      # source key -> [content hash, generic name, status]
+      self.by_hash = {}   # content hash -> generic name
+      for source, content_hash, generic_name, status in self.connection.execute(
+            "SELECT source, content_hash, generic_name, status FROM textures"):
+         self.rows[source] = [content_hash, generic_name, status]
+         if content_hash:
+            self.by_hash.setdefault(content_hash, generic_name)
+      self.existing = None
+      self.pending = []   # rows assigned since the last commit
+
+   def _connect(self):
+      connection = sqlite3.connect(self.path)
+      try:
+         connection.executescript(_SCHEMA)
+      except sqlite3.DatabaseError:
+         connection.close()
+         raise
+      return connection
+
+   def close(self):
+      self.commit()
+      self.connection.close()
+
+   def reserve_names(self, allocator):
+      """Keep the allocator from handing out a name already promised to a texture"""
+      for content_hash, generic_name, status in self.rows.values():
+         allocator.reserve(generic_name)
+
+   def generic_name(self, source, content_hash):
+      """The name source got in an earlier run, None if it is new or its content changed"""
+      row = self.rows.get(_source_key(source))
+      if row and row[0] == content_hash:
+         return row[1]
+      if content_hash:
+         return self.by_hash.get(content_hash)
+      return None
+
+   def in_place(self, source, generic_name):
+      """source is the destination file itself, e.g. on a scene already relinked by a previous run"""
+      return _source_key(source) == _source_key(os.path.join(self.folder, generic_name))
+
+   def assign(self, source, content_hash, generic_name):
+      if self.in_place(source, generic_name):
+         return
+      key = _source_key(source)
+      row = self.rows.get(key)
+      if row and row[0] == content_hash and row[1] == generic_name:
+         return
+      self.rows[key] = [content_hash, generic_name, PLANNED]
+      if content_hash:
+         self.by_hash.setdefault(content_hash, generic_name)
+      self.pending.append((key, content_hash, generic_name, PLANNED, time.time()))
+
+   def needs_copy(self, source, generic_name):
+      """False when the destination already holds a complete copy of source"""
+      if self.existing is None:
+         # One listing of the destination instead of a stat per texture
+         with os.scandir(self.folder) as entries:
+            self.existing = {entry.name for entry in entries}
+      if generic_name not in self.existing:
+         return True
+      if self.in_place(source, generic_name):
+         return False
+      row = self.rows.get(_source_key(source))
+      if row and row[1] == generic_name and row[2] == COPIED:
+         return False
+      # Planned by a run that stopped: keep the copy if it got to the end
+      forci_profiler.count("files_stated")
+      try:
+         return os.path.getsize(os.path.join(self.folder, generic_name)) != os.path.getsize(source)
+      except OSError:
+         return True
+
+   def commit(self):
+      """Write the planned names before copying, so an interrupted run finds them"""
+      self._flush()
+      self.connection.commit()
+
+   def _flush(self):
+      if self.pending:
+         self.connection.executemany(
+            "INSERT OR REPLACE INTO textures (source, content_hash, generic_name, status, updated) VALUES (?, ?, ?, ?, ?)",
+            self.pending)
+         self.pending = []
+
+   def record_copies(self, pairs, failures):
+      """Set the status of the (source, destination) pairs copied by this run"""
+      self._flush()
+      failed = {pair for pair, error in failures}
+      now = time.time()
+      updates = []
+      for source, destination in pairs:
+         status = FAILED if (source, destination) in failed else COPIED
+         key = _source_key(source)
+         row = self.rows.get(key)
+         if row and row[1] == os.path.basename(destination):
+            row[2] = status
+            updates.append((status, now, key))
+      self.connection.executemany("UPDATE textures SET status = ?, updated = ? WHERE source = ?", updates)
+      self.connection.commit()
+
+   def mark_copied(self, sources):
+      """Rows whose copy turned out to be already there"""
+      self._flush()
+      now = time.time()
+      keys = [_source_key(source) for source in sources]
+      for key in keys:
+         if key in self.rows:
+            self.rows[key][2] = COPIED
+      self.connection.executemany("UPDATE textures SET status = ?, updated = ? WHERE source = ?", [(COPIED, now, key) for key in keys])
+
+def open_manifest(folder):
+   return TextureManifest(folder)
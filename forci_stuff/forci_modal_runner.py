@@ -0,0 +1,118 @@
+"""Runs the long FORCI operators in short slices, with progress, ETA and ESC to cancel"""
+
+import time
+import traceback
+import bpy
+from . import forci_profiler
+
+# Work done per timer tick, short enough for the viewport to stay responsive
+SLICE_SECONDS = 0.008
+TIMER_INTERVAL = 0.01
+
+def drain(steps):
+   """Run a steps generator to the end in one go and return its result"""
+   try:
+      while True:
+         next(steps)
+   except StopIteration as stop:
+      return stop.value
+
+def format_seconds(seconds):
+   minutes, seconds = divmod(int(seconds + 0.5), 60)
+   return f"{minutes}:{seconds:02d}" if minutes else f"{seconds} s"
+
+class ForciSlicedOperator:
+   """Mixin for operators whose work is the generator steps(context), which they define.
+
+   steps() yields between units of work: a string starts a new phase, (done, total)
+   reports progress within it, anything else is just a point where the work may pause.
+   Its return value is the operator result.
+
+   execute() (scripts, the batch runner, the benchmarks) runs it in one go. invoke()
+   (the panel buttons) runs it from a timer in slices of SLICE_SECONDS, with progress
+   and an ETA in the header, and cancels on ESC by closing the generator. The steps
+   change the scene only in stretches that do not yield, so a cancel never stops a
+   relink or a cleanup half way; file work in progress is finished, the rest dropped.
+
+   context is only valid until the first yield, use bpy.context after it.
+   """
+
+   @forci_profiler.profiled
+   def execute(self, context):
+      return drain(self.steps(context)) or {'FINISHED'}
+
+   def invoke(self, context, event):
+      if bpy.app.background or context.window is None:
+         return self.execute(context)
+      self._steps = self.steps(context)
+      self._counters = dict.fromkeys(forci_profiler.COUNTERS, 0)
+      self._busy = 0.0
+      self._phase = ""
+      self._phase_started = time.perf_counter()
+      self._progress = None
+      self._area = context.area
+      window_manager = context.window_manager
+      self._timer = window_manager.event_timer_add(TIMER_INTERVAL, window=context.window)
+      window_manager.modal_handler_add(self)
+      return {'RUNNING_MODAL'}
+
+   def modal(self, context, event):
+      if event.type == 'ESC':
+         self._steps.close()
+         self.report({'WARNING'}, f"{self.bl_label} cancelled")
+         return self._finish(context, {'CANCELLED'})
+      if event.type != 'TIMER':
+         return {'PASS_THROUGH'}
+
+      result = self._run_slice()
+      if result is None:
+         if self._area:
+            self._area.header_text_set(self._status())
+         return {'RUNNING_MODAL'}
+      return self._finish(context, result)
+
+   def _run_slice(self):
+      """Advance the steps for SLICE_SECONDS, return the result once they are done"""
+      started = time.perf_counter()
+      deadline = started + SLICE_SECONDS
+      try:
+         with forci_profiler.get_profiler().collecting(self._counters):
+            while time.perf_counter() < deadline:
+               self._advance(next(self._steps))
+      except StopIteration as stop:
+         return stop.value or {'FINISHED'}
+      except Exception as error:
+         traceback.print_exc()
+         self.report({'ERROR'}, f"{self.bl_label} failed: {error}")
+         return {'CANCELLED'}
+      finally:
+         self._busy += time.perf_counter() - started
+      return None
+
+   def _advance(self, value):
+      if isinstance(value, str):
+         self._phase = value
+         self._phase_started = time.perf_counter()
+         self._progress = None
+      elif isinstance(value, tuple):
+         self._progress = value
+
+   def _status(self):
+      text = f"{self.bl_label}: {self._phase}"
+      if self._progress:
+         done, total = self._progress
+         text += f" {done}/{total}"
+         if total:
+            text += f" ({done * 100 // total}%)"
+         if done and total > done:
+            elapsed = time.perf_counter() - self._phase_started
+            text += f", {format_seconds(elapsed / done * (total - done))} left"
+      return text + "  —  ESC to cancel"
+
+   def _finish(self, context, result):
+      context.window_manager.event_timer_remove(self._timer)
+      if self._area:
+         self._area.header_text_set(None)
+      # Only the time spent working counts, not the time the UI had in between
+      forci_profiler.get_profiler().record(self, self._busy, result, self._counters)
+      return result
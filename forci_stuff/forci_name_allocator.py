@@ -0,0 +1,66 @@
+"""Hands out <folder>_<n> texture names without rescanning the destination folder"""
+
+import os
+from . import forci_profiler
+
+# The .forci bookkeeping folder, and the files older versions kept next to the textures
+IGNORED_NAMES = {".forci", "forci_texture_hashes.json", "forci_manifest.sqlite"}
+
+class GenericNameAllocator:
+   """Allocate <prefix>_<n> file names in a destination folder.
+
+   The folder is scanned once; after that the highest used index and the names
+   already taken are tracked in memory. Each handed out name is still checked
+   with a single lexists call so files created by someone else mid-run are skipped.
+   """
+
+   def __init__(self, folder, prefix=None):
+      self.folder = folder
+      if prefix is None:
+         prefix = os.path.basename(os.path.normpath(folder))
+      self.prefix = prefix
+      self.taken = set()
+      self.last_index = 0
+      self.scan()
+
+   def scan(self):
+      if not os.path.isdir(self.folder):
+         return
+      head = f"{self.prefix}_"
+      with os.scandir(self.folder) as entries:
+         for entry in entries:
+            if entry.name in IGNORED_NAMES:
+               continue
+            self.taken.add(entry.name.lower())
+            stem = os.path.splitext(entry.name)[0]
+            suffix = stem[len(head):]
+            if stem.startswith(head) and suffix.isdigit():
+               self.last_index = max(self.last_index, int(suffix))
+
+   def reserve(self, name):
+      """Mark a name as taken without touching the disk, e.g. one promised by a manifest but not copied yet"""
+      self.taken.add(name.lower())
+      stem = os.path.splitext(name)[0]
+      suffix = stem[len(self.prefix) + 1:]
+      if stem.startswith(f"{self.prefix}_") and suffix.isdigit():
+         self.last_index = max(self.last_index, int(suffix))
+
+   def claim(self, name):
+      """Reserve a specific file name, return False if it is already used"""
+      key = name.lower()
+      if key in self.taken:
+         return False
+      self.taken.add(key)
+      forci_profiler.count("files_stated")
+      if os.path.lexists(os.path.join(self.folder, name)):
+         # Appeared since the scan
+         return False
+      return True
+
+   def allocate(self, extension):
+      """Return the next free <prefix>_<n><extension> name"""
+      while True:
+         self.last_index += 1
+         name = f"{self.prefix}_{self.last_index}{extension}"
+         if self.claim(name):
+            return name
@@ -0,0 +1,184 @@
+"""Exact, prefix, wildcard, regex and fuzzy name search over materials and images"""
+
+import fnmatch
+import re
+from functools import lru_cache
+
+import bpy
+from . import forci_scene_index
+
+query_mode_items = [
+   ('EXACT', "Exact", "Name is exactly the text"),
+   ('PREFIX', "Starts With", "Name starts with the text"),
+   ('SUBSTRING', "Contains", "Name contains the text"),
+   ('GLOB', "Wildcard", "Name matches a wildcard pattern such as wood_*"),
+   ('REGEX', "Regex", "Name matches a regular expression"),
+   ('FUZZY', "Fuzzy", "Name looks like the text, ignoring case and small typos"),
+]
+
+# Share of the query trigrams a name needs to count as a fuzzy match
+FUZZY_THRESHOLD = 0.5
+MAX_CACHED_RESULTS = 512
+
+def trigrams(text):
+   return {text[i:i + 3] for i in range(len(text) - 2)}
+
+@lru_cache(maxsize=256)
+def compile_query(pattern, mode):
+   """Return a predicate on names for the pattern, raises re.error on a bad regex"""
+   if mode == 'EXACT':
+      return lambda name: name == pattern
+   if mode == 'PREFIX':
+      return lambda name: name.startswith(pattern)
+   if mode == 'SUBSTRING':
+      return lambda name: pattern in name
+   if mode == 'GLOB':
+      return re.compile(fnmatch.translate(pattern)).match
+   if mode == 'REGEX':
+      return re.compile(pattern).search
+   lowered = pattern.lower()
+   return lambda name: lowered in name.lower()
+
+def required_literals(pattern, mode):
+   """Literal pieces every match must contain, used to narrow candidates with the trigram index"""
+   if mode in ('PREFIX', 'SUBSTRING'):
+      return [pattern]
+   if mode == 'GLOB':
+      return [piece for piece in re.split(r"\[[^\]]*\]|[*?]", pattern) if piece]
+   return []
+
+class NameTrigramIndex:
+   """Trigram postings over a list of names (lower case), so queries only check likely candidates"""
+
+   def __init__(self, names):
+      self.names = list(names)
+      self.positions = {name: position for position, name in enumerate(self.names)}
+      self.postings = {}
+      for position, name in enumerate(self.names):
+         for gram in trigrams(name.lower()):
+            self.postings.setdefault(gram, []).append(position)
+      self.results = {}
+
+   def candidates(self, literal):
+      """Positions of the names containing every trigram of literal, None if literal is too short"""
+      grams = trigrams(literal.lower())
+      if not grams:
+         return None
+      postings = sorted((self.postings.get(gram, ()) for gram in grams), key=len)
+      found = set(postings[0])
+      for posting in postings[1:]:
+         if not found:
+            break
+         found.intersection_update(posting)
+      return found
+
+   def fuzzy(self, pattern):
+      grams = trigrams(pattern.lower())
+      if not grams:
+         predicate = compile_query(pattern, 'FUZZY')
+         return [name for name in self.names if predicate(name)]
+      scores = {}
+      for gram in grams:
+         for position in self.postings.get(gram, ()):
+            scores[position] = scores.get(position, 0) + 1
+      minimum = FUZZY_THRESHOLD * len(grams)
+      ranked = sorted((position for position, score in scores.items() if score >= minimum), key=lambda position: (-scores[position], position))
+      return [self.names[position] for position in ranked]
+
+   def query(self, pattern, mode):
+      """Return the matching names; results are cached per (pattern, mode)"""
+      key = (pattern, mode)
+      if key in self.results:
+         return self.results[key]
+      if not pattern:
+         matches = []
+      elif mode == 'EXACT':
+         matches = [pattern] if pattern in self.positions else []
+      elif mode == 'FUZZY':
+         matches = self.fuzzy(pattern)
+      else:
+         predicate = compile_query(pattern, mode)
+         narrowed = None
+         for literal in required_literals(pattern, mode):
+            found = self.candidates(literal)
+            if found is not None:
+               narrowed = found if narrowed is None else narrowed & found
+         if narrowed is None:
+            matches = [name for name in self.names if predicate(name)]
+         else:
+            matches = [self.names[position] for position in sorted(narrowed) if predicate(self.names[position])]
+      if len(self.results) >= MAX_CACHED_RESULTS:
+         self.results.clear()
+      self.results[key] = matches
+      return matches
+
+class ForciNameQuery:
+   """Name search over bpy.data.materials and bpy.data.images, rebuilt only when they change"""
+
+   def __init__(self):
+      self.indexes = {}
+      self.unchecked = set()   # collections changed since their names were last compared
+
+   def invalidate(self, collection_name=None):
+      if collection_name is None:
+         self.indexes.clear()
+      else:
+         self.indexes.pop(collection_name, None)
+
+   def check_names(self, *collection_names):
+      """Compare the names of these collections with their index on the next query"""
+      self.unchecked.update(collection_names)
+
+   def index(self, collection_name):
+      collection = getattr(bpy.data, collection_name)
+      index = self.indexes.get(collection_name)
+      if index is not None and collection_name in self.unchecked:
+         # Renommages ou ajout puis suppression : le nombre ne change pas, les noms si
+         self.unchecked.discard(collection_name)
+         if collection.keys() != index.names:
+            index = None
+      if index is None or len(index.names) != len(collection):
+         index = self.indexes[collection_name] = NameTrigramIndex(collection.keys())
+         self.unchecked.discard(collection_name)
+      return index
+
+   def match(self, collection_name, pattern, mode):
+      """Return the matching datablocks of bpy.data.<collection_name>"""
+      collection = getattr(bpy.data, collection_name)
+      datablocks = []
+      for name in self.index(collection_name).query(pattern, mode):
+         datablock = collection.get(name)
+         if datablock is not None:
+            datablocks.append(datablock)
+         else:
+            # Renamed since the index was built
+            self.invalidate(collection_name)
+      return datablocks
+
+   def count(self, collection_name, pattern, mode):
+      return len(self.index(collection_name).query(pattern, mode))
+
+   def materials(self, pattern, mode):
+      return self.match("materials", pattern, mode)
+
+   def images(self, pattern, mode):
+      return self.match("images", pattern, mode)
+
+
+_engine = ForciNameQuery()
+
+def get_query_engine():
+   """Return the shared query engine, kept up to date by the scene index's handlers"""
+   forci_scene_index.watch(_engine.invalidate, _on_depsgraph_update)
+   return _engine
+
+def _on_depsgraph_update(depsgraph):
+   # Renames are not always reported for the renamed datablock itself, compare every name once
+   _engine.check_names("materials", "images")
+
+def register():
+   forci_scene_index.watch(_engine.invalidate, _on_depsgraph_update)
+
+def unregister():
+   forci_scene_index.unwatch(_engine.invalidate, _on_depsgraph_update)
+   _engine.invalidate()
@@ -0,0 +1,253 @@
+"""Sets many node inputs on every material in one pass, with the input names of every Blender version"""
+
+import ast
+import operator
+from collections import namedtuple
+import bpy
+from . import forci_profiler
+
+# node: a node type such as 'BSDF_PRINCIPLED', or the name of a node group
+# input: the input name, any of its names across Blender versions
+# value: a number, a tuple for colors and vectors, or an expression of the current value
+#        such as "value * 0.5" or "min(value, 0.8)"
+NodeInputRule = namedtuple("NodeInputRule", "node input value")
+
+# Inputs renamed by the Principled BSDF rewrite of Blender 4.0, old name first
+INPUT_ALIASES = (
+   ("Specular", "Specular IOR Level"),
+   ("Subsurface", "Subsurface Weight"),
+   ("Transmission", "Transmission Weight"),
+   ("Sheen", "Sheen Weight"),
+   ("Clearcoat", "Coat Weight"),
+   ("Clearcoat Roughness", "Coat Roughness"),
+   ("Clearcoat Normal", "Coat Normal"),
+   ("Emission", "Emission Color"),
+)
+_ALIASES = {}
+for _names in INPUT_ALIASES:
+   for _name in _names:
+      _ALIASES[_name] = (_name,) + tuple(other for other in _names if other != _name)
+
+# Rules are saved in the .blend, so expressions are never handed to eval(): only these
+# operators and functions, numbers and value are accepted
+EXPRESSION_OPERATORS = {
+   ast.Add: operator.add,
+   ast.Sub: operator.sub,
+   ast.Mult: operator.mul,
+   ast.Div: operator.truediv,
+   ast.Pow: operator.pow,
+}
+EXPRESSION_FUNCTIONS = {"min": min, "max": max, "abs": abs, "round": round}
+
+PRESETS = {}   # identifier -> (label, rules)
+
+def register_preset(identifier, label, rules):
+   """Add or replace a preset, e.g. from a startup script"""
+   PRESETS[identifier] = (label, [NodeInputRule(*rule) for rule in rules])
+
+register_preset('SPECULAR_ZERO', "Specular Zero", [('BSDF_PRINCIPLED', "Specular", 0.0)])
+register_preset('MATTE', "Matte", [
+   ('BSDF_PRINCIPLED', "Specular", 0.0),
+   ('BSDF_PRINCIPLED', "Roughness", 1.0),
+   ('BSDF_PRINCIPLED', "Metallic", 0.0),
+   ('BSDF_PRINCIPLED', "Sheen", 0.0),
+   ('BSDF_PRINCIPLED', "Clearcoat", 0.0),
+])
+register_preset('NO_EMISSION', "No Emission", [('BSDF_PRINCIPLED', "Emission Strength", 0.0)])
+
+def preset_items(self, context):
+   # Blender keeps only a reference to the strings, the list must outlive the call
+   global _preset_items
+   _preset_items = [(identifier, label, f"{len(rules)} rules") for identifier, (label, rules) in PRESETS.items()]
+   return _preset_items
+
+_preset_items = []
+
+def parse_rules(text):
+   """Rules from lines or ';' separated entries of the form node.input = value.
+
+   BSDF_PRINCIPLED.Roughness = 0.5
+   BSDF_PRINCIPLED.Specular = value * 0.5
+   MyGroup.Strength = 2
+   """
+   rules = []
+   for entry in text.replace(";", "\n").splitlines():
+      entry = entry.strip()
+      if not entry or entry.startswith("#"):
+         continue
+      target, equals, value = entry.partition("=")
+      # Les noms d'entrée n'ont pas de point, les noms de groupe peuvent en avoir
+      node, dot, input_name = target.strip().rpartition(".")
+      if not equals or not dot or not node or not input_name.strip():
+         raise ValueError(f"Expected node.input = value, got {entry!r}")
+      rules.append(NodeInputRule(node.strip(), input_name.strip(), parse_value(value.strip())))
+   return rules
+
+def parse_value(text):
+   """A number, a tuple of numbers, otherwise the expression text"""
+   try:
+      return float(text)
+   except ValueError:
+      pass
+   try:
+      return tuple(float(part) for part in text.strip("()").split(","))
+   except ValueError:
+      pass
+   compile_expression(text)
+   return text
+
+def compile_expression(text):
+   """The checked syntax tree of an expression, raises ValueError for anything not allowed"""
+   try:
+      tree = ast.parse(text, "<rule>", "eval")
+   except SyntaxError:
+      raise ValueError(f"Invalid value {text!r}") from None
+   if not _allowed(tree.body):
+      raise ValueError(f"Invalid value {text!r}: only numbers, value, + - * / **, min, max, abs and round are allowed")
+   return tree.body
+
+def _allowed(node):
+   if isinstance(node, ast.Constant):
+      return type(node.value) in (int, float)
+   if isinstance(node, ast.Name):
+      return node.id == "value"
+   if isinstance(node, ast.UnaryOp):
+      return isinstance(node.op, ast.USub) and _allowed(node.operand)
+   if isinstance(node, ast.BinOp):
+      return type(node.op) in EXPRESSION_OPERATORS and _allowed(node.left) and _allowed(node.right)
+   if isinstance(node, ast.Call):
+      return (isinstance(node.func, ast.Name) and node.func.id in EXPRESSION_FUNCTIONS and not node.keywords
+              and all(_allowed(argument) for argument in node.args))
+   return False
+
+def evaluate(node, value):
+   """Value of a tree checked by compile_expression, value being the input's current value"""
+   if isinstance(node, ast.Constant):
+      # En float, 9 ** 9 ** 9 déborde au lieu de calculer un entier géant
+      return float(node.value)
+   if isinstance(node, ast.Name):
+      return value
+   if isinstance(node, ast.UnaryOp):
+      return -evaluate(node.operand, value)
+   if isinstance(node, ast.BinOp):
+      return EXPRESSION_OPERATORS[type(node.op)](evaluate(node.left, value), evaluate(node.right, value))
+   return EXPRESSION_FUNCTIONS[node.func.id](*(evaluate(argument, value) for argument in node.args))
+
+class RuleStats:
+   """What one rule did: inputs set, already at the value, linked (left alone) and nodes without the input"""
+
+   def __init__(self, rule):
+      self.rule = rule
+      self.set = 0
+      self.unchanged = 0
+      self.linked = 0
+      self.missing = 0
+      self.errors = 0
+      self.first_error = None   # "node.input: message" of the first failure, for the report
+
+   def summary(self):
+      text = f"{self.rule.node}.{self.rule.input}: {self.set} set"
+      for count, label in ((self.unchanged, "unchanged"), (self.linked, "linked"), (self.missing, "without it"), (self.errors, "failed")):
+         if count:
+            text += f", {count} {label}"
+      return text
+
+class NodeInputSetter:
+   """Applies a list of rules to every material in a single walk over the node trees.
+
+   The rules are grouped by node type or group name, so each node costs one dict lookup
+   whatever the number of rules. Which of an input's names the running Blender uses is
+   resolved once per node type. Node groups are visited once however many materials use
+   them.
+   """
+
+   def __init__(self, rules):
+      self.stats = [RuleStats(rule) for rule in rules]
+      self.by_node = {}
+      for stats in self.stats:
+         value = stats.rule.value
+         code = compile_expression(value) if isinstance(value, str) else None
+         self.by_node.setdefault(stats.rule.node, []).append((stats, code))
+      self.resolved = {}   # (node key, input name) -> name in this Blender, None if absent
+
+   def run(self, materials=None):
+      """Apply the rules to materials (every local material by default), return the RuleStats"""
+      if materials is None:
+         materials = bpy.data.materials
+      trees = []
+      for material in materials:
+         forci_profiler.count("materials")
+         if material.library is None and material.use_nodes and material.node_tree:
+            trees.append(material.node_tree)
+      visited = set()
+      while trees:
+         tree = trees.pop()
+         if tree in visited:
+            continue
+         visited.add(tree)
+         forci_profiler.count("nodes", len(tree.nodes))
+         for node in tree.nodes:
+            group = node.node_tree if node.type == 'GROUP' else None
+            if group is not None and group.library is None:
+               trees.append(group)
+            key = group.name if group is not None else node.type
+            for stats, code in self.by_node.get(key, ()):
+               self.apply(node, key, stats, code)
+      return self.stats
+
+   def socket(self, node, key, input_name):
+      name = self.resolved.get((key, input_name), ...)
+      if name is ...:
+         name = next((alias for alias in _ALIASES.get(input_name, (input_name,)) if node.inputs.get(alias) is not None), None)
+         # Les groupes peuvent changer d'entrées d'un nœud à l'autre, pas les types de nœud
+         if node.type != 'GROUP':
+            self.resolved[(key, input_name)] = name
+      return node.inputs.get(name) if name else None
+
+   def apply(self, node, key, stats, code):
+      socket = self.socket(node, key, stats.rule.input)
+      if socket is None or not hasattr(socket, "default_value"):
+         stats.missing += 1
+         return
+      if socket.is_linked:
+         # La valeur par défaut d'une entrée connectée n'est pas utilisée
+         stats.linked += 1
+         return
+      current = socket.default_value
+      if hasattr(current, "__len__"):
+         current = tuple(current)
+      try:
+         value = stats.rule.value if code is None else evaluate(code, current)
+         value = fit_value(value, current, socket.type)
+         if same_value(value, current):
+            stats.unchanged += 1
+            return
+         socket.default_value = value
+      except (TypeError, ValueError, ArithmeticError) as error:
+         if stats.first_error is None:
+            stats.first_error = f"{node.name}.{socket.name}: {error}"
+         stats.errors += 1
+         return
+      stats.set += 1
+
+def fit_value(value, current, socket_type):
+   """A number on a color or vector input fills its components, the alpha of a color stays 1"""
+   if not hasattr(current, "__len__"):
+      return value
+   if not hasattr(value, "__len__"):
+      value = [value] * len(current)
+      if socket_type == 'RGBA':
+         value[-1] = 1.0
+   if len(value) != len(current):
+      raise ValueError(f"expected {len(current)} values, got {len(value)}")
+   return tuple(value)
+
+def same_value(value, current):
+   # Les entrées stockent des float32, 0.1 n'y revient jamais exactement
+   if isinstance(current, tuple):
+      return all(abs(a - b) < 1e-6 for a, b in zip(value, current))
+   return abs(value - current) < 1e-6
+
+def apply_rules(rules, materials=None):
+   """Apply the rules in a single pass, return one RuleStats per rule"""
+   return NodeInputSetter(rules).run(materials)
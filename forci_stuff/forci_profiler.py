@@ -0,0 +1,214 @@
+"""Times every FORCI operator run and counts the objects, materials, nodes and files it touched"""
+
+import contextlib
+import functools
+import io
+import json
+import time
+from collections import deque
+
+import bpy
+from . import forci_lazy
+
+# Only needed when a run is captured
+cProfile = forci_lazy.lazy_import("cProfile")
+pstats = forci_lazy.lazy_import("pstats")
+
+RECENT_RUNS = 50
+SHOWN_RUNS = 10
+COUNTERS = ("objects", "materials", "nodes", "files_stated", "files_copied", "bytes_written", "images_loaded", "images_reused", "images_analyzed")
+PROFILE_TEXT_NAME = "FORCI Profile"
+
+class ForciProfiler:
+   """Ring buffer of the last operator runs, with the counters filled by the hot paths.
+
+   Nested runs (an operator calling another one) all receive the counts, so the outer
+   run includes the work of the inner one.
+   """
+
+   def __init__(self):
+      self.runs = deque(maxlen=RECENT_RUNS)
+      self.active = []
+      self.capture = False
+      self.slowest = None   # (seconds, label, pstats report) of the slowest captured run
+
+   def count(self, name, amount=1):
+      for counters in self.active:
+         counters[name] += amount
+
+   def run(self, operator, context, execute):
+      counters = dict.fromkeys(COUNTERS, 0)
+      self.active.append(counters)
+      # Only the outermost run is profiled, cProfile cannot nest
+      profile = cProfile.Profile() if self.capture and len(self.active) == 1 else None
+      result = None
+      started = time.perf_counter()
+      try:
+         if profile:
+            result = profile.runcall(execute, operator, context)
+         else:
+            result = execute(operator, context)
+         return result
+      finally:
+         seconds = time.perf_counter() - started
+         self.active.pop()
+         self.record(operator, seconds, result, counters)
+         if profile and (self.slowest is None or seconds > self.slowest[0]):
+            self.slowest = (seconds, operator.bl_label, self.report(profile))
+
+   @contextlib.contextmanager
+   def collecting(self, counters):
+      """Count into counters for the duration of the block, for runs split over several calls"""
+      self.active.append(counters)
+      try:
+         yield counters
+      finally:
+         self.active.remove(counters)
+
+   def record(self, operator, seconds, result, counters):
+      run = {
+         "operator": operator.bl_idname,
+         "label": operator.bl_label,
+         "time": time.time(),
+         "seconds": seconds,
+         "result": sorted(result) if result else "ERROR",
+      }
+      run.update(counters)
+      self.runs.append(run)
+
+   def report(self, profile):
+      stream = io.StringIO()
+      pstats.Stats(profile, stream=stream).sort_stats('cumulative').print_stats(40)
+      return stream.getvalue()
+
+   def export(self, path):
+      """Write the recorded runs as JSON lines, oldest first"""
+      with open(path, 'w', encoding='utf-8') as stream:
+         for run in self.runs:
+            stream.write(json.dumps(run) + "\n")
+      return len(self.runs)
+
+   def clear(self):
+      self.runs.clear()
+      self.slowest = None
+
+
+_profiler = ForciProfiler()
+
+def get_profiler():
+   return _profiler
+
+def count(name, amount=1):
+   """Add to a counter of the runs in progress, a no-op outside of a profiled execute()"""
+   if _profiler.active:
+      _profiler.count(name, amount)
+
+def profiled(execute):
+   """Decorator for Operator.execute recording its wall time and counters"""
+   @functools.wraps(execute)
+   def wrapper(self, context):
+      return _profiler.run(self, context, execute)
+   return wrapper
+
+# --- UI -----------------------------------------------------------------------
+
+def _update_capture(self, context):
+   _profiler.capture = self.forci_profile_capture
+
+class ForciProfilerExportOperator(bpy.types.Operator):
+   """Export the recorded runs as JSON lines"""
+   bl_idname = "forcica.profiler_export"
+   bl_label = "Export Runs"
+
+   filepath: bpy.props.StringProperty(subtype='FILE_PATH') # type: ignore
+   filter_glob: bpy.props.StringProperty(default="*.jsonl", options={'HIDDEN'}) # type: ignore
+
+   def invoke(self, context, event):
+      if not self.filepath:
+         self.filepath = "forci_runs.jsonl"
+      context.window_manager.fileselect_add(self)
+      return {'RUNNING_MODAL'}
+
+   def execute(self, context):
+      path = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ".jsonl")
+      exported = _profiler.export(path)
+      self.report({'INFO'}, f"Exported {exported} runs to {path}")
+      return {'FINISHED'}
+
+class ForciProfilerClearOperator(bpy.types.Operator):
+   """Forget the recorded runs and the captured profile"""
+   bl_idname = "forcica.profiler_clear"
+   bl_label = "Clear Runs"
+
+   def execute(self, context):
+      _profiler.clear()
+      return {'FINISHED'}
+
+class ForciProfilerShowProfileOperator(bpy.types.Operator):
+   """Write the cProfile report of the slowest captured run to the 'FORCI Profile' text"""
+   bl_idname = "forcica.profiler_show_profile"
+   bl_label = "Show Slowest Profile"
+
+   @classmethod
+   def poll(cls, context):
+      return _profiler.slowest is not None
+
+   def execute(self, context):
+      seconds, label, report = _profiler.slowest
+      text = bpy.data.texts.get(PROFILE_TEXT_NAME) or bpy.data.texts.new(PROFILE_TEXT_NAME)
+      text.from_string(f"{label}: {seconds:.3f} s\n\n{report}")
+      self.report({'INFO'}, f"Profile of '{label}' written to the '{PROFILE_TEXT_NAME}' text")
+      return {'FINISHED'}
+
+class ForciProfilerPanel(bpy.types.Panel):
+   """Recent FORCI operator runs"""
+   bl_label = "FORCI Profiler"
+   bl_idname = "VIEW3D_PT_forci_profiler"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+   bl_options = {'DEFAULT_CLOSED'}
+
+   def draw(self, context):
+      layout = self.layout
+      layout.prop(context.window_manager, "forci_profile_capture")
+
+      runs = list(_profiler.runs)[-SHOWN_RUNS:]
+      if not runs:
+         layout.label(text="No runs recorded yet")
+      column = layout.column(align=True)
+      for run in reversed(runs):
+         box = column.box()
+         box.label(text=f"{run['label']}: {run['seconds'] * 1000:.0f} ms", icon='ERROR' if run['result'] == "ERROR" else 'TIME')
+         box.label(text=f"{run['objects']} objects, {run['materials']} materials, {run['nodes']} nodes")
+         if run['files_stated'] or run['files_copied']:
+            box.label(text=f"{run['files_stated']} stat, {run['files_copied']} copied, {run['bytes_written'] / 1048576:.1f} MiB written")
+         if run['images_loaded'] or run['images_reused']:
+            box.label(text=f"{run['images_loaded']} images loaded, {run['images_reused']} reused")
+         if run['images_analyzed']:
+            box.label(text=f"{run['images_analyzed']} images analyzed")
+
+      row = layout.row(align=True)
+      row.operator(ForciProfilerExportOperator.bl_idname)
+      row.operator(ForciProfilerClearOperator.bl_idname)
+      layout.operator(ForciProfilerShowProfileOperator.bl_idname)
+
+def register():
+   bpy.utils.register_class(ForciProfilerExportOperator)
+   bpy.utils.register_class(ForciProfilerClearOperator)
+   bpy.utils.register_class(ForciProfilerShowProfileOperator)
+   bpy.utils.register_class(ForciProfilerPanel)
+   bpy.types.WindowManager.forci_profile_capture = bpy.props.BoolProperty(
+      name="Capture cProfile",
+      description="Run the operators under cProfile and keep the report of the slowest run (slows them down)",
+      default=False,
+      update=_update_capture
+   )
+
+def unregister():
+   del bpy.types.WindowManager.forci_profile_capture
+   _profiler.capture = False
+   bpy.utils.unregister_class(ForciProfilerExportOperator)
+   bpy.utils.unregister_class(ForciProfilerClearOperator)
+   bpy.utils.unregister_class(ForciProfilerShowProfileOperator)
+   bpy.utils.unregister_class(ForciProfilerPanel)
@@ -0,0 +1,313 @@
+"""Shared material, image and shader link index used by the FORCI operators"""
+
+import bpy
+from bpy.app.handlers import persistent
+from . import forci_profiler
+
+class ForciSceneIndex:
+   """Material -> objects, image -> (material, node) and socket -> upstream node lookups.
+
+   The index is built in one pass over bpy.data the first time it is queried, then kept
+   up to date from depsgraph_update_post: only the objects and materials reported as
+   updated or added are indexed again, on the next query. Everything is keyed by the
+   datablocks themselves, so renames change nothing. Datablocks added without an update
+   in between are picked up by a scan for the ones not indexed yet; only a removal (more
+   datablocks indexed than bpy.data holds), a file load or an undo rebuild it all. A
+   removal and an addition in the same step that no depsgraph update reports cancel out
+   until the next rebuild.
+
+   Every material reported as edited, directly, through its node tree or through one of
+   its images, also gets a new edit number in changes, which rebuilds keep: callers
+   remember changed(material) to tell later whether it was edited since.
+   """
+
+   def __init__(self):
+      self.resets = 0
+      self.invalidate()
+
+   def invalidate(self):
+      """Forget everything, edit numbers included (file load, undo: datablocks are reallocated)"""
+      self.clear()
+      self.changes = {}            # datablock_key(material) -> edit number of its last change
+      self.edits = 0
+      self.resets += 1
+
+   def clear(self):
+      self.built = False
+      self.material_objects = {}   # material -> set of objects
+      self.object_materials = {}   # object -> set of materials
+      self.data_objects = {}       # mesh data -> set of objects
+      self.object_data = {}        # object -> mesh data
+      self.image_nodes = {}        # image -> set of (material, node name)
+      self.material_images = {}    # material -> set of images
+      self.upstream = {}           # material -> {(node name, input identifier): from node}
+      self.tree_materials = {}     # embedded node tree -> material
+      self.indexed_objects = set() # every object indexed, meshes or not
+      self.image_count = 0         # len(bpy.data.images) at the last query
+      self.dirty_objects = set()
+      self.dirty_materials = set()
+
+   # --- Construction ---------------------------------------------------------
+
+   def build(self):
+      self.clear()
+      for material in bpy.data.materials:
+         self._index_material(material)
+      for obj in bpy.data.objects:
+         self._index_object(obj)
+      self.image_count = len(bpy.data.images)
+      self.built = True
+
+   def _removed(self):
+      # Removed datablocks stay indexed until the next build, the index then holds more than bpy.data
+      return (len(self.indexed_objects) > len(bpy.data.objects)
+              or len(self.material_images) > len(bpy.data.materials)
+              or self.image_count > len(bpy.data.images))
+
+   def _index_added(self):
+      """Index the objects and materials added without a depsgraph update since"""
+      if len(self.material_images) < len(bpy.data.materials):
+         for material in bpy.data.materials:
+            if material not in self.material_images:
+               self._index_material(material)
+      if len(self.indexed_objects) < len(bpy.data.objects):
+         for obj in bpy.data.objects:
+            if obj not in self.indexed_objects:
+               self._index_object(obj)
+
+   def _index_object(self, obj):
+      self.indexed_objects.add(obj)
+      if obj.type != 'MESH':
+         return
+      forci_profiler.count("objects")
+      materials = {slot.material for slot in obj.material_slots if slot.material}
+      self.object_materials[obj] = materials
+      self.object_data[obj] = obj.data
+      self.data_objects.setdefault(obj.data, set()).add(obj)
+      for material in materials:
+         self.material_objects.setdefault(material, set()).add(obj)
+
+   def _forget_object(self, obj):
+      for material in self.object_materials.pop(obj, ()):
+         users = self.material_objects.get(material)
+         if users:
+            users.discard(obj)
+      users = self.data_objects.get(self.object_data.pop(obj, None))
+      if users:
+         users.discard(obj)
+
+   def _index_material(self, material):
+      images = set()
+      links = {}
+      forci_profiler.count("materials")
+      if material.use_nodes and material.node_tree:
+         tree = material.node_tree
+         self.tree_materials[tree] = material
+         forci_profiler.count("nodes", len(tree.nodes))
+         for node in tree.nodes:
+            if node.type == 'TEX_IMAGE' and node.image:
+               self.image_nodes.setdefault(node.image, set()).add((material, node.name))
+               images.add(node.image)
+         for link in tree.links:
+            links[(link.to_node.name, link.to_socket.identifier)] = link.from_node
+      self.material_images[material] = images
+      self.upstream[material] = links
+
+   def _forget_material(self, material):
+      for image in self.material_images.pop(material, ()):
+         nodes = self.image_nodes.get(image)
+         if nodes:
+            self.image_nodes[image] = {entry for entry in nodes if entry[0] != material}
+      self.upstream.pop(material, None)
+
+   # --- Incremental updates --------------------------------------------------
+
+   def mark_dirty(self, datablock):
+      """Flag an object or material edited by an operator so the next query reindexes it"""
+      if isinstance(datablock, bpy.types.Material):
+         self._touch_material(datablock)
+      elif isinstance(datablock, bpy.types.Object):
+         self.dirty_objects.add(datablock)
+
+   def changed(self, material):
+      """Edit number of the material's last reported change, 0 if none since the last reset"""
+      return self.changes.get(datablock_key(material), 0)
+
+   def _touch_material(self, material, reindex=True):
+      if reindex:
+         self.dirty_materials.add(material)
+      self.edits += 1
+      self.changes[datablock_key(material)] = self.edits
+
+   def apply_depsgraph(self, depsgraph):
+      if not self.built:
+         return
+      for update in depsgraph.updates:
+         datablock = update.id.original
+         if isinstance(datablock, bpy.types.Object):
+            self.dirty_objects.add(datablock)
+         elif isinstance(datablock, bpy.types.Material):
+            self._touch_material(datablock)
+         elif isinstance(datablock, bpy.types.ShaderNodeTree):
+            material = self.tree_materials.get(datablock)
+            if material is not None:
+               self._touch_material(material)
+         elif isinstance(datablock, bpy.types.Image):
+            # Les liens des matériaux ne changent pas, seul leur numéro d'édition avance
+            for material, node_name in self.image_nodes.get(datablock, ()):
+               self._touch_material(material, reindex=False)
+         elif isinstance(datablock, bpy.types.Mesh):
+            self.dirty_objects.update(self.data_objects.get(datablock, ()))
+
+   def refresh(self):
+      """Build the index if needed, then reindex whatever was flagged or added since the last query"""
+      if not self.built:
+         self.build()
+         return
+      try:
+         for material in self.dirty_materials:
+            self._forget_material(material)
+            self._index_material(material)
+         for obj in self.dirty_objects:
+            self._forget_object(obj)
+            self._index_object(obj)
+      except ReferenceError:
+         # A flagged datablock was removed in the meantime
+         self.build()
+         return
+      self.dirty_materials.clear()
+      self.dirty_objects.clear()
+      if self._removed():
+         self.build()
+         return
+      self._index_added()
+      self.image_count = len(bpy.data.images)
+
+   # --- Queries --------------------------------------------------------------
+
+   def objects_using_material(self, material):
+      self.refresh()
+      return set(self.material_objects.get(material, ()))
+
+   def objects_using_image(self, image):
+      self.refresh()
+      objects = set()
+      for material, node_name in self.image_nodes.get(image, ()):
+         objects.update(self.material_objects.get(material, ()))
+      return objects
+
+   def image_users(self, image):
+      """Return the (material, node) pairs whose Image Texture node uses the image"""
+      self.refresh()
+      users = []
+      for material, node_name in self.image_nodes.get(image, ()):
+         node = material.node_tree.nodes.get(node_name)
+         if node is not None:
+            users.append((material, node))
+      return users
+
+   def materials_of(self, obj):
+      self.refresh()
+      return set(self.object_materials.get(obj, ()))
+
+   def images_of(self, material):
+      self.refresh()
+      return set(self.material_images.get(material, ()))
+
+   def used_images(self):
+      """Images referenced by a material assigned to at least one mesh object"""
+      self.refresh()
+      images = set()
+      for material, users in self.material_objects.items():
+         if users:
+            images.update(self.material_images.get(material, ()))
+      return images
+
+   def used_materials(self):
+      self.refresh()
+      return {material for material, users in self.material_objects.items() if users}
+
+   def upstream_node(self, material, node, socket_name):
+      """Return the node linked into node.inputs[socket_name], or None"""
+      self.refresh()
+      socket = node.inputs.get(socket_name)
+      if socket is None:
+         return None
+      return self.upstream.get(material, {}).get((node.name, socket.identifier))
+
+
+def datablock_key(datablock):
+   """Identity of a datablock for the session.
+
+   Pointers are reused once a datablock is removed, session_uid (Blender 2.91+) never is;
+   older versions fall back to the pointer and the name.
+   """
+   session_uid = getattr(datablock, "session_uid", None)
+   if session_uid is not None:
+      return session_uid
+   return (datablock.as_pointer(), datablock.name)
+
+
+_index = ForciSceneIndex()
+
+# (on_invalidate, on_depsgraph) of everything kept up to date by the handlers below
+_listeners = [(_index.invalidate, _index.apply_depsgraph)]
+
+def get_index():
+   """Return the shared index, installing the update handlers on first use"""
+   _ensure_handlers()
+   return _index
+
+def watch(on_invalidate, on_depsgraph=None):
+   """Call on_invalidate() after a file load, undo or redo, and on_depsgraph(depsgraph) after
+   every depsgraph update (on_invalidate() when the update has no depsgraph).
+
+   The FORCI caches share the index's handlers this way. Cheap and idempotent, so it can be
+   called on every query, which also reinstalls the handlers if they were removed.
+   """
+   _ensure_handlers()
+   listener = (on_invalidate, on_depsgraph)
+   if listener not in _listeners:
+      _listeners.append(listener)
+
+def unwatch(on_invalidate, on_depsgraph=None):
+   listener = (on_invalidate, on_depsgraph)
+   if listener in _listeners:
+      _listeners.remove(listener)
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+   for on_invalidate, on_depsgraph in list(_listeners):
+      if on_depsgraph is None:
+         continue
+      if depsgraph is None:
+         on_invalidate()
+      else:
+         on_depsgraph(depsgraph)
+
+@persistent
+def _on_invalidate(*args):
+   # Loading a file or stepping through undo reallocates every datablock
+   for on_invalidate, on_depsgraph in list(_listeners):
+      on_invalidate()
+
+_HANDLERS = (
+   (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+   (bpy.app.handlers.load_post, _on_invalidate),
+   (bpy.app.handlers.undo_post, _on_invalidate),
+   (bpy.app.handlers.redo_post, _on_invalidate),
+)
+
+def _ensure_handlers():
+   for handlers, callback in _HANDLERS:
+      if callback not in handlers:
+         handlers.append(callback)
+
+def register():
+   _ensure_handlers()
+
+def unregister():
+   for handlers, callback in _HANDLERS:
+      if callback in handlers:
+         handlers.remove(callback)
+   _index.invalidate()
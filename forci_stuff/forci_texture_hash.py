@@ -0,0 +1,121 @@
+"""Content hashes of texture files with a persistent (path, size, mtime) cache"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from . import forci_profiler
+
+CACHE_FILENAME = "forci_texture_hashes.json"
+# Bookkeeping files of a texture folder live in this hidden subfolder, not next to the textures
+SIDECAR_FOLDER = ".forci"
+CHUNK_SIZE = 1 << 20
+# How long iter_digest waits for a hash before handing control back
+POLL_SECONDS = 0.005
+
+def hash_file(path):
+   """Stream the file through blake2b in fixed size chunks and return the hex digest"""
+   digest = hashlib.blake2b(digest_size=20)
+   buffer = bytearray(CHUNK_SIZE)
+   view = memoryview(buffer)
+   with open(path, 'rb') as stream:
+      while True:
+         size = stream.readinto(buffer)
+         if not size:
+            break
+         digest.update(view[:size])
+   return digest.hexdigest()
+
+class TextureHashCache:
+   """Content hashes keyed by absolute path, reused while the file size and mtime are unchanged.
+
+   The cache lives in a JSON sidecar file (usually in the destination folder's .forci
+   subfolder) so repeat runs only rehash the textures that changed. With cache_path None it stays in memory.
+   """
+
+   def __init__(self, cache_path):
+      self.cache_path = cache_path
+      self.entries = {}
+      self.modified = False
+      self.load()
+
+   def load(self):
+      if self.cache_path is None:
+         return
+      try:
+         with open(self.cache_path, 'r', encoding='utf-8') as stream:
+            self.entries = json.load(stream)
+      except (OSError, ValueError):
+         self.entries = {}
+
+   def save(self):
+      if not self.modified or self.cache_path is None:
+         return
+      temp_path = self.cache_path + ".tmp"
+      with open(temp_path, 'w', encoding='utf-8') as stream:
+         json.dump(self.entries, stream)
+      os.replace(temp_path, self.cache_path)
+      self.modified = False
+
+   def digest(self, path):
+      """Return the content hash of path, or None if the file cannot be read"""
+      forci_profiler.count("files_stated")
+      return self._digest(path)
+
+   def _digest(self, path):
+      path = os.path.abspath(path)
+      try:
+         stat = os.stat(path)
+      except OSError:
+         return None
+      entry = self.entries.get(path)
+      if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+         return entry[2]
+      try:
+         value = hash_file(path)
+      except OSError:
+         return None
+      self.entries[path] = [stat.st_size, stat.st_mtime_ns, value]
+      self.modified = True
+      return value
+
+   def iter_digest(self, paths, max_workers=8):
+      """Hash several files on a thread pool, as a generator for the sliced operators:
+      yields (done, total) and returns {path: digest}. Closing it early waits for the
+      files being hashed."""
+      paths = list(paths)
+      digests = {}
+      if not paths:
+         return digests
+      # Counted here, the workers must not touch the profiler counters
+      forci_profiler.count("files_stated", len(paths))
+      pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths))))
+      futures = {pool.submit(self._digest, path): path for path in paths}
+      pending = set(futures)
+      try:
+         while pending:
+            finished, pending = wait(pending, timeout=POLL_SECONDS, return_when=FIRST_COMPLETED)
+            for future in finished:
+               digests[futures[future]] = future.result()
+            yield len(digests), len(paths)
+      finally:
+         for future in pending:
+            future.cancel()
+         pool.shutdown(wait=True)
+      return digests
+
+def sidecar_path(folder, filename):
+   """Path of a bookkeeping file of folder, in its .forci subfolder.
+
+   A file an older version left in the folder itself is moved there.
+   """
+   sidecar_folder = os.path.join(folder, SIDECAR_FOLDER)
+   path = os.path.join(sidecar_folder, filename)
+   os.makedirs(sidecar_folder, exist_ok=True)
+   legacy_path = os.path.join(folder, filename)
+   if os.path.isfile(legacy_path) and not os.path.exists(path):
+      os.replace(legacy_path, path)
+   return path
+
+def cache_for_folder(folder):
+   return TextureHashCache(sidecar_path(folder, CACHE_FILENAME))
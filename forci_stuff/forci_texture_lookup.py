@@ -0,0 +1,64 @@
+"""Finds textures in a folder by name whatever their case, .001 suffix or extension"""
+
+import os
+import re
+from . import forci_profiler
+
+# Extensions a texture can be found under, in order of preference
+TEXTURE_EXTENSIONS = (".png", ".tga", ".dds", ".jpg", ".jpeg")
+
+# Blender's duplicate suffix: tex.png.001, tex.001
+_DUPLICATE_SUFFIX = re.compile(r"\.\d{3,}")
+
+def texture_key(name):
+   """Case-folded stem of a texture file or image name, without .001 suffixes nor extension"""
+   stem = os.path.basename(name).casefold()
+   while True:
+      root, extension = os.path.splitext(stem)
+      if not root or not (extension in TEXTURE_EXTENSIONS or _DUPLICATE_SUFFIX.fullmatch(extension)):
+         return stem
+      stem = root
+
+class TextureDirectory:
+   """One os.scandir of a folder, then name lookups are dict hits.
+
+   "Tex_D.PNG", "tex_d.png.001" and "tex_d.tga" all resolve to the same file, so
+   textures are found on case-sensitive filesystems and under another extension.
+   """
+
+   def __init__(self, folder):
+      self.folder = folder
+      self.files = {}   # texture key -> {extension: path}
+      self.scan()
+
+   def scan(self):
+      self.files.clear()
+      try:
+         entries = os.scandir(self.folder)
+      except OSError:
+         # Missing or unset folder: nothing to find
+         return
+      forci_profiler.count("files_stated")
+      with entries:
+         for entry in entries:
+            if entry.is_file():
+               self.add(entry.path)
+
+   def add(self, path):
+      """Record a file written into the folder since the scan"""
+      extension = os.path.splitext(path)[1].casefold()
+      if extension in TEXTURE_EXTENSIONS:
+         self.files.setdefault(texture_key(path), {}).setdefault(extension, path)
+
+   def find(self, name, extensions=TEXTURE_EXTENSIONS):
+      """Return the path of the texture called name under the first of extensions found, or None"""
+      candidates = self.files.get(texture_key(name))
+      if candidates:
+         for extension in extensions:
+            path = candidates.get(extension)
+            if path is not None:
+               return path
+      return None
+
+   def __contains__(self, name):
+      return self.find(name) is not None
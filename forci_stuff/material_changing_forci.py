@@ -0,0 +1,181 @@
+import bpy
+import os
+from . import forci_scene_index
+from . import forci_profiler
+from . import forci_lazy
+
+# Only loaded when the operator runs, not when the add-on is enabled
+forci_dds = forci_lazy.lazy_import(".forci_dds", __package__)
+forci_change_plan = forci_lazy.lazy_import(".forci_change_plan", __package__)
+forci_texture_lookup = forci_lazy.lazy_import(".forci_texture_lookup", __package__)
+
+# What a DDS can be replaced with, in order of preference
+REPLACEMENT_EXTENSIONS = (".png", ".tga", ".jpg", ".jpeg")
+
+class ForciTextureReplaceOperator(forci_lazy.OperatorImplementation):
+   def steps(self, context):
+      # Get the texture directory from the addon preferences
+      preferences = texture_preferences(context)
+      texture_directory = preferences.forcica_texture_directory
+
+      tracker = get_tracker()
+      materials = forci_scene_index.get_index().used_materials()
+      if self.only_changed:
+         materials = tracker.pending(materials, texture_directory)
+      else:
+         tracker.reset()
+      # Un undo ou une suppression pendant les pauses invalide les matériaux : seuls leurs noms passent les yields
+      material_names = [material.name for material in materials]
+      replacements = yield from self.collect_replacements(material_names, texture_directory)
+      if not replacements:
+         if not self.dry_run:
+            tracker.mark_done(materials_by_name(material_names))
+         self.report({'INFO'}, "No DDS texture to replace")
+         return {'FINISHED'}
+
+      # One listing of the texture directory instead of a stat per material
+      self.textures = forci_texture_lookup.TextureDirectory(texture_directory)
+
+      # Convert the missing PNGs in bulk before touching any material
+      if preferences.forcica_convert_missing_dds and not self.dry_run:
+         yield from self.convert_missing(replacements)
+
+      # Plan every relink first, the plan then applies them with a single update
+      plan = forci_change_plan.ChangePlan("Replace Textures")
+      missing = set()
+      for material_name, node_name, dds_filepath, png_filename, png_filepath in replacements:
+         material = bpy.data.materials.get(material_name)
+         if material is None:
+            continue
+         found_filepath = self.textures.find(png_filename, REPLACEMENT_EXTENSIONS)
+         if found_filepath or self.dry_run:
+               # Point the existing Image Texture node at the PNG, no new node
+               plan.replace_image(material, node_name, found_filepath or png_filepath)
+         else:
+               missing.add(material_name)
+               self.report({'WARNING'}, f"PNG texture {png_filename} not found in directory")
+
+      # Every relink in one go, without a pause
+      result = forci_change_plan.run_plan(self, bpy.context, plan, self.dry_run)
+      if not self.dry_run:
+         # Materials still waiting for a PNG are looked at again on the next run
+         tracker.mark_done(material for material in materials_by_name(material_names) if material.name not in missing)
+      return result
+
+   def collect_replacements(self, material_names, texture_directory):
+      """Return (material name, image node name, dds path, png filename, png path) for every DDS Base Color"""
+      index = forci_scene_index.get_index()
+      extensions = ['.dds', '.dds.001', '.dds.002', '.dds.003', '.dds.004', '.dds.005']
+      replacements = []
+
+      # Iterate through the materials used by mesh objects, once per material
+      yield "Scanning materials"
+      for done, material_name in enumerate(material_names, 1):
+         yield done, len(material_names)
+         material = bpy.data.materials.get(material_name)
+         if material is None:
+            continue
+         forci_profiler.count("materials")
+         if material.use_nodes:
+            forci_profiler.count("nodes", len(material.node_tree.nodes))
+            # Iterate through the nodes of the material
+            for node in material.node_tree.nodes:
+                  if node.type == 'BSDF_PRINCIPLED':
+                     # Check if the Base Color input is linked to an image texture node
+                     linked_node = index.upstream_node(material, node, "Base Color")
+                     if linked_node and linked_node.type == 'TEX_IMAGE':
+                           image = linked_node.image
+                           if image and any(image.filepath.lower().endswith(ext) for ext in extensions):
+                              # Remove the .dds extensions from the image name
+                              base_name = os.path.splitext(image.name)[0]
+                              for ext in extensions:
+                                    base_name = base_name.replace(ext, '')
+                              png_filename = base_name + ".png"
+
+                              # Get the full path to the PNG file using os.path.join
+                              png_filepath = os.path.join(texture_directory, png_filename)
+                              replacements.append((material.name, linked_node.name, bpy.path.abspath(image.filepath), png_filename, png_filepath))
+      return replacements
+
+   def convert_missing(self, replacements):
+      """Decode the DDS sources of missing PNGs with forci_dds on a process pool"""
+      jobs = {}
+      unsupported = {}   # format -> DDS files the decoder cannot read
+      for material_name, node_name, dds_filepath, png_filename, png_filepath in replacements:
+         if png_filepath in jobs or self.textures.find(png_filename, REPLACEMENT_EXTENSIONS):
+            continue
+         if os.path.isfile(dds_filepath):
+            dds_format = forci_dds.unsupported_format(dds_filepath)
+            if dds_format:
+               unsupported.setdefault(dds_format, set()).add(os.path.basename(dds_filepath))
+            else:
+               jobs[png_filepath] = dds_filepath
+      for dds_format, names in sorted(unsupported.items()):
+         shown = ", ".join(sorted(names)[:5]) + (", ..." if len(names) > 5 else "")
+         self.report({'WARNING'}, f"{len(names)} {dds_format} DDS textures can't be converted here, convert them to PNG with texconv: {shown}")
+
+      if not jobs:
+         return
+      # Blender 2.8x reports itself as sys.executable, the workers need the bundled Python
+      python_executable = getattr(bpy.app, "binary_path_python", None)
+      yield "Converting DDS textures"
+      failures = yield from forci_dds.iter_convert([(source, destination) for destination, source in jobs.items()], python_executable=python_executable)
+      failed = {destination for (source, destination), error in failures}
+      for destination in jobs.keys() - failed:
+         if os.path.isfile(destination):
+            self.textures.add(destination)
+            forci_profiler.count("bytes_written", os.path.getsize(destination))
+      for (source, destination), error in failures:
+         self.report({'WARNING'}, f"Could not convert {source}: {error}")
+      self.report({'INFO'}, f"Converted {len(jobs) - len(failures)} DDS textures to PNG")
+
+def materials_by_name(names):
+   """The materials still named in names, the ones removed since are skipped"""
+   return [material for material in map(bpy.data.materials.get, names) if material is not None]
+
+class ForciReplaceTracker:
+   """The used materials the Texture Replacer has nothing left to do on.
+
+   A material is remembered, with the scene index's edit number for it, once its Base
+   Color no longer comes from a DDS (converted, or never was one). The index numbers every
+   material edited since, directly or through its node tree or images, so a re-run only
+   revisits those and the new materials.
+   """
+
+   def __init__(self):
+      self.done = {}   # datablock key -> edit number when the material was checked
+      self.directory = None
+      self.resets = None
+
+   def reset(self):
+      self.__init__()
+
+   def pending(self, materials, directory):
+      """Return the materials out of materials still to look at"""
+      index = forci_scene_index.get_index()
+      if directory != self.directory or index.resets != self.resets:
+         # The PNG paths depend on the texture directory, a file load or undo reallocates everything
+         self.reset()
+         self.directory = directory
+         self.resets = index.resets
+      pending = []
+      for material in materials:
+         key = forci_scene_index.datablock_key(material)
+         if self.done.get(key) != index.changes.get(key, 0):
+            pending.append(material)
+      return pending
+
+   def mark_done(self, materials):
+      index = forci_scene_index.get_index()
+      for material in materials:
+         self.done[forci_scene_index.datablock_key(material)] = index.changed(material)
+
+
+_tracker = ForciReplaceTracker()
+
+def get_tracker():
+   return _tracker
+
+def texture_preferences(context):
+   # Keyed by the package name, whatever the add-on folder was called when installed
+   return context.preferences.addons[__package__].preferences
@@ -0,0 +1,305 @@
+"""The registered FORCI operators: names, properties and poll() only.
+
+The tool modules doing the work are imported by forci_lazy.LazyOperator the first time
+one of their operators runs.
+"""
+
+import bpy
+from . import forci_lazy
+from . import forci_modal_runner
+from . import forci_name_query
+from . import forci_node_inputs
+from .properties import alpha_scope_items
+
+# --- Texture Replacement (texture_renamer_forci) ------------------------------
+
+class ForciTextureRenamerOperator(forci_modal_runner.ForciSlicedOperator, forci_lazy.LazyOperator, bpy.types.Operator):
+   """Automatically rename textures connected to Principled BSDF Materials"""
+   bl_idname = "forcica.texture_renamer"
+   bl_label = "Rename Textures"
+   implementation = "texture_renamer_forci.ForciTextureRenamerOperator"
+
+class ForciTextureReplacerOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Automatically replace textures connected to Principled BSDF Materials"""
+   bl_idname = "forcica.texture_replacer"
+   bl_label = "Replace Duplicate Material Names"
+   implementation = "texture_renamer_forci.ForciTextureReplacerOperator"
+
+class ForciMaterialMergerOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Merge material duplicates into the original one"""
+   bl_idname = "forcica.material_merger"
+   bl_label = "Merge Material Duplicates"
+   implementation = "texture_renamer_forci.ForciMaterialMergerOperator"
+
+# --- Yakuza Shader Texture Handler (yakuza_rename_texture_forci_v_4, v1) -------
+
+class ForciYakuzaTextureHandler(forci_modal_runner.ForciSlicedOperator, forci_lazy.LazyOperator, bpy.types.Operator):
+   """Handle Yakuza Shader Textures"""
+   bl_idname = "object.forci_yakuza_texture_handler"
+   bl_label = "Handle Yakuza Shader Textures"
+   implementation = "yakuza_rename_texture_forci_v_4.ForciYakuzaTextureHandler"
+
+   @classmethod
+   def poll(cls, context):
+      return context.active_object is not None
+
+class ForciYakuzaTextureV1Handler(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Handle Yakuza Shader Textures"""
+   bl_idname = "object.forci_yakuza_texture_handler_v1"
+   bl_label = "Handle Yakuza Shader Textures (v1)"
+   implementation = "yakuza_rename_texture_forci.ForciYakuzaTextureV1Handler"
+
+   @classmethod
+   def poll(cls, context):
+      return context.active_object is not None
+
+# --- Texture Replacer, DDS to PNG (material_changing_forci) --------------------
+
+class ForciTextureReplaceOperator(forci_modal_runner.ForciSlicedOperator, forci_lazy.LazyOperator, bpy.types.Operator):
+   bl_idname = "forcica.texture_replace_operator"
+   bl_label = "Replace Textures"
+   implementation = "material_changing_forci.ForciTextureReplaceOperator"
+
+   dry_run: bpy.props.BoolProperty(
+      name="Dry Run",
+      description="Only list the replacements in the 'FORCI Plan' text instead of applying them",
+      default=False
+   ) # type: ignore
+   only_changed: bpy.props.BoolProperty(
+      name="Only Changed",
+      description="Skip the materials already converted or checked by a previous run and not edited since",
+      default=True
+   ) # type: ignore
+
+# --- Change Name Texture (change_texture_name_forci) ---------------------------
+
+class ForciChangeNameTextureOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Change material name for all objects in the scene based on texture name used in shader nodes,
+      removing .png extension and numeric suffixes, including custom 'Neo Yakuza Shader' nodes"""
+   bl_idname = "forcica.change_name_texture"
+   bl_label = "Change Material Name"
+   implementation = "change_texture_name_forci.ForciChangeNameTextureOperator"
+
+   dry_run: bpy.props.BoolProperty(
+      name="Dry Run",
+      description="Only list the renames in the 'FORCI Plan' text instead of applying them",
+      default=False
+   ) # type: ignore
+
+# --- Select Objects by Material and Texture (select_object_texture_forci) -----
+
+class SelectObjectsByMaterialNameOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Select objects with the same material name"""
+   bl_idname = "object.select_by_material_name"
+   bl_label = "Select by Material Name"
+   implementation = "select_object_texture_forci.SelectObjectsByMaterialNameOperator"
+
+   material_name: bpy.props.StringProperty(name="Material Name", default="")
+
+class SelectObjectsByTextureNameOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Select objects with the specified texture name"""
+   bl_idname = "object.select_by_texture_name"
+   bl_label = "Select by Texture Name"
+   implementation = "select_object_texture_forci.SelectObjectsByTextureNameOperator"
+
+   texture_name: bpy.props.StringProperty(name="Texture Name", default="")
+
+class ReconnectPrincipledBSDFOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Reconnect Principled BSDF to Material Output and Texture to Base Color"""
+   bl_idname = "object.reconnect_principled_bsdf"
+   bl_label = "Reconnect Principled BSDF"
+   implementation = "select_object_texture_forci.ReconnectPrincipledBSDFOperator"
+
+class SelectObjectsWithoutMaterialsOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Select objects without materials"""
+   bl_idname = "object.select_without_materials"
+   bl_label = "Select Objects Without Materials"
+   implementation = "select_object_texture_forci.SelectObjectsWithoutMaterialsOperator"
+
+class ConnectClosestLeftNodeOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Connect the closest left node to the Principled BSDF node for all selected meshes,
+   ensuring shared textures are only connected once."""
+   bl_idname = "material.connect_closest_left_node"
+   bl_label = "Connect Closest Left Node Once per Shared Texture Node"
+   implementation = "select_object_texture_forci.ConnectClosestLeftNodeOperator"
+
+# --- Remove Unused Mesh (remove_unused_meshed_forci) ---------------------------
+
+class ForcicaRemoveMeshOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Remove Meshes based on material name or lack thereof"""
+   bl_idname = "forcica.remove_mesh"
+   bl_label = "Conditionally Remove Meshes"
+   bl_options = {'REGISTER', 'UNDO'}
+   implementation = "remove_unused_meshed_forci.ForcicaRemoveMeshOperator"
+
+   texture_name: bpy.props.StringProperty(
+      name="Material Name to Check",
+      description="Enter the name of the material to remove meshes, leave blank to remove meshes without any materials",
+      default=""
+   )
+   match_mode: bpy.props.EnumProperty(
+      name="Match",
+      items=forci_name_query.query_mode_items,
+      default='SUBSTRING'
+   )
+   purge_orphans: bpy.props.BoolProperty(
+      name="Purge Orphan Data",
+      description="Also remove the meshes, materials and images left without users",
+      default=True
+   )
+   preview_count: bpy.props.IntProperty(options={'HIDDEN', 'SKIP_SAVE'})
+
+   def invoke(self, context, event):
+      return self.implement().invoke(context, event)
+
+   def draw(self, context):
+      self.implement().draw(context)
+
+# --- Alpha ON (alpha_applying_forci) -------------------------------------------
+
+class ForciAlphaApplyingOperator(forci_modal_runner.ForciSlicedOperator, forci_lazy.LazyOperator, bpy.types.Operator):
+   """Apply Alpha Texture to Principled BSDF Material. In EEVEE Next (Blender 4.2+) Alpha Clip textures render Dithered, not as a hard cutout"""
+   bl_idname = "forcica.alpha_applying"
+   bl_label = "Apply Alpha Texture"
+   implementation = "alpha_applying_forci.ForciAlphaApplyingOperator"
+
+   scope: bpy.props.EnumProperty(
+      name="Scope",
+      description="Which materials to change, the panel's choice when left unset",
+      items=alpha_scope_items,
+      default='ACTIVE'
+   ) # type: ignore
+   collection_name: bpy.props.StringProperty(
+      name="Collection",
+      description="Collection used by the Collection scope, the active collection when empty",
+      default=""
+   ) # type: ignore
+   analyze_pixels: bpy.props.BoolProperty(
+      name="Analyze Pixels",
+      description="Read each texture's alpha to choose Opaque, Alpha Clip or Alpha Blend. Off: always link the Alpha output and leave the blend mode alone",
+      default=True
+   ) # type: ignore
+   analysis_size: bpy.props.IntProperty(
+      name="Analysis Size",
+      description="Textures with more pixels than this size squared are analyzed from a downscaled copy",
+      default=1024,
+      min=64
+   ) # type: ignore
+   translucent_fraction: bpy.props.FloatProperty(
+      name="Translucent Share",
+      description="Share of partially transparent pixels above which a texture needs Alpha Blend instead of Alpha Clip",
+      default=0.02,
+      min=0.0,
+      max=1.0,
+      subtype='FACTOR'
+   ) # type: ignore
+
+class ForciAlphaBlendOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Toggle Alpha Blend Mode for Material"""
+   bl_idname = "forcica.alpha_blend"
+   bl_label = "Toggle Alpha Blend Mode"
+   implementation = "alpha_applying_forci.ForciAlphaBlendOperator"
+
+   scope: bpy.props.EnumProperty(
+      name="Scope",
+      description="Which materials to change, the panel's choice when left unset",
+      items=alpha_scope_items,
+      default='ACTIVE'
+   ) # type: ignore
+   collection_name: bpy.props.StringProperty(
+      name="Collection",
+      description="Collection used by the Collection scope, the active collection when empty",
+      default=""
+   ) # type: ignore
+
+# --- Specular Zero (specular_zero_forci) ---------------------------------------
+
+class ForciSpecularZeroOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Set Specular to Zero for all Principled BSDF Materials"""
+   bl_idname = "forcica.specular_zero"
+   bl_label = "Set Specular to Zero"
+   implementation = "specular_zero_forci.ForciSpecularZeroOperator"
+
+class ForciNodeInputsOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Set several node inputs on every material in one pass"""
+   bl_idname = "forcica.set_node_inputs"
+   bl_label = "Set Node Inputs"
+   implementation = "specular_zero_forci.ForciNodeInputsOperator"
+
+   preset: bpy.props.EnumProperty(
+      name="Preset",
+      description="Rules to apply when Rules is empty, the panel's choice when left unset",
+      items=forci_node_inputs.preset_items
+   ) # type: ignore
+   rules: bpy.props.StringProperty(
+      name="Rules",
+      description="node.input = value entries separated by ';', e.g. BSDF_PRINCIPLED.Roughness = 0.8; BSDF_PRINCIPLED.Specular = value * 0.5",
+      default=""
+   ) # type: ignore
+
+# --- Replace and Create Collection Name (replace_collection_name) --------------
+
+class ForciCollectionRenamerOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Rename collections by replacing words"""
+   bl_idname = "forcica.collection_renamer"
+   bl_label = "Replace Collection Names"
+   implementation = "replace_collection_name.ForciCollectionRenamerOperator"
+
+   dry_run: bpy.props.BoolProperty(
+      name="Dry Run",
+      description="Only list the renames in the 'FORCI Plan' text instead of applying them",
+      default=False
+   ) # type: ignore
+
+class ForciCreateCollectionsFromSelectionOperator(forci_lazy.LazyOperator, bpy.types.Operator):
+   """Create collections from selected objects"""
+   bl_idname = "forcica.create_collections_from_selection"
+   bl_label = "Create Collections From Selection"
+   implementation = "replace_collection_name.ForciCreateCollectionsFromSelectionOperator"
+
+   collection_name: bpy.props.StringProperty(name="Collection Name", default="")
+
+# --- ForciPM Rigging Tool (convert_axis_to_bones) ------------------------------
+
+class OBJECT_OT_CreateRiggedArmature(forci_lazy.LazyOperator, bpy.types.Operator):
+   bl_idname = "object.create_rigged_armature_operator"
+   bl_label = "Create Rigged Armature"
+   bl_options = {'REGISTER', 'UNDO'}
+   implementation = "convert_axis_to_bones.OBJECT_OT_CreateRiggedArmature"
+
+   bake_world_space: bpy.props.BoolProperty(
+      name="Bake World Space",
+      description="Sample the empties' world matrices over the frame range instead of copying their local F-curves",
+      default=False
+   ) # type: ignore
+
+CLASSES = (
+   ForciTextureRenamerOperator,
+   ForciTextureReplacerOperator,
+   ForciMaterialMergerOperator,
+   ForciYakuzaTextureHandler,
+   ForciYakuzaTextureV1Handler,
+   ForciTextureReplaceOperator,
+   ForciChangeNameTextureOperator,
+   SelectObjectsByMaterialNameOperator,
+   SelectObjectsByTextureNameOperator,
+   ReconnectPrincipledBSDFOperator,
+   SelectObjectsWithoutMaterialsOperator,
+   ConnectClosestLeftNodeOperator,
+   ForcicaRemoveMeshOperator,
+   ForciAlphaApplyingOperator,
+   ForciAlphaBlendOperator,
+   ForciSpecularZeroOperator,
+   ForciNodeInputsOperator,
+   ForciCollectionRenamerOperator,
+   ForciCreateCollectionsFromSelectionOperator,
+   OBJECT_OT_CreateRiggedArmature,
+)
+
+def register():
+   for cls in CLASSES:
+      bpy.utils.register_class(cls)
+
+def unregister():
+   for cls in reversed(CLASSES):
+      bpy.utils.unregister_class(cls)
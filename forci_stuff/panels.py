@@ -0,0 +1,262 @@
+"""The FORCI STUFF panels of the N panel, in their registration order"""
+
+import re
+import bpy
+from . import forci_name_query
+from . import operators
+
+def draw_match_count(layout, collection_name, pattern, mode):
+   """Live number of matching names under the search field, served from the query engine cache"""
+   if not pattern:
+      return
+   try:
+      count = forci_name_query.get_query_engine().count(collection_name, pattern, mode)
+   except re.error:
+      layout.label(text="Invalid regular expression", icon='ERROR')
+      return
+   layout.label(text=f"{count} matching {collection_name}")
+
+class ForciTextureRenamerPanel(bpy.types.Panel):
+   """Creates a Panel in the Object properties window"""
+   bl_label = "Texture Replacement (Name & Location)"
+   bl_idname = "MATERIAL_PT_forci_texture_renamer"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+
+   def draw(self, context):
+      layout = self.layout
+      scene = context.scene
+      layout.prop(scene.forcica_texture_renamer_props, "source_folder")
+      layout.prop(scene.forcica_texture_renamer_props, "destination_folder")
+      layout.operator(operators.ForciTextureRenamerOperator.bl_idname)
+      layout.operator(operators.ForciMaterialMergerOperator.bl_idname)
+
+class ForciTextureReplacerPanel(bpy.types.Panel):
+   """Creates a Panel in the Object properties window"""
+   bl_label = "Texture Replacement (Prefix)"
+   bl_idname = "MATERIAL_PT_forci_texture_replacer"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+
+   def draw(self, context):
+      layout = self.layout
+      scene = context.scene
+      layout.prop(scene.forcica_texture_renamer_props, "replace_source_folder")
+      layout.prop(scene.forcica_texture_renamer_props, "old_prefix")
+      layout.prop(scene.forcica_texture_renamer_props, "new_prefix")
+      layout.operator(operators.ForciTextureReplacerOperator.bl_idname)
+
+class ForciYakuzaTexturePanel(bpy.types.Panel):
+   """Creates a Panel in the Object properties window"""
+   bl_label = "Yakuza Shader Texture Handler"
+   bl_idname = "OBJECT_PT_forci_yakuza_texture"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+
+   def draw(self, context):
+      layout = self.layout
+      scene = context.scene
+      layout.prop(scene.forci_yakuza_texture_props, "source_folder")
+      layout.prop(scene.forci_yakuza_texture_props, "destination_folder")
+      layout.prop(scene.forci_yakuza_texture_props, "used_textures_folder")
+      layout.operator(operators.ForciYakuzaTextureHandler.bl_idname)
+
+class ForciYakuzaTextureV1Panel(bpy.types.Panel):
+   """Creates a Panel in the Object properties window"""
+   bl_label = "Yakuza Shader Texture Handler (v1)"
+   bl_idname = "OBJECT_PT_forci_yakuza_texture_v1"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+   # Superseded by v4, kept folded for the files still set up for it
+   bl_options = {'DEFAULT_CLOSED'}
+
+   def draw(self, context):
+      layout = self.layout
+      scene = context.scene
+      layout.prop(scene.forci_yakuza_texture_v1_props, "source_folder")
+      layout.prop(scene.forci_yakuza_texture_v1_props, "destination_folder")
+      layout.operator(operators.ForciYakuzaTextureV1Handler.bl_idname)
+
+class ForciTextureReplacePanel(bpy.types.Panel):
+   bl_label = "Texture Replacer (DDS to PNG)"
+   bl_idname = "OBJECT_PT_forci_texture_replacer"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+
+   def draw(self, context):
+      layout = self.layout
+      preferences = context.preferences.addons[__package__].preferences
+      layout.prop(preferences, "forcica_texture_directory", text="Texture Directory")
+      layout.prop(preferences, "forcica_convert_missing_dds")
+      layout.operator(operators.ForciTextureReplaceOperator.bl_idname)
+      row = layout.row(align=True)
+      row.operator(operators.ForciTextureReplaceOperator.bl_idname, text="Preview Replacements").dry_run = True
+      row.operator(operators.ForciTextureReplaceOperator.bl_idname, text="Rescan All", icon='FILE_REFRESH').only_changed = False
+
+class ForciChangeNameTexturePanel(bpy.types.Panel):
+   """Creates a Panel in the Object properties window"""
+   bl_label = "Change Name Texture"
+   bl_idname = "MATERIAL_PT_forci_change_name_texture"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+
+   def draw(self, context):
+      layout = self.layout
+      layout.operator(operators.ForciChangeNameTextureOperator.bl_idname)
+      layout.operator(operators.ForciChangeNameTextureOperator.bl_idname, text="Preview Renames").dry_run = True
+
+class SelectObjectsByMaterialAndTexturePanel(bpy.types.Panel):
+   """Creates a Panel in the Object properties window"""
+   bl_label = "Select Objects by Material and Texture"
+   bl_idname = "OBJECT_PT_select_by_material_and_texture"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+
+   def draw(self, context):
+      layout = self.layout
+      wm = context.window_manager
+
+      layout.prop(wm, "material_name")
+      layout.prop(wm, "material_match_mode", text="")
+      draw_match_count(layout, "materials", wm.material_name, wm.material_match_mode)
+      layout.operator(operators.SelectObjectsByMaterialNameOperator.bl_idname)
+
+      layout.prop(wm, "texture_name")
+      layout.prop(wm, "texture_match_mode", text="")
+      draw_match_count(layout, "images", wm.texture_name, wm.texture_match_mode)
+      layout.operator(operators.SelectObjectsByTextureNameOperator.bl_idname)
+
+      layout.operator(operators.ReconnectPrincipledBSDFOperator.bl_idname)
+
+      layout.operator(operators.SelectObjectsWithoutMaterialsOperator.bl_idname)
+
+      layout.operator(operators.ConnectClosestLeftNodeOperator.bl_idname)
+
+class ForcicaRemoveMeshPanel(bpy.types.Panel):
+   """Creates a Panel in the Object properties window"""
+   bl_label = "Remove Unused Mesh"
+   bl_idname = "MATERIAL_PT_forcica_remove_mesh"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+
+   def draw(self, context):
+      layout = self.layout
+      layout.use_property_split = True
+      layout.use_property_decorate = False
+      settings = context.scene.forcica_remove_mesh_settings
+
+      col = layout.column()
+      col.prop(settings, "texture_name")
+      col.prop(settings, "match_mode")
+      if settings.texture_name:
+         try:
+            count = forci_name_query.get_query_engine().count("materials", settings.texture_name, settings.match_mode)
+            col.label(text=f"{count} matching materials")
+         except re.error:
+            col.label(text="Invalid regular expression", icon='ERROR')
+      col.prop(settings, "purge_orphans")
+      op = col.operator(operators.ForcicaRemoveMeshOperator.bl_idname)
+      op.texture_name = settings.texture_name
+      op.match_mode = settings.match_mode
+      op.purge_orphans = settings.purge_orphans
+
+class ForciAlphaChangingPanel(bpy.types.Panel):
+   """Creates a Panel in the Object properties window"""
+   bl_label = "Alpha ON"
+   bl_idname = "MATERIAL_PT_forci_alpha_changing"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+
+   def draw(self, context):
+      layout = self.layout
+      settings = context.scene.forci_alpha_settings
+      layout.prop(settings, "scope")
+      if settings.scope == 'COLLECTION':
+         layout.prop(settings, "collection")
+      # Les opérateurs lisent le scope dans ces réglages
+      layout.operator(operators.ForciAlphaApplyingOperator.bl_idname)
+      layout.operator(operators.ForciAlphaBlendOperator.bl_idname)
+
+class ForciSpecularZeroPanel(bpy.types.Panel):
+   """Creates a Panel in the Object properties window"""
+   bl_label = "Specular Zero"
+   bl_idname = "MATERIAL_PT_forci_specular_zero"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+
+   def draw(self, context):
+      layout = self.layout
+      layout.operator(operators.ForciSpecularZeroOperator.bl_idname)
+      settings = context.scene.forci_node_input_settings
+      layout.prop(settings, "preset")
+      layout.prop(settings, "rules")
+      # L'opérateur lit le preset et les règles dans ces réglages
+      layout.operator(operators.ForciNodeInputsOperator.bl_idname)
+
+class ForciCollectionNamePanel(bpy.types.Panel):
+   """Creates a Panel in the Object properties window"""
+   bl_label = "Replace and Create Collection Name"
+   bl_idname = "VIEW3D_PT_forci_collection_name"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'FORCI STUFF'
+
+   def draw(self, context):
+      layout = self.layout
+      props = context.scene.collection_renamer_props
+
+      layout.prop(props, "old_word")
+      layout.prop(props, "new_word")
+      row = layout.row(align=True)
+      row.operator(operators.ForciCollectionRenamerOperator.bl_idname)
+      row.operator(operators.ForciCollectionRenamerOperator.bl_idname, text="", icon='VIEWZOOM').dry_run = True
+
+      layout.separator()
+
+      layout.prop(props, "base_word", text="Collection Name")
+      layout.operator(operators.ForciCreateCollectionsFromSelectionOperator.bl_idname)
+
+class ForciPM_PT_Panel(bpy.types.Panel):
+   bl_label = "ForciPM Rigging Tool"
+   bl_idname = "FORCIPM_PT_panel"
+   bl_space_type = 'VIEW_3D'
+   bl_region_type = 'UI'
+   bl_category = 'ForciPM'
+
+   def draw(self, context):
+      layout = self.layout
+      layout.operator(operators.OBJECT_OT_CreateRiggedArmature.bl_idname, text="Create Rigged Armature")
+      layout.operator(operators.OBJECT_OT_CreateRiggedArmature.bl_idname, text="Create Rigged Armature (Bake World Space)").bake_world_space = True
+
+CLASSES = (
+   ForciTextureRenamerPanel,
+   ForciTextureReplacerPanel,
+   ForciYakuzaTexturePanel,
+   ForciYakuzaTextureV1Panel,
+   ForciTextureReplacePanel,
+   ForciChangeNameTexturePanel,
+   SelectObjectsByMaterialAndTexturePanel,
+   ForcicaRemoveMeshPanel,
+   ForciAlphaChangingPanel,
+   ForciSpecularZeroPanel,
+   ForciCollectionNamePanel,
+   ForciPM_PT_Panel,
+)
+
+def register():
+   for cls in CLASSES:
+      bpy.utils.register_class(cls)
+
+def unregister():
+   for cls in reversed(CLASSES):
+      bpy.utils.unregister_class(cls)
@@ -0,0 +1,33 @@
+"""The add-on preferences: the Texture Replacer's texture directory and the startup timings"""
+
+import bpy
+from . import startup_timings
+
+class ForciStuffPreferences(bpy.types.AddonPreferences):
+   bl_idname = __package__
+
+   forcica_texture_directory: bpy.props.StringProperty(
+      name="Texture Directory",
+      subtype='DIR_PATH'
+   ) # type: ignore
+   forcica_convert_missing_dds: bpy.props.BoolProperty(
+      name="Convert Missing PNGs",
+      description="Decode the DDS texture and write the PNG when it is not in the texture directory yet",
+      default=True
+   ) # type: ignore
+
+   def draw(self, context):
+      layout = self.layout
+      layout.prop(self, "forcica_texture_directory")
+      layout.prop(self, "forcica_convert_missing_dds")
+
+      box = layout.box()
+      box.label(text=f"Registered in {sum(seconds for name, seconds in startup_timings) * 1000:.1f} ms", icon='TIME')
+      for name, seconds in startup_timings:
+         box.label(text=f"{name}: {seconds * 1000:.1f} ms")
+
+def register():
+   bpy.utils.register_class(ForciStuffPreferences)
+
+def unregister():
+   bpy.utils.unregister_class(ForciStuffPreferences)
@@ -0,0 +1,164 @@
+"""The settings the panels edit, stored on the scene and the window manager"""
+
+import bpy
+from . import forci_name_query
+from . import forci_node_inputs
+
+alpha_scope_items = [
+   ('ACTIVE', "Active Object", "Only the materials of the active object"),
+   ('SELECTED', "Selected Objects", "The materials of every selected mesh"),
+   ('COLLECTION', "Collection", "The materials of every mesh in the collection and its children"),
+   ('FILE', "Whole File", "Every material of the file"),
+]
+
+class ForciTextureRenamerProps(bpy.types.PropertyGroup):
+   source_folder: bpy.props.StringProperty(
+      name="Source Folder",
+      description="Folder where original textures are located",
+      subtype='DIR_PATH'
+   ) # type: ignore
+   destination_folder: bpy.props.StringProperty(
+      name="Destination Folder",
+      description="Folder where renamed textures will be saved",
+      subtype='DIR_PATH'
+   ) # type: ignore
+   replace_source_folder: bpy.props.StringProperty(
+      name="Replacement Source Folder",
+      description="Folder where new textures are located",
+      subtype='DIR_PATH'
+   ) # type: ignore
+   old_prefix: bpy.props.StringProperty(
+      name="Old Prefix",
+      description="Old prefix in texture filenames to be replaced",
+   ) # type: ignore
+   new_prefix: bpy.props.StringProperty(
+      name="New Prefix",
+      description="New prefix to replace the old prefix in texture filenames",
+   )  # type: ignore
+
+class ForciYakuzaTextureProps(bpy.types.PropertyGroup):
+   source_folder: bpy.props.StringProperty(
+      name="Source Folder",
+      description="Folder where original textures are located",
+      subtype='DIR_PATH'
+   )
+   destination_folder: bpy.props.StringProperty(
+      name="Destination Folder",
+      description="Folder where processed textures will be placed",
+      subtype='DIR_PATH'
+   )
+   used_textures_folder: bpy.props.StringProperty(
+      name="Used Textures Folder",
+      description="Folder where used textures will be copied",
+      subtype='DIR_PATH'
+   )
+
+class ForciYakuzaTextureV1Props(bpy.types.PropertyGroup):
+   source_folder: bpy.props.StringProperty(
+      name="Source Folder",
+      description="Folder where original textures are located",
+      subtype='DIR_PATH'
+   )
+   destination_folder: bpy.props.StringProperty(
+      name="Destination Folder",
+      description="Folder where processed textures will be placed",
+      subtype='DIR_PATH'
+   )
+
+class ForcicaRemoveMeshSettings(bpy.types.PropertyGroup):
+   texture_name: bpy.props.StringProperty(
+      name="Material Name to Check",
+      description="Enter the name of the material to check, leave blank to target meshes without materials",
+      default="",
+      options={'TEXTEDIT_UPDATE'}
+   )
+   match_mode: bpy.props.EnumProperty(
+      name="Match",
+      items=forci_name_query.query_mode_items,
+      default='SUBSTRING'
+   )
+   purge_orphans: bpy.props.BoolProperty(
+      name="Purge Orphan Data",
+      description="Also remove the meshes, materials and images left without users",
+      default=True
+   )
+
+class ForciAlphaSettings(bpy.types.PropertyGroup):
+   scope: bpy.props.EnumProperty(
+      name="Scope",
+      items=alpha_scope_items,
+      default='ACTIVE'
+   ) # type: ignore
+   collection: bpy.props.PointerProperty(
+      name="Collection",
+      description="Collection for the Collection scope, the active collection when empty",
+      type=bpy.types.Collection
+   ) # type: ignore
+
+class ForciNodeInputSettings(bpy.types.PropertyGroup):
+   preset: bpy.props.EnumProperty(
+      name="Preset",
+      items=forci_node_inputs.preset_items
+   ) # type: ignore
+   rules: bpy.props.StringProperty(
+      name="Rules",
+      description="node.input = value entries separated by ';', used instead of the preset when filled",
+      default=""
+   ) # type: ignore
+
+class ForciCollectionRenamerProps(bpy.types.PropertyGroup):
+   old_word: bpy.props.StringProperty(
+      name="Old Word",
+      description="Word to be replaced in the collection names",
+      default="AncienMot"
+   ) # type: ignore
+   new_word: bpy.props.StringProperty(
+      name="New Word",
+      description="New word to use in the collection names",
+      default="NouveauMot"
+   ) # type: ignore
+   base_word: bpy.props.StringProperty(
+      name="Base Word",
+      description="Base word for new collection names",
+      default=""
+   ) # type: ignore
+
+CLASSES = (
+   ForciTextureRenamerProps,
+   ForciYakuzaTextureProps,
+   ForciYakuzaTextureV1Props,
+   ForcicaRemoveMeshSettings,
+   ForciAlphaSettings,
+   ForciNodeInputSettings,
+   ForciCollectionRenamerProps,
+)
+
+def register():
+   for cls in CLASSES:
+      bpy.utils.register_class(cls)
+   bpy.types.Scene.forcica_texture_renamer_props = bpy.props.PointerProperty(type=ForciTextureRenamerProps)
+   bpy.types.Scene.forci_yakuza_texture_props = bpy.props.PointerProperty(type=ForciYakuzaTextureProps)
+   bpy.types.Scene.forci_yakuza_texture_v1_props = bpy.props.PointerProperty(type=ForciYakuzaTextureV1Props)
+   bpy.types.Scene.forcica_remove_mesh_settings = bpy.props.PointerProperty(type=ForcicaRemoveMeshSettings)
+   bpy.types.Scene.forci_alpha_settings = bpy.props.PointerProperty(type=ForciAlphaSettings)
+   bpy.types.Scene.forci_node_input_settings = bpy.props.PointerProperty(type=ForciNodeInputSettings)
+   bpy.types.Scene.collection_renamer_props = bpy.props.PointerProperty(type=ForciCollectionRenamerProps)
+   bpy.types.WindowManager.material_name = bpy.props.StringProperty(name="Material Name", default="", options={'TEXTEDIT_UPDATE'})
+   bpy.types.WindowManager.texture_name = bpy.props.StringProperty(name="Texture Name", default="", options={'TEXTEDIT_UPDATE'})
+   bpy.types.WindowManager.material_match_mode = bpy.props.EnumProperty(name="Match", items=forci_name_query.query_mode_items, default='EXACT')
+   bpy.types.WindowManager.texture_match_mode = bpy.props.EnumProperty(name="Match", items=forci_name_query.query_mode_items, default='EXACT')
+
+def unregister():
+   del bpy.types.WindowManager.material_name
+   del bpy.types.WindowManager.texture_name
+   del bpy.types.WindowManager.material_match_mode
+   del bpy.types.WindowManager.texture_match_mode
+   del bpy.types.Scene.forcica_texture_renamer_props
+   del bpy.types.Scene.forci_yakuza_texture_props
+   del bpy.types.Scene.forci_yakuza_texture_v1_props
+   del bpy.types.Scene.forcica_remove_mesh_settings
+   del bpy.types.Scene.forci_alpha_settings
+   del bpy.types.Scene.forci_node_input_settings
+   del bpy.types.Scene.collection_renamer_props
+   for cls in reversed(CLASSES):
+      bpy.utils.unregister_class(cls)
@@ -0,0 +1,97 @@
+import bpy
+import re
+from . import forci_scene_index
+from . import forci_name_query
+from . import forci_profiler
+from . import forci_lazy
+
+def collect_meshes_to_remove(scene, pattern, match_mode):
+   """First phase: find the mesh objects to remove without changing anything, raises re.error on a bad regex"""
+   matches = []
+   if pattern:
+      # Matching material names come from the query engine, their objects from the scene index
+      index = forci_scene_index.get_index()
+      candidates = set()
+      for material in forci_name_query.get_query_engine().materials(pattern, match_mode):
+         candidates.update(index.objects_using_material(material))
+      scene_objects = scene.objects
+      forci_profiler.count("objects", len(candidates))
+      matches = [obj for obj in candidates if scene_objects.get(obj.name) is not None]
+   else:
+      forci_profiler.count("objects", len(scene.objects))
+      for obj in scene.objects:
+         if obj.type == 'MESH' and all(slot.material is None for slot in obj.material_slots):
+            matches.append(obj)
+   return matches
+
+def estimate_mesh_bytes(mesh):
+   # Rough size of the main mesh arrays: positions, edges, corners and faces
+   return len(mesh.vertices) * 16 + len(mesh.edges) * 8 + len(mesh.loops) * 8 + len(mesh.polygons) * 16
+
+def estimate_image_bytes(image):
+   if not image.has_data:
+      return 0
+   width, height = image.size
+   return width * height * image.channels * (4 if image.is_float else 1)
+
+def purge_orphans(meshes):
+   """Remove the given meshes, then the materials and images they leave without users.
+   Returns (meshes, materials, images removed, approximate bytes freed)."""
+   freed = 0
+   orphan_meshes = [mesh for mesh in meshes if mesh.users == 0]
+   materials = {material for mesh in orphan_meshes for material in mesh.materials if material}
+   freed += sum(estimate_mesh_bytes(mesh) for mesh in orphan_meshes)
+   bpy.data.batch_remove(orphan_meshes)
+
+   orphan_materials = [material for material in materials if material.users == 0]
+   images = set()
+   for material in orphan_materials:
+      if material.use_nodes and material.node_tree:
+         images.update(node.image for node in material.node_tree.nodes if node.type == 'TEX_IMAGE' and node.image)
+   bpy.data.batch_remove(orphan_materials)
+
+   orphan_images = [image for image in images if image.users == 0]
+   freed += sum(estimate_image_bytes(image) for image in orphan_images)
+   bpy.data.batch_remove(orphan_images)
+
+   return len(orphan_meshes), len(orphan_materials), len(orphan_images), freed
+
+class ForcicaRemoveMeshOperator(forci_lazy.OperatorImplementation):
+   """Remove Meshes based on material name or lack thereof"""
+   
+   def collect(self, context):
+      try:
+         return collect_meshes_to_remove(context.scene, self.texture_name, self.match_mode)
+      except re.error as error:
+         self.report({'ERROR'}, f"Invalid regular expression: {error}")
+         return None
+
+   def invoke(self, context, event):
+      matches = self.collect(context)
+      if matches is None:
+         return {'CANCELLED'}
+      self.preview_count = len(matches)
+      return context.window_manager.invoke_props_dialog(self.operator)
+
+   def draw(self, context):
+      self.layout.label(text=f"{self.preview_count} meshes will be removed")
+      self.layout.prop(self.operator, "purge_orphans")
+   
+   @forci_profiler.profiled
+   def execute(self, context):
+      matches = self.collect(context)
+      if matches is None:
+         return {'CANCELLED'}
+
+      # Second phase: one batch removal instead of one relations update per object
+      meshes = {obj.data for obj in matches}
+      removed_count = len(matches)
+      bpy.data.batch_remove(matches)
+
+      message = f"Removed {removed_count} meshes based on criteria"
+      if self.purge_orphans:
+         mesh_count, material_count, image_count, freed = purge_orphans(meshes)
+         message += f", purged {mesh_count} mesh datablocks, {material_count} materials and {image_count} images (~{freed / (1024 * 1024):.1f} MB)"
+      
+      self.report({'INFO'}, message)
+      return {'FINISHED'}
@@ -0,0 +1,58 @@
+import bpy
+from . import forci_profiler
+from . import forci_lazy
+
+# Only loaded when the operator runs, not when the add-on is enabled
+forci_change_plan = forci_lazy.lazy_import(".forci_change_plan", __package__)
+
+class ForciCollectionRenamerOperator(forci_lazy.OperatorImplementation):
+   """Rename collections by replacing words"""
+   
+   @forci_profiler.profiled
+   def execute(self, context):
+      props = context.scene.collection_renamer_props
+      old_word = props.old_word
+      new_word = props.new_word
+
+      plan = forci_change_plan.ChangePlan("Replace Collection Names")
+      if old_word:
+         for collection in bpy.data.collections:
+            if old_word in collection.name:
+                  plan.rename(collection, collection.name.replace(old_word, new_word))
+
+      # Renames are applied together and the view layer is updated once
+      return forci_change_plan.run_plan(self, context, plan, self.dry_run)
+
+class ForciCreateCollectionsFromSelectionOperator(forci_lazy.OperatorImplementation):
+   """Create collections from selected objects"""
+
+   @forci_profiler.profiled
+   def execute(self, context):
+      selected_objects = bpy.context.selected_objects
+      parent_collection_name = bpy.context.scene.collection.name
+      collection_name = self.collection_name
+      
+      # Index de décalage initial pour commencer par une collection sans _1
+      offset_index = 0
+      
+      for index, obj in enumerate(selected_objects):
+         # Création du nom de la collection en fonction de l'index
+         collection_number = index + offset_index
+         if collection_number == 0:
+               collection_suffix = ""
+         else:
+               collection_suffix = f"_{collection_number}"
+               
+         reference_collection = bpy.data.collections.new(f"{context.scene.collection_renamer_props.base_word}{collection_suffix}_reference")
+         bpy.context.scene.collection.children.link(reference_collection)
+         
+         phys_collection = bpy.data.collections.new(f"{context.scene.collection_renamer_props.base_word}{collection_suffix}_phys")
+         bpy.context.scene.collection.children.link(phys_collection)
+         
+         if obj.users_collection:  # check if the object is already in a collection
+               for collection in obj.users_collection:
+                  collection.objects.unlink(obj)
+         
+         reference_collection.objects.link(obj)
+         
+      return {'FINISHED'}
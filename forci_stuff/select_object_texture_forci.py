@@ -1,36 +1,47 @@
-bl_info = {
-   "name": "Select Objects by Material and Texture",
-   "author": "Forcica",
-   "version": (1, 0),
-   "blender": (2, 80, 0),
-   "location": "View3D > Tool",
-   "description": "Select objects by material name or by texture name and reconnect nodes",
-   "category": "FORCI STUFF",
-}
-
 import bpy
-
-class SelectObjectsByMaterialNameOperator(bpy.types.Operator):
+import re
+from . import forci_scene_index
+from . import forci_name_query
+from . import forci_profiler
+from . import forci_lazy
+
+def deselect_all(context):
+   """Deselect only what is selected instead of walking the whole scene"""
+   for obj in context.selected_objects:
+      obj.select_set(False)
+
+def select_scene_objects(context, objects):
+   """Select the given objects that belong to the current view layer, return True if any"""
+   found = False
+   view_layer_objects = context.view_layer.objects
+   for obj in objects:
+      forci_profiler.count("objects")
+      if view_layer_objects.get(obj.name) is None:
+         continue
+      obj.select_set(True)
+      view_layer_objects.active = obj
+      found = True
+   return found
+
+class SelectObjectsByMaterialNameOperator(forci_lazy.OperatorImplementation):
    """Select objects with the same material name"""
-   bl_idname = "object.select_by_material_name"
-   bl_label = "Select by Material Name"
-   
-   material_name: bpy.props.StringProperty(name="Material Name", default="")
    
+   @forci_profiler.profiled
    def execute(self, context):
-      bpy.ops.object.select_all(action='DESELECT')
+      deselect_all(context)
       
       mat_name = context.window_manager.material_name
+      try:
+         materials = forci_name_query.get_query_engine().materials(mat_name, context.window_manager.material_match_mode)
+      except re.error as error:
+         self.report({'ERROR'}, f"Invalid regular expression: {error}")
+         return {'CANCELLED'}
       
-      found = False
-
-      for obj in context.scene.objects:
-         if obj.type == 'MESH' and obj.data.materials:
-               for mat_slot in obj.material_slots:
-                  if mat_slot.material and mat_slot.material.name == mat_name:
-                     obj.select_set(True)
-                     found = True
-                     context.view_layer.objects.active = obj
+      index = forci_scene_index.get_index()
+      objects = set()
+      for material in materials:
+         objects.update(index.objects_using_material(material))
+      found = select_scene_objects(context, objects)
                      
       if not found:
          self.report({'WARNING'}, f"No objects found with the material name: {mat_name}")
@@ -38,29 +49,24 @@ class SelectObjectsByMaterialNameOperator(bpy.types.Operator):
       
       return {'FINISHED'}
 
-class SelectObjectsByTextureNameOperator(bpy.types.Operator):
+class SelectObjectsByTextureNameOperator(forci_lazy.OperatorImplementation):
    """Select objects with the specified texture name"""
-   bl_idname = "object.select_by_texture_name"
-   bl_label = "Select by Texture Name"
-   
-   texture_name: bpy.props.StringProperty(name="Texture Name", default="")
    
+   @forci_profiler.profiled
    def execute(self, context):
-      bpy.ops.object.select_all(action='DESELECT')
+      deselect_all(context)
       texture_name = context.window_manager.texture_name
-      found = False
+      try:
+         images = forci_name_query.get_query_engine().images(texture_name, context.window_manager.texture_match_mode)
+      except re.error as error:
+         self.report({'ERROR'}, f"Invalid regular expression: {error}")
+         return {'CANCELLED'}
       
-      for obj in context.scene.objects:
-         if obj.type == 'MESH' and obj.data.materials:
-               for mat_slot in obj.material_slots:
-                  if not mat_slot.material or not mat_slot.material.use_nodes:
-                     continue
-                  for node in mat_slot.material.node_tree.nodes:
-                     if node.type == 'TEX_IMAGE' and node.image and node.image.name == texture_name:
-                           obj.select_set(True)
-                           context.view_layer.objects.active = obj
-                           found = True
-                           break
+      index = forci_scene_index.get_index()
+      objects = set()
+      for image in images:
+         objects.update(index.objects_using_image(image))
+      found = select_scene_objects(context, objects)
       
       if not found:
          self.report({'WARNING'}, f"No objects found with the texture name: {texture_name}")
@@ -68,11 +74,10 @@ class SelectObjectsByTextureNameOperator(bpy.types.Operator):
       
       return {'FINISHED'}
 
-class ReconnectPrincipledBSDFOperator(bpy.types.Operator):
+class ReconnectPrincipledBSDFOperator(forci_lazy.OperatorImplementation):
    """Reconnect Principled BSDF to Material Output and Texture to Base Color"""
-   bl_idname = "object.reconnect_principled_bsdf"
-   bl_label = "Reconnect Principled BSDF"
    
+   @forci_profiler.profiled
    def execute(self, context):
       selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
       
@@ -95,11 +100,10 @@ class ReconnectPrincipledBSDFOperator(bpy.types.Operator):
       
       return {'FINISHED'}
 
-class SelectObjectsWithoutMaterialsOperator(bpy.types.Operator):
+class SelectObjectsWithoutMaterialsOperator(forci_lazy.OperatorImplementation):
    """Select objects without materials"""
-   bl_idname = "object.select_without_materials"
-   bl_label = "Select Objects Without Materials"
    
+   @forci_profiler.profiled
    def execute(self, context):
       bpy.ops.object.select_all(action='DESELECT')
       found = False
@@ -116,12 +120,10 @@ class SelectObjectsWithoutMaterialsOperator(bpy.types.Operator):
       
       return {'FINISHED'}
 
-class ConnectClosestLeftNodeOperator(bpy.types.Operator):
+class ConnectClosestLeftNodeOperator(forci_lazy.OperatorImplementation):
    """Connect the closest left node to the Principled BSDF node for all selected meshes, 
    ensuring shared textures are only connected once."""
-   bl_idname = "material.connect_closest_left_node"
-   bl_label = "Connect Closest Left Node Once per Shared Texture Node"
-
+   @forci_profiler.profiled
    def execute(self, context):
       # Set to keep track of textures that have already been processed
       processed_textures = set()
@@ -176,50 +178,3 @@ class ConnectClosestLeftNodeOperator(bpy.types.Operator):
                      break
 
       return {'FINISHED'}
-
-class SelectObjectsByMaterialAndTexturePanel(bpy.types.Panel):
-   """Creates a Panel in the Object properties window"""
-   bl_label = "Select Objects by Material and Texture"
-   bl_idname = "OBJECT_PT_select_by_material_and_texture"
-   bl_space_type = 'VIEW_3D'
-   bl_region_type = 'UI'
-   bl_category = 'FORCI STUFF'
-   
-   def draw(self, context):
-      layout = self.layout
-      wm = context.window_manager
-      
-      layout.prop(wm, "material_name")
-      layout.operator(SelectObjectsByMaterialNameOperator.bl_idname)
-
-      layout.prop(wm, "texture_name")
-      layout.operator(SelectObjectsByTextureNameOperator.bl_idname)
-      
-      layout.operator(ReconnectPrincipledBSDFOperator.bl_idname)
-      
-      layout.operator(SelectObjectsWithoutMaterialsOperator.bl_idname)
-
-      layout.operator(ConnectClosestLeftNodeOperator.bl_idname)
-
-def register():
-   bpy.utils.register_class(SelectObjectsByMaterialNameOperator)
-   bpy.utils.register_class(SelectObjectsByTextureNameOperator)
-   bpy.utils.register_class(ReconnectPrincipledBSDFOperator)
-   bpy.utils.register_class(SelectObjectsByMaterialAndTexturePanel)
-   bpy.utils.register_class(SelectObjectsWithoutMaterialsOperator)
-   bpy.utils.register_class(ConnectClosestLeftNodeOperator)  # Assurez-vous que cette ligne est ajoutée
-   bpy.types.WindowManager.material_name = bpy.props.StringProperty(name="Material Name", default="")
-   bpy.types.WindowManager.texture_name = bpy.props.StringProperty(name="Texture Name", default="")
-
-def unregister():
-   bpy.utils.unregister_class(SelectObjectsByMaterialNameOperator)
-   bpy.utils.unregister_class(SelectObjectsByTextureNameOperator)
-   bpy.utils.unregister_class(ReconnectPrincipledBSDFOperator)
-   bpy.utils.unregister_class(SelectObjectsByMaterialAndTexturePanel)
-   bpy.utils.unregister_class(SelectObjectsWithoutMaterialsOperator)
-   bpy.utils.unregister_class(ConnectClosestLeftNodeOperator)  # Assurez-vous que cette ligne est ajoutée
-   del bpy.types.WindowManager.material_name
-   del bpy.types.WindowManager.texture_name
-
-if __name__ == "__main__":
-   register()
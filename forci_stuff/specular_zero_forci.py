@@ -0,0 +1,47 @@
+from . import forci_profiler
+from . import forci_node_inputs
+from . import forci_lazy
+
+def report_stats(operator, stats):
+   """The total and each rule's summary, plus a warning for each rule that failed somewhere"""
+   for rule_stats in stats:
+      if rule_stats.errors:
+         operator.report({'WARNING'}, f"{rule_stats.summary()} (first: {rule_stats.first_error})")
+   total = sum(rule_stats.set for rule_stats in stats)
+   operator.report({'INFO'}, f"{total} inputs set: " + "; ".join(rule_stats.summary() for rule_stats in stats))
+
+class ForciSpecularZeroOperator(forci_lazy.OperatorImplementation):
+   """Set Specular to Zero for all Principled BSDF Materials"""
+   
+   @forci_profiler.profiled
+   def execute(self, context):
+      # 'Specular' devient 'Specular IOR Level' dans Blender 4.0, le moteur connaît les deux
+      label, rules = forci_node_inputs.PRESETS['SPECULAR_ZERO']
+      report_stats(self, forci_node_inputs.apply_rules(rules))
+      return {'FINISHED'}
+
+class ForciNodeInputsOperator(forci_lazy.OperatorImplementation):
+   """Set several node inputs on every material in one pass"""
+
+   def get_rules(self, context):
+      if self.properties.is_property_set("preset") or self.properties.is_property_set("rules"):
+         preset, text = self.preset, self.rules
+      else:
+         # Bouton du panneau, script ou forci_batch_runner avec --scene-prop forci_node_input_settings.rules=...
+         settings = context.scene.forci_node_input_settings
+         preset, text = settings.preset, settings.rules
+      if text.strip():
+         return forci_node_inputs.parse_rules(text)
+      if preset not in forci_node_inputs.PRESETS:
+         raise ValueError(f"Unknown preset {preset!r}")
+      return forci_node_inputs.PRESETS[preset][1]
+
+   @forci_profiler.profiled
+   def execute(self, context):
+      try:
+         rules = self.get_rules(context)
+      except ValueError as error:
+         self.report({'ERROR'}, str(error))
+         return {'CANCELLED'}
+      report_stats(self, forci_node_inputs.apply_rules(rules))
+      return {'FINISHED'}
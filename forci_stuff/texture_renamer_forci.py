@@ -0,0 +1,221 @@
+import bpy
+import os
+import re
+import time
+from . import forci_scene_index
+from . import forci_profiler
+from . import forci_image_pool
+from . import forci_lazy
+
+# Only loaded when the operator runs, not when the add-on is enabled
+forci_name_allocator = forci_lazy.lazy_import(".forci_name_allocator", __package__)
+forci_copy_engine = forci_lazy.lazy_import(".forci_copy_engine", __package__)
+forci_texture_hash = forci_lazy.lazy_import(".forci_texture_hash", __package__)
+forci_manifest = forci_lazy.lazy_import(".forci_manifest", __package__)
+
+# Suffixes ajoutés par Blender aux noms en double : .001, .001.002, ...
+duplicate_suffix_regex = re.compile(r"(\.\d+)+$")
+
+class ForciTextureRenamerOperator(forci_lazy.OperatorImplementation):
+   """Automatically rename textures connected to Principled BSDF Materials"""
+
+   def steps(self, context):
+      scene = context.scene
+      source_folder = scene.forcica_texture_renamer_props.source_folder
+      destination_folder = scene.forcica_texture_renamer_props.destination_folder
+
+      if not os.path.exists(destination_folder):
+         os.makedirs(destination_folder)
+
+      yield "Scanning materials"
+      self.abspath_cache = {}
+      self.name_allocator = forci_name_allocator.GenericNameAllocator(destination_folder)
+      used_texture_files = self.get_used_texture_files()
+      texture_users = self.map_texture_users()
+
+      # Les fichiers au contenu identique partagent une seule copie et une seule image
+      yield "Hashing textures"
+      hash_cache = forci_texture_hash.cache_for_folder(destination_folder)
+      texture_hashes = yield from hash_cache.iter_digest(path for path in used_texture_files if path in texture_users)
+      hash_cache.save()
+      renamed_hashes = {}
+
+      # Les noms déjà donnés lors d'un passage précédent (même interrompu) sont repris du manifeste
+      self.manifest = forci_manifest.open_manifest(destination_folder)
+      try:
+         self.manifest.reserve_names(self.name_allocator)
+
+         # Une seule copie par texture : on décide d'abord tous les noms de destination
+         yield "Planning names"
+         self.copy_plan = []
+         self.already_copied = []
+         relink_plan = []
+         for done, texture_path in enumerate(used_texture_files, 1):
+            yield done, len(used_texture_files)
+            users = texture_users.get(texture_path)
+            if not users:
+               continue
+            for material_name, node_name in users:
+               print(f"Mesh correspondant à la texture {texture_path}: {material_name}")
+            content_hash = texture_hashes.get(texture_path)
+            if content_hash and content_hash in renamed_hashes:
+               new_texture_path = renamed_hashes[content_hash]
+            else:
+               new_texture_path = self.rename_texture(texture_path, destination_folder, content_hash)
+               if content_hash:
+                  renamed_hashes[content_hash] = new_texture_path
+            relink_plan.append((texture_path, new_texture_path, users))
+         self.manifest.mark_copied(self.already_copied)
+         self.manifest.commit()
+
+         # Les copies tournent en parallèle, le relinkage reste sur le thread principal
+         yield "Copying textures"
+         failures = yield from forci_copy_engine.iter_copy(self.copy_plan)
+         self.manifest.record_copies(self.copy_plan, failures)
+      finally:
+         self.manifest.close()
+      failed_destinations = {destination for (source, destination), error in failures}
+      for (source, destination), error in failures:
+         self.report({'ERROR'}, f"Could not copy {source} to {destination}: {error}")
+      if self.already_copied:
+         self.report({'INFO'}, f"{len(self.already_copied)} textures were already copied by a previous run")
+
+      # Dernière étape, sans pause : la scène n'est modifiée qu'ici, les matériaux sont retrouvés
+      # par leur nom car un undo ou une suppression pendant les copies a pu les invalider
+      for texture_path, new_texture_path, users in relink_plan:
+         if new_texture_path in failed_destinations:
+            continue
+         new_texture = None
+         for material_name, node_name in users:
+            material = bpy.data.materials.get(material_name)
+            node = material.node_tree.nodes.get(node_name) if material and material.node_tree else None
+            if node is None or not node.inputs['Base Color'].is_linked:
+               continue
+            if new_texture is None:
+               new_texture = forci_image_pool.load(new_texture_path, texture_hashes.get(texture_path))
+            self.update_texture_node(bpy.context, material, node, new_texture)
+
+      self.report({'INFO'}, "Textures renamed successfully")
+      return {'FINISHED'}
+
+   def abspath(self, filepath):
+      """bpy.path.abspath, memoized for the duration of the run"""
+      path = self.abspath_cache.get(filepath)
+      if path is None:
+         path = self.abspath_cache[filepath] = bpy.path.abspath(filepath)
+      return path
+
+   def map_texture_users(self):
+      """Scan the materials once and map each texture path to its (material name, principled node name) users"""
+      index = forci_scene_index.get_index()
+      texture_users = {}
+      for material in bpy.data.materials:
+         forci_profiler.count("materials")
+         if material.use_nodes:
+            forci_profiler.count("nodes", len(material.node_tree.nodes))
+            for node in material.node_tree.nodes:
+               if node.type == 'BSDF_PRINCIPLED':
+                  texture_node = index.upstream_node(material, node, 'Base Color')
+                  if texture_node and texture_node.type == 'TEX_IMAGE' and texture_node.image:
+                     texture_path = self.abspath(texture_node.image.filepath)
+                     texture_users.setdefault(texture_path, []).append((material.name, node.name))
+      return texture_users
+
+   def get_used_texture_files(self):
+      used_texture_files = set()
+      for image in forci_scene_index.get_index().used_images():
+         if image.filepath:
+            used_texture_files.add(self.abspath(image.filepath))
+      return used_texture_files
+
+   def rename_texture(self, texture_path, destination_folder, content_hash=None):
+      base_name = os.path.basename(texture_path)
+      texture_extension = os.path.splitext(base_name)[1]
+      allocator = self.name_allocator
+
+      # Une texture déjà renommée garde son nom, même si le dossier a changé depuis
+      new_texture_name = self.manifest.generic_name(texture_path, content_hash)
+      if new_texture_name is None:
+         # Le premier fichier garde le nom sans numéro, les suivants prennent <dossier>_<n>
+         new_texture_name = f"{allocator.prefix}_{texture_extension}"
+         if not allocator.claim(new_texture_name):
+            new_texture_name = allocator.allocate(texture_extension)
+      self.manifest.assign(texture_path, content_hash, new_texture_name)
+
+      new_texture_path = os.path.join(destination_folder, new_texture_name)
+      if self.manifest.needs_copy(texture_path, new_texture_name):
+         self.copy_plan.append((texture_path, new_texture_path))
+      else:
+         self.already_copied.append(texture_path)
+
+      return new_texture_path
+
+   def update_texture_node(self, context, material, principled_node, new_texture):
+      principled_node.inputs['Base Color'].links[0].from_node.image = new_texture
+      forci_scene_index.get_index().mark_dirty(material)
+
+class ForciTextureReplacerOperator(forci_lazy.OperatorImplementation):
+   """Automatically replace textures connected to Principled BSDF Materials"""
+
+   @forci_profiler.profiled
+   def execute(self, context):
+      scene = context.scene
+      replace_source_folder = scene.forcica_texture_renamer_props.replace_source_folder
+      old_prefix = scene.forcica_texture_renamer_props.old_prefix
+      new_prefix = scene.forcica_texture_renamer_props.new_prefix
+
+      for material in bpy.data.materials:
+         if material.use_nodes:
+               for node in material.node_tree.nodes:
+                  if node.type == 'BSDF_PRINCIPLED' and node.inputs.get('Base Color') and node.inputs['Base Color'].is_linked:
+                     texture_node = node.inputs['Base Color'].links[0].from_node
+                     if texture_node.type == 'TEX_IMAGE':
+                           old_texture_path = bpy.path.abspath(texture_node.image.filepath)
+                           if old_prefix in old_texture_path:
+                              new_texture_path = old_texture_path.replace(old_prefix, new_prefix)
+                              if os.path.isfile(new_texture_path):
+                                 self.update_texture_node(context, material, node, new_texture_path)
+                              else:
+                                 self.report({'ERROR'}, f"New texture file not found: {new_texture_path}")
+
+      self.report({'INFO'}, "Textures replaced successfully")
+      return {'FINISHED'}
+
+   def update_texture_node(self, context, material, principled_node, new_texture_path):
+      new_texture = forci_image_pool.load(new_texture_path)
+      for node in material.node_tree.nodes:
+         if node.type == 'TEX_IMAGE' and node.image and node.image.filepath == principled_node.inputs['Base Color'].links[0].from_node.image.filepath:
+               node.image = new_texture
+
+class ForciMaterialMergerOperator(forci_lazy.OperatorImplementation):
+   """Merge material duplicates into the original one"""
+
+   @forci_profiler.profiled
+   def execute(self, context):
+      started = time.perf_counter()
+
+      # Regrouper les matériaux par nom de base, en retirant toute la chaîne de suffixes .001, .001.002, etc.
+      groups = {}
+      for mat in bpy.data.materials:
+         if mat.library is None:
+            groups.setdefault(duplicate_suffix_regex.sub('', mat.name), []).append(mat)
+
+      duplicates = []
+      merged_groups = 0
+      for base_name, materials in groups.items():
+         original_mat = next((m for m in materials if m.name == base_name), None)
+         if original_mat is None or len(materials) < 2:
+            continue
+         merged_groups += 1
+         for mat in materials:
+            if mat is not original_mat:
+               # Remplace toutes les utilisations : slots d'objets, données de mesh, node groups...
+               mat.user_remap(original_mat)
+               duplicates.append(mat)
+
+      # Une seule suppression groupée au lieu d'un remove par matériau
+      bpy.data.batch_remove(duplicates)
+
+      elapsed = time.perf_counter() - started
+      self.report({'INFO'}, f"Materials merged successfully: {len(duplicates)} duplicates into {merged_groups} materials in {elapsed:.2f}s")
+      return {'FINISHED'}
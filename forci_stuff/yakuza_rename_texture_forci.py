@@ -0,0 +1,110 @@
+import bpy
+import os
+import shutil
+from . import forci_profiler
+from . import forci_image_pool
+from . import forci_lazy
+
+# Only loaded when the operator runs, not when the add-on is enabled
+forci_name_allocator = forci_lazy.lazy_import(".forci_name_allocator", __package__)
+forci_copy_engine = forci_lazy.lazy_import(".forci_copy_engine", __package__)
+forci_texture_hash = forci_lazy.lazy_import(".forci_texture_hash", __package__)
+forci_texture_lookup = forci_lazy.lazy_import(".forci_texture_lookup", __package__)
+forci_manifest = forci_lazy.lazy_import(".forci_manifest", __package__)
+
+class ForciYakuzaTextureV1Handler(forci_lazy.OperatorImplementation):
+   """Handle Yakuza Shader Textures"""
+
+   @forci_profiler.profiled
+   def execute(self, context):
+      source_folder = bpy.context.scene.forci_yakuza_texture_v1_props.source_folder
+      destination_folder = bpy.context.scene.forci_yakuza_texture_v1_props.destination_folder
+
+      if not os.path.exists(destination_folder):
+         os.makedirs(destination_folder)
+      self.name_allocator = forci_name_allocator.GenericNameAllocator(destination_folder)
+      self.hash_cache = forci_texture_hash.cache_for_folder(destination_folder)
+      self.hashed_destinations = {}
+      # One listing of the source folder, the textures are then looked up by name
+      self.source_textures = forci_texture_lookup.TextureDirectory(source_folder)
+
+      # Dictionary to hold base image names and their new paths to avoid duplicates
+      processed_textures = {}
+      self.copy_plan = []
+      self.already_copied = []
+
+      # Names given by an earlier, possibly interrupted, run are taken from the manifest
+      self.manifest = forci_manifest.open_manifest(destination_folder)
+      try:
+         self.manifest.reserve_names(self.name_allocator)
+         for material in bpy.data.materials:
+            forci_profiler.count("materials")
+            if material.use_nodes:
+                  forci_profiler.count("nodes", len(material.node_tree.nodes))
+                  for node in material.node_tree.nodes:
+                     if node.type == 'TEX_IMAGE' and node.image and '_d' in node.image.name:
+                        base_image_name = os.path.splitext(node.image.name)[0]
+                        if base_image_name.endswith('_d') and base_image_name not in processed_textures:
+                              new_path = self.process_texture(node, source_folder, destination_folder, base_image_name)
+                              if new_path:
+                                 processed_textures[base_image_name] = new_path
+
+         self.hash_cache.save()
+         self.manifest.mark_copied(self.already_copied)
+         self.manifest.commit()
+
+         # Copy every planned texture on the worker threads before touching the images
+         failures = forci_copy_engine.copy_files(self.copy_plan, context.window_manager, copy_function=shutil.copy)
+         self.manifest.record_copies(self.copy_plan, failures)
+      finally:
+         self.manifest.close()
+      failed_destinations = {destination for (source, destination), error in failures}
+      for (source, destination), error in failures:
+         self.report({'ERROR'}, f"Could not copy {source} to {destination}: {error}")
+      processed_textures = {name: path for name, path in processed_textures.items() if path not in failed_destinations}
+
+      # Go through the nodes again to assign the new images
+      for material in bpy.data.materials:
+         if material.use_nodes:
+               for node in material.node_tree.nodes:
+                  if node.type == 'TEX_IMAGE' and node.image:
+                     base_image_name = os.path.splitext(node.image.name)[0]
+                     if base_image_name in processed_textures:
+                           node.image = forci_image_pool.load(processed_textures[base_image_name])
+
+      self.report({'INFO'}, "Yakuza Shader Textures Handled")
+      return {'FINISHED'}
+
+   def process_texture(self, node, source_folder, destination_folder, base_image_name):
+      # Any case, .001 suffix or texture extension matches
+      source_texture_path = self.source_textures.find(base_image_name)
+      if source_texture_path is None:
+         self.report({'ERROR'}, f"Texture not found: {os.path.join(source_folder, base_image_name + '.png')}")
+         return None
+
+      # Textures with identical content share one copy
+      content_hash = self.hash_cache.digest(source_texture_path)
+      if content_hash in self.hashed_destinations:
+         return self.hashed_destinations[content_hash]
+
+      # Generate new texture name and path, unless an earlier run already named it
+      generic_name = self.manifest.generic_name(source_texture_path, content_hash)
+      if generic_name is None:
+         extension = os.path.splitext(source_texture_path)[1].lower()
+         generic_name = self.generate_generic_name(destination_folder, base_image_name, extension)
+      self.manifest.assign(source_texture_path, content_hash, generic_name)
+      destination_texture_path = os.path.join(destination_folder, generic_name)
+      if content_hash:
+         self.hashed_destinations[content_hash] = destination_texture_path
+
+      # The copy itself is done in bulk by execute()
+      if not self.manifest.needs_copy(source_texture_path, generic_name):
+         self.already_copied.append(source_texture_path)
+         return destination_texture_path
+      self.copy_plan.append((source_texture_path, destination_texture_path))
+      print(f"Texture will be copied and renamed to: {destination_texture_path}")
+
+      return destination_texture_path
+
+   def generate_generic_name(self, destination_folder, base_image_name, extension=".png"):
+      return self.name_allocator.allocate(extension)
@@ -0,0 +1,224 @@
+import bpy
+import os
+import shutil
+from . import forci_profiler
+from . import forci_image_pool
+from . import forci_lazy
+
+# Only loaded when the operator runs, not when the add-on is enabled
+forci_name_allocator = forci_lazy.lazy_import(".forci_name_allocator", __package__)
+forci_copy_engine = forci_lazy.lazy_import(".forci_copy_engine", __package__)
+forci_texture_hash = forci_lazy.lazy_import(".forci_texture_hash", __package__)
+forci_texture_lookup = forci_lazy.lazy_import(".forci_texture_lookup", __package__)
+forci_manifest = forci_lazy.lazy_import(".forci_manifest", __package__)
+np = forci_lazy.lazy_import("numpy")
+
+class ForciYakuzaTextureHandler(forci_lazy.OperatorImplementation):
+   """Handle Yakuza Shader Textures"""
+
+   def steps(self, context):
+      source_folder = bpy.context.scene.forci_yakuza_texture_props.source_folder
+      destination_folder = bpy.context.scene.forci_yakuza_texture_props.destination_folder
+      used_textures_folder = bpy.context.scene.forci_yakuza_texture_props.used_textures_folder
+
+      if not os.path.exists(destination_folder):
+         os.makedirs(destination_folder)
+      self.name_allocator = forci_name_allocator.GenericNameAllocator(destination_folder)
+      self.hash_cache = forci_texture_hash.cache_for_folder(destination_folder)
+      self.hashed_destinations = {}
+      # One listing of the source folder, the textures are then looked up by name
+      self.source_textures = forci_texture_lookup.TextureDirectory(source_folder)
+      # Cette vérification permet de créer le dossier seulement si le chemin est spécifié
+      if used_textures_folder and not os.path.exists(used_textures_folder):
+         os.makedirs(used_textures_folder)
+
+      # Use either the selected objects or all objects if none are selected
+      # (pris au lancement : le contexte n'est plus valide après la première pause, et seuls
+      # les noms passent les pauses, un undo ou une suppression invalide les objets)
+      selected_names = [obj.name for obj in context.selected_objects]
+
+      # Existing functionality: process and copy textures
+      processed_textures = yield from self.process_textures(source_folder, destination_folder)
+
+      # Collect used textures from the objects to check
+      if selected_names:
+         objects_to_check = [obj for obj in map(bpy.data.objects.get, selected_names) if obj is not None]
+      else:
+         objects_to_check = bpy.data.objects
+      used_textures = self.collect_used_textures(objects_to_check)
+
+      # Copy used textures to the used textures folder only if the folder is specified
+      if used_textures_folder:  # Condition pour vérifier si le chemin est défini
+         used_copy_plan = []
+         processed = forci_texture_lookup.TextureDirectory(destination_folder)
+         already_used = forci_texture_lookup.TextureDirectory(used_textures_folder)
+         for texture_name in used_textures:
+            source_texture_path = processed.find(texture_name)
+            if source_texture_path and texture_name not in already_used:
+                  destination_texture_path = os.path.join(used_textures_folder, os.path.basename(source_texture_path))
+                  used_copy_plan.append((source_texture_path, destination_texture_path))
+         yield "Copying used textures"
+         failures = yield from forci_copy_engine.iter_copy(used_copy_plan, copy_function=shutil.copy)
+         self.report_copy_failures(failures)
+
+      # Clean unused materials from the scene
+      self.clean_unused_materials()
+
+      self.report({'INFO'}, "Textures processed. Used textures copied and unused materials cleaned as necessary.")
+      return {'FINISHED'}
+
+   def process_textures(self, source_folder, destination_folder):
+      """
+      Process all relevant textures found in the source folder, copy them to the destination folder,
+      and update the materials to use the new textures.
+      """
+      yield "Scanning materials"
+      processed_textures = {}
+      self.copy_plan = []
+      self.already_copied = []
+      relink_plan = []
+      # Les noms déjà donnés lors d'un passage précédent (même interrompu) sont repris du manifeste
+      self.manifest = forci_manifest.open_manifest(destination_folder)
+      try:
+         self.manifest.reserve_names(self.name_allocator)
+         # Les matériaux sont retrouvés par leur nom après chaque pause
+         material_names = [material.name for material in bpy.data.materials]
+         for done, material_name in enumerate(material_names, 1):
+            yield done, len(material_names)
+            material = bpy.data.materials.get(material_name)
+            if material is None:
+               continue
+            forci_profiler.count("materials")
+            if material.use_nodes:
+               forci_profiler.count("nodes", len(material.node_tree.nodes))
+               for node in material.node_tree.nodes:
+                     if node.type == 'TEX_IMAGE' and node.image:
+                        base_image_name = os.path.splitext(node.image.name)[0]
+                        if base_image_name not in processed_textures:
+                           # Pass the material to the process_texture function as well
+                           processed_texture_path = self.process_texture(material, node, source_folder, destination_folder, base_image_name)
+                           if processed_texture_path:
+                                 processed_textures[base_image_name] = processed_texture_path
+                                 relink_plan.append((material.name, node.name, processed_texture_path))
+                        else:
+                           # Les autres matériaux qui partagent la texture sont reliés à la même copie.
+                           relink_plan.append((material.name, node.name, processed_textures[base_image_name]))
+
+         self.hash_cache.save()
+         self.manifest.mark_copied(self.already_copied)
+         self.manifest.commit()
+
+         # Toutes les copies d'abord, en parallèle ; les images ne sont reliées qu'ensuite, sur le thread principal.
+         yield "Copying textures"
+         failures = yield from forci_copy_engine.iter_copy(self.copy_plan, copy_function=shutil.copy)
+         self.manifest.record_copies(self.copy_plan, failures)
+      finally:
+         self.manifest.close()
+      self.report_copy_failures(failures)
+      failed_destinations = {destination for (source, destination), error in failures}
+
+      # Tous les relinks d'un coup, sans pause
+      for material_name, node_name, texture_path in relink_plan:
+         material = bpy.data.materials.get(material_name)
+         node = material.node_tree.nodes.get(node_name) if material and material.node_tree else None
+         if node is not None and texture_path not in failed_destinations:
+            self.relink_texture(node, texture_path)
+      return {name: path for name, path in processed_textures.items() if path not in failed_destinations}
+
+   def report_copy_failures(self, failures):
+      for (source, destination), error in failures:
+         self.report({'ERROR'}, f"Could not copy {source} to {destination}: {error}")
+
+   def process_texture(self, material, node, source_folder, destination_folder, base_image_name):
+      # Le chemin source de l'image, quelle que soit sa casse ou son extension.
+      source_texture_path = self.source_textures.find(base_image_name)
+      if source_texture_path is None:
+         self.report({'ERROR'}, f"Texture not found: {os.path.join(source_folder, base_image_name + '.png')}")
+         return None
+
+      # Générer un nom générique pour la nouvelle image et la copier dans le dossier de destination.
+      # Une texture au contenu identique à une texture déjà traitée réutilise sa copie.
+      content_hash = self.hash_cache.digest(source_texture_path)
+      if content_hash in self.hashed_destinations:
+         return self.hashed_destinations[content_hash]
+
+      # Une texture déjà traitée par un passage précédent garde son nom
+      generic_name = self.manifest.generic_name(source_texture_path, content_hash)
+      if generic_name is None:
+         extension = os.path.splitext(source_texture_path)[1].lower()
+         generic_name = self.generate_generic_name(destination_folder, base_image_name, extension)
+      self.manifest.assign(source_texture_path, content_hash, generic_name)
+      destination_texture_path = os.path.join(destination_folder, generic_name)
+      if content_hash:
+         self.hashed_destinations[content_hash] = destination_texture_path
+      if self.manifest.needs_copy(source_texture_path, generic_name):
+         self.copy_plan.append((source_texture_path, destination_texture_path))
+      else:
+         self.already_copied.append(source_texture_path)
+      return destination_texture_path
+
+   def relink_texture(self, node, destination_texture_path):
+      # L'image vient du pool partagé : un fichier n'est chargé qu'une fois, quel que soit le nombre de matériaux.
+      # Seule l'image du node existant change : ses liens (diffuse, normal, specular...) restent tels quels.
+      node.image = forci_image_pool.load(destination_texture_path)
+
+   def generate_generic_name(self, destination_folder, base_image_name, extension=".png"):
+      return self.name_allocator.allocate(extension)
+
+   def collect_used_textures(self, objects):
+      """
+      Collect the names of the textures used by materials that are assigned to at least one face.
+      Face usage per slot is read with foreach_get + bincount, without mode switching or selection.
+      """
+      used_textures = set()
+      material_textures = {}
+      mesh_face_counts = {}
+
+      for obj in objects:
+         forci_profiler.count("objects")
+         if obj.type != 'MESH' or not obj.material_slots:
+            continue
+
+         mesh = obj.data
+         slot_count = len(obj.material_slots)
+         face_counts = mesh_face_counts.get((mesh, slot_count))
+         if face_counts is None:
+            if obj.mode == 'EDIT':
+               # The mesh data is only synced with the edit mesh on request
+               obj.update_from_editmode()
+            material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("material_index", material_indices)
+            # Blender clamps out of range indices to the last slot
+            np.minimum(material_indices, slot_count - 1, out=material_indices)
+            face_counts = np.bincount(material_indices, minlength=slot_count)
+            mesh_face_counts[(mesh, slot_count)] = face_counts
+
+         for slot_index, mat_slot in enumerate(obj.material_slots):
+            mat = mat_slot.material
+            if not mat or not mat.use_nodes or not face_counts[slot_index]:
+               continue
+            textures = material_textures.get(mat)
+            if textures is None:
+               textures = material_textures[mat] = self.material_texture_names(mat)
+            used_textures.update(textures)
+
+      return used_textures
+
+   def material_texture_names(self, material):
+      names = set()
+      for node in material.node_tree.nodes:
+         if node.type == 'TEX_IMAGE' and node.image:
+            texture_path = bpy.path.abspath(node.image.filepath)
+            names.add(os.path.splitext(os.path.basename(texture_path))[0])
+      return names
+
+   def clean_unused_materials(self):
+      for material in bpy.data.materials:
+         if material.users == 0:
+               bpy.data.materials.remove(material)
+
+   def copy_texture(self, texture_name, source_folder, destination_folder):
+      source_path = os.path.join(source_folder, texture_name)
+      destination_path = os.path.join(destination_folder, texture_name)
+      if os.path.isfile(source_path) and not os.path.isfile(destination_path):
+         shutil.copy2(source_path, destination_path)